@@ -1,3 +1,7 @@
+from .cache import CachePolicy, DiskCache, MemoryCache, ResponseCache
 from .const import __version__, __tag__
+from .metrics import MetricsRegistry
 from .reddit import Reddit
 from .request_handler import RequestHandler
+from .retry import RetryError, RetryPolicy
+from .utils import Priority, priority
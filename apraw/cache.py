@@ -0,0 +1,375 @@
+"""Response caching for idempotent GET requests."""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .endpoints import endpoint_subreddits, match_endpoint
+
+
+class CachePolicy:
+    """
+    The caching policy of an endpoint.
+
+    Members
+    -------
+    ttl: float
+        The number of seconds a response is served from the cache without revalidation.
+    stale_ttl: float
+        The number of seconds after ``ttl`` in which a stale response is served while it's refreshed in the background.
+    negative_ttl: float
+        The number of seconds a 404 response is cached for, ``0`` to not cache them.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, negative_ttl: float = 0):
+        """
+        Create an instance of ``CachePolicy``.
+
+        Parameters
+        ----------
+        ttl: float
+            The number of seconds a response is served from the cache without revalidation.
+        stale_ttl: float
+            The number of seconds after ``ttl`` in which a stale response is served while it's refreshed in the
+            background.
+        negative_ttl: float
+            The number of seconds a 404 response is cached for, ``0`` to not cache them.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+
+    def __repr__(self):
+        return f"<CachePolicy ttl={self.ttl} stale_ttl={self.stale_ttl} negative_ttl={self.negative_ttl}>"
+
+
+#: The default policies by ``API_PATH`` key, used for metadata that rarely changes.
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    "subreddit_about": CachePolicy(300, 3600, 60),
+    "subreddit_moderators": CachePolicy(300, 3600),
+    "subreddit_removal_reasons": CachePolicy(300, 3600),
+    "subreddit_settings": CachePolicy(60, 600),
+    "user_about": CachePolicy(300, 3600, 60),
+    "wiki": CachePolicy(120, 600),
+    "wiki_page": CachePolicy(120, 600, 60),
+}
+
+
+class CacheEntry:
+    """
+    A cached response.
+
+    Members
+    -------
+    body: str
+        The JSON encoded response body.
+    status: int
+        The HTTP status of the response.
+    expires: float
+        The ``time.time()`` timestamp after which the entry is stale.
+    stale_until: float
+        The ``time.time()`` timestamp after which the entry can no longer be served.
+    created: float
+        The ``time.time()`` timestamp at which the request for this entry was started.
+    """
+
+    def __init__(self, body: str, status: int, expires: float, stale_until: float, created: float = 0):
+        self.body = body
+        self.status = status
+        self.expires = expires
+        self.stale_until = stale_until
+        self.created = created
+
+    @property
+    def value(self) -> Any:
+        """
+        Decode the response body, returning a new copy every time so callers can't modify the cached data.
+
+        Returns
+        -------
+        value: Any
+            The decoded response body.
+        """
+        return json.loads(self.body)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"body": self.body, "status": self.status, "expires": self.expires, "stale_until": self.stale_until,
+                "created": self.created}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CacheEntry':
+        return cls(data["body"], data["status"], data["expires"], data["stale_until"], data.get("created", 0))
+
+
+class CacheBackend:
+    """
+    The base class for response cache storage. Subclasses need to implement ``get``, ``set``, ``delete`` and
+    ``clear``.
+    """
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    An in-memory cache backend that evicts the least recently used entries once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """
+    An on-disk cache backend storing each entry as a JSON file, so cached responses survive restarts.
+
+    The least recently used entries are evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(path, exist_ok=True)
+        self._count = len(self._files())
+
+    def _files(self):
+        return [os.path.join(self.path, f) for f in os.listdir(self.path) if f.endswith(".json")]
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        file = self._file(key)
+        try:
+            with open(file) as f:
+                entry = CacheEntry.from_dict(json.load(f))
+            os.utime(file)
+            return entry
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry):
+        file = self._file(key)
+        if not os.path.exists(file):
+            self._count += 1
+
+        with open(file + ".tmp", "w") as f:
+            json.dump(entry.to_dict(), f)
+        os.replace(file + ".tmp", file)
+
+        if self._count > self.max_entries:
+            files = sorted(self._files(), key=os.path.getmtime)
+            for f in files[:len(files) - self.max_entries]:
+                os.remove(f)
+            self._count = min(len(files), self.max_entries)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._file(key))
+            self._count -= 1
+        except OSError:
+            pass
+
+    def clear(self):
+        for f in self._files():
+            os.remove(f)
+        self._count = 0
+
+
+class ResponseCache:
+    """
+    A cache for idempotent GET requests with per-endpoint policies.
+
+    Responses are cached by their URL and the policy is chosen by the ``API_PATH`` template the endpoint was built from.
+    Fresh responses are served without a request, stale ones are served while they're refreshed in the background,
+    and 404 responses can be cached for a shorter time so lookups of missing subreddits and users don't keep spending
+    the ratelimit. A write to a subreddit, such as a wiki edit, outdates all the responses cached for that subreddit
+    so the next read sees the change.
+
+    .. code-block:: python3
+
+        cache = ResponseCache(policies={"subreddit_about": CachePolicy(ttl=600, stale_ttl=3600)})
+        reddit = apraw.Reddit(praw_key="...", response_cache=cache)
+
+    Members
+    -------
+    backend: CacheBackend
+        The storage used for cached responses.
+    policies: Dict[str, CachePolicy]
+        The policies by ``API_PATH`` key. Endpoints without a policy aren't cached.
+    hits: int
+        The number of requests served from the cache.
+    misses: int
+        The number of requests that were made because no usable response was cached.
+    """
+
+    def __init__(self, backend: CacheBackend = None, policies: Dict[str, CachePolicy] = None):
+        """
+        Create an instance of ``ResponseCache``.
+
+        Parameters
+        ----------
+        backend: CacheBackend
+            The storage used for cached responses, defaults to a :class:`MemoryCache`.
+        policies: Dict[str, CachePolicy]
+            Policies by ``API_PATH`` key, which are merged into the :data:`DEFAULT_POLICIES`.
+        """
+        self.backend = backend if backend is not None else MemoryCache()
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.hits = 0
+        self.misses = 0
+
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self._writes: Dict[str, float] = {}
+
+    def policy(self, endpoint: str) -> Optional[CachePolicy]:
+        """
+        Retrieve the policy for an endpoint.
+
+        Parameters
+        ----------
+        endpoint: str
+            The formatted endpoint such as ``/r/aPRAWTest/about``.
+
+        Returns
+        -------
+        policy: CachePolicy or None
+            The endpoint's policy, ``None`` if it isn't cached.
+        """
+        name = match_endpoint(endpoint)
+        return self.policies.get(name) if name else None
+
+    def _store(self, key: str, policy: CachePolicy, status: int, value: Any, created: float = None):
+        ttl = policy.negative_ttl if status == 404 else policy.ttl if status == 200 else 0
+        if ttl <= 0:
+            return
+        now = time.time()
+        created = now if created is None else created
+        stale_ttl = policy.stale_ttl if status == 200 else 0
+        self.backend.set(key, CacheEntry(json.dumps(value), status, now + ttl, now + ttl + stale_ttl, created))
+
+    async def _fetch(self, key: str, policy: CachePolicy, fetch: Callable[[], Awaitable[Tuple[int, Any]]]) -> Any:
+        # the start time is recorded, so a response requested before a concurrent write is already outdated
+        created = time.time()
+        status, value = await fetch()
+        self._store(key, policy, status, value, created)
+        return value
+
+    def _outdated(self, endpoint: str, entry: CacheEntry) -> bool:
+        return any(entry.created <= self._writes.get(sub, -1) for sub in endpoint_subreddits(endpoint))
+
+    def _revalidate(self, key: str, policy: CachePolicy, fetch: Callable[[], Awaitable[Tuple[int, Any]]]):
+        # only one background refresh per key is in flight, failures keep serving the stale response
+        if key in self._refreshing:
+            return
+
+        def done(f: asyncio.Future):
+            self._refreshing.pop(key, None)
+            f.cancelled() or f.exception()
+
+        future = asyncio.ensure_future(self._fetch(key, policy, fetch))
+        future.add_done_callback(done)
+        self._refreshing[key] = future
+
+    async def get(self, endpoint: str, key: str, fetch: Callable[[], Awaitable[Tuple[int, Any]]]) -> Any:
+        """
+        Serve a request from the cache or by calling ``fetch``.
+
+        Parameters
+        ----------
+        endpoint: str
+            The formatted endpoint used to select the policy.
+        key: str
+            The cache key, usually the request URL.
+        fetch: Callable[[], Awaitable[Tuple[int, Any]]]
+            A coroutine function performing the request and returning the HTTP status and decoded body.
+
+        Returns
+        -------
+        value: Any
+            The decoded response body.
+        """
+        policy = self.policy(endpoint)
+        if policy is None:
+            return (await fetch())[1]
+
+        entry = self.backend.get(key)
+        if entry is not None and self._outdated(endpoint, entry):
+            self.backend.delete(key)
+            entry = None
+        now = time.time()
+
+        if entry is not None and now < entry.expires:
+            self.hits += 1
+            return entry.value
+
+        if entry is not None and now < entry.stale_until:
+            self.hits += 1
+            self._revalidate(key, policy, fetch)
+            return entry.value
+
+        self.misses += 1
+        return await self._fetch(key, policy, fetch)
+
+    def invalidate(self, key: str):
+        """
+        Remove a cached response.
+
+        Parameters
+        ----------
+        key: str
+            The cache key, usually the request URL.
+        """
+        self.backend.delete(key)
+
+    def invalidate_subreddit(self, subreddit: str):
+        """
+        Outdate all the responses cached for a subreddit, for example after its wiki or settings were changed.
+
+        Parameters
+        ----------
+        subreddit: str
+            The subreddit's display name.
+        """
+        self._writes[subreddit.lower()] = time.time()
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        self.backend.clear()
@@ -1,5 +1,7 @@
 """List of Reddit API endpoints known to aPRAW."""
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 BASE_URL = "https://oauth.reddit.com{}?{}"
 
@@ -79,3 +81,78 @@ API_PATH: Dict[str, str] = {
     "wiki_revisions"              : "/r/{sub}/wiki/revisions",
     "submit"                      : "/api/submit",
 }
+
+#: The ``API_PATH`` keys of read-only listings whose responses don't depend on the authenticated account. Metadata
+#: such as ``subreddit_about`` or ``info`` isn't included, since it carries per-account fields like
+#: ``user_is_moderator`` and private subreddits are only visible to their members.
+PUBLIC_ENDPOINTS: FrozenSet[str] = frozenset({
+    "subreddit", "subreddit_comments", "subreddit_hot", "subreddit_new", "subreddit_rising", "subreddit_top",
+    "subreddits_new", "user_comments", "user_submissions",
+})
+
+#: The ``API_PATH`` keys of moderator actions, which are sent with :attr:`~apraw.utils.Priority.HIGH` priority.
+MODERATION_ENDPOINTS: FrozenSet[str] = frozenset({
+    "mod_approve", "mod_distinguish", "mod_ignore_reports", "mod_lock", "mod_remove", "mod_show_comment",
+    "mod_sticky", "mod_unignore_reports", "mod_unlock", "modmail_conversation_action", "removal_comment_message",
+    "removal_link_message", "removal_reasons", "sub_friend", "sub_unfriend",
+})
+
+
+def _compile(template: str) -> Pattern:
+    # placeholders become named groups, so parameters such as the subreddit can be read from a formatted endpoint
+    parts = re.split(r"{(\w+)}", template)
+    regex = "".join(f"(?P<{p}>[^/]+)" if i % 2 else re.escape(p) for i, p in enumerate(parts))
+    return re.compile("^" + regex + "/?$", re.IGNORECASE)
+
+
+# templates with more literal characters are matched first, so "/r/{sub}/wiki/pages" wins over "/r/{sub}/wiki/{page}"
+_TEMPLATES: List[Tuple[str, Pattern]] = sorted(
+    ((name, _compile(template)) for name, template in API_PATH.items()),
+    key=lambda t: len(re.sub(r"{\w+}", "", API_PATH[t[0]])), reverse=True)
+
+
+@lru_cache(maxsize=4096)
+def match_endpoint(path: str) -> Optional[str]:
+    """
+    Find the ``API_PATH`` key whose template a formatted endpoint was built from.
+
+    Parameters
+    ----------
+    path: str
+        A formatted endpoint such as ``/r/aPRAWTest/about``, optionally followed by a query string.
+
+    Returns
+    -------
+    name: str or None
+        The ``API_PATH`` key such as ``subreddit_about``, ``None`` if no template matches.
+    """
+    path = path.split("?", 1)[0]
+    for name, pattern in _TEMPLATES:
+        if pattern.match(path):
+            return name
+    return None
+
+
+@lru_cache(maxsize=4096)
+def endpoint_subreddits(path: str) -> Tuple[str, ...]:
+    """
+    Find the subreddits a formatted endpoint belongs to.
+
+    Parameters
+    ----------
+    path: str
+        A formatted endpoint such as ``/r/aPRAWTest/about``, optionally followed by a query string.
+
+    Returns
+    -------
+    subreddits: Tuple[str]
+        The lowercase names of the subreddits in the endpoint's ``{sub}`` parameter, several for endpoints like
+        ``/r/a+b/new``, and an empty tuple if the endpoint doesn't belong to a subreddit.
+    """
+    path = path.split("?", 1)[0]
+    for _, pattern in _TEMPLATES:
+        match = pattern.match(path)
+        if match:
+            sub = match.groupdict().get("sub")
+            return tuple(sub.lower().split("+")) if sub else ()
+    return ()
@@ -0,0 +1,401 @@
+"""Request metrics with Prometheus text export."""
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .endpoints import match_endpoint
+
+#: The default latency buckets in seconds.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+#: The default response size buckets in bytes.
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """
+    A histogram counting observations into cumulative buckets like a Prometheus histogram.
+
+    Members
+    -------
+    buckets: Tuple[float]
+        The upper bounds of the buckets in ascending order.
+    counts: List[int]
+        The number of observations per bucket, the last entry counts observations above the largest bound.
+    sum: float
+        The sum of all the observations.
+    count: int
+        The number of observations.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Create an instance of ``Histogram``.
+
+        Parameters
+        ----------
+        buckets: Sequence[float]
+            The upper bounds of the buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """
+        Record an observation.
+
+        Parameters
+        ----------
+        value: float
+            The observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Retrieve the cumulative bucket counts.
+
+        Returns
+        -------
+        buckets: List[Tuple[float, int]]
+            The upper bound of each bucket, ending with infinity, and the number of observations up to it.
+        """
+        total = 0
+        cumulative = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export this histogram as plain Python data.
+
+        Returns
+        -------
+        snapshot: Dict
+            The cumulative ``buckets``, ``sum`` and ``count``.
+        """
+        return {"buckets": self.cumulative(), "sum": self.sum, "count": self.count}
+
+
+class EndpointMetrics:
+    """
+    The metrics of the requests made to a single endpoint with one HTTP method.
+
+    Members
+    -------
+    statuses: Counter
+        The number of responses by status code, or ``"error"`` for requests that raised an exception.
+    latency: Histogram
+        The time spent waiting for responses in seconds, excluding the time waiting for the ratelimiter.
+    size: Histogram
+        The size of the response bodies in bytes.
+    retries: int
+        The number of times requests were retried.
+    ratelimit_wait: float
+        The total number of seconds requests waited for the ratelimiter.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]):
+        self.statuses = Counter()
+        self.latency = Histogram(latency_buckets)
+        self.size = Histogram(size_buckets)
+        self.retries = 0
+        self.ratelimit_wait = 0.0
+
+    @property
+    def requests(self) -> int:
+        """
+        Get the number of requests made to this endpoint.
+
+        Returns
+        -------
+        requests: int
+            The number of requests including failed ones.
+        """
+        return sum(self.statuses.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export these metrics as plain Python data.
+
+        Returns
+        -------
+        snapshot: Dict
+            The request and byte counts, statuses, histograms, retries and ratelimit wait time.
+        """
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency": self.latency.snapshot(),
+            "size": self.size.snapshot(),
+            "bytes": int(self.size.sum),
+            "retries": self.retries,
+            "ratelimit_wait": self.ratelimit_wait,
+        }
+
+
+class BudgetSample:
+    """
+    The ratelimit budget reported by Reddit at a point in time.
+
+    Members
+    -------
+    timestamp: float
+        The UNIX timestamp of the response.
+    user: str
+        The username the budget belongs to.
+    remaining: float
+        The number of requests remaining in the window.
+    used: int
+        The number of requests used in the window.
+    reset: float
+        The number of seconds until the window resets.
+    """
+
+    __slots__ = ("timestamp", "user", "remaining", "used", "reset")
+
+    def __init__(self, timestamp: float, user: str, remaining: float, used: Optional[int], reset: Optional[float]):
+        self.timestamp = timestamp
+        self.user = user
+        self.remaining = remaining
+        self.used = used
+        self.reset = reset
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export this sample as plain Python data.
+
+        Returns
+        -------
+        snapshot: Dict
+            The sample's members.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MetricsRegistry:
+    """
+    A registry of the metrics recorded by the :class:`~apraw.RequestHandler`.
+
+    Requests are grouped by the ``API_PATH`` template they were made to, such as ``subreddit_new``, and their HTTP
+    method, so the metrics show which endpoints use up the ratelimit budget and where latency comes from. Requests to
+    endpoints that aren't in ``API_PATH`` are grouped as ``other``. The metrics can be exported in the Prometheus text
+    format with :meth:`prometheus` or as plain Python data with :meth:`snapshot`.
+
+    .. code-block:: python3
+
+        reddit = apraw.Reddit(praw_key="...")
+        ...
+        print(reddit.metrics.prometheus())
+
+    Members
+    -------
+    endpoints: Dict[Tuple[str, str], EndpointMetrics]
+        The metrics by endpoint name and HTTP method.
+    budget: Deque[BudgetSample]
+        The most recent ratelimit budgets reported by Reddit.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS, size_buckets: Sequence[float] = SIZE_BUCKETS,
+                 history: int = 1000):
+        """
+        Create an instance of ``MetricsRegistry``.
+
+        Parameters
+        ----------
+        latency_buckets: Sequence[float]
+            The upper bounds of the latency histogram buckets in seconds.
+        size_buckets: Sequence[float]
+            The upper bounds of the response size histogram buckets in bytes.
+        history: int
+            The number of ratelimit budget samples to keep.
+        """
+        self._latency_buckets = latency_buckets
+        self._size_buckets = size_buckets
+        self.endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self.budget: Deque[BudgetSample] = deque(maxlen=history)
+
+    @staticmethod
+    def endpoint_name(url: str) -> str:
+        """
+        Determine the name requests to a URL are grouped by.
+
+        Parameters
+        ----------
+        url: str
+            The full URL or path of the request.
+
+        Returns
+        -------
+        name: str
+            The ``API_PATH`` key of the endpoint, ``"other"`` if it isn't known.
+        """
+        return match_endpoint(urlsplit(url).path) or "other"
+
+    def endpoint(self, url: str, method: str) -> EndpointMetrics:
+        """
+        Retrieve the metrics of the endpoint a URL belongs to, creating them if necessary.
+
+        Parameters
+        ----------
+        url: str
+            The full URL or path of the request.
+        method: str
+            The HTTP method of the request.
+
+        Returns
+        -------
+        metrics: EndpointMetrics
+            The metrics of the endpoint.
+        """
+        key = (self.endpoint_name(url), method.upper())
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointMetrics(self._latency_buckets, self._size_buckets)
+        return self.endpoints[key]
+
+    def observe_request(self, url: str, method: str, status: Optional[int], latency: float, size: int = 0,
+                        ratelimit_wait: float = 0):
+        """
+        Record a completed request.
+
+        Parameters
+        ----------
+        url: str
+            The full URL or path of the request.
+        method: str
+            The HTTP method of the request.
+        status: int
+            The HTTP status of the response, ``None`` if the request raised an exception.
+        latency: float
+            The number of seconds until the response was received.
+        size: int
+            The size of the response body in bytes.
+        ratelimit_wait: float
+            The number of seconds the request waited for the ratelimiter.
+        """
+        metrics = self.endpoint(url, method)
+        metrics.statuses[status if status is not None else "error"] += 1
+        metrics.latency.observe(latency)
+        if status is not None:
+            metrics.size.observe(size)
+        metrics.ratelimit_wait += ratelimit_wait
+
+    def observe_retries(self, url: str, method: str, retries: int):
+        """
+        Record the retries of a request.
+
+        Parameters
+        ----------
+        url: str
+            The full URL or path of the request.
+        method: str
+            The HTTP method of the request.
+        retries: int
+            The number of times the request was retried.
+        """
+        if retries > 0:
+            self.endpoint(url, method).retries += retries
+
+    def observe_budget(self, user: str, remaining: float, used: int = None, reset: float = None):
+        """
+        Record the ratelimit budget reported by Reddit.
+
+        Parameters
+        ----------
+        user: str
+            The username the budget belongs to.
+        remaining: float
+            The value of the ``x-ratelimit-remaining`` header.
+        used: int
+            The value of the ``x-ratelimit-used`` header if available.
+        reset: float
+            The value of the ``x-ratelimit-reset`` header if available.
+        """
+        self.budget.append(BudgetSample(time.time(), user, remaining, used, reset))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export the metrics as plain Python data.
+
+        Returns
+        -------
+        snapshot: Dict
+            The metrics under ``endpoints``, keyed by ``"METHOD endpoint"``, and the budget history under ``budget``.
+        """
+        return {
+            "endpoints": {f"{method} {name}": metrics.snapshot()
+                          for (name, method), metrics in sorted(self.endpoints.items())},
+            "budget": [sample.snapshot() for sample in self.budget],
+        }
+
+    def prometheus(self, prefix: str = "apraw") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix of the metric names.
+
+        Returns
+        -------
+        text: str
+            The metrics in the Prometheus text format.
+        """
+        lines = []
+
+        def metric(name: str, type: str, help: str):
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {type}")
+
+        def histogram(name: str, labels: str, hist: Histogram):
+            for bound, count in hist.cumulative():
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{prefix}_{name}_sum{{{labels}}} {hist.sum:g}")
+            lines.append(f"{prefix}_{name}_count{{{labels}}} {hist.count}")
+
+        endpoints = sorted(self.endpoints.items())
+        labels = {key: f'endpoint="{key[0]}",method="{key[1]}"' for key, _ in endpoints}
+
+        metric("requests_total", "counter", "Requests by endpoint, method and status.")
+        for key, metrics in endpoints:
+            for status, count in sorted(metrics.statuses.items(), key=lambda s: str(s[0])):
+                lines.append(f'{prefix}_requests_total{{{labels[key]},status="{status}"}} {count}')
+
+        metric("request_duration_seconds", "histogram", "Time until the response was received.")
+        for key, metrics in endpoints:
+            histogram("request_duration_seconds", labels[key], metrics.latency)
+
+        metric("response_size_bytes", "histogram", "Size of the response bodies.")
+        for key, metrics in endpoints:
+            histogram("response_size_bytes", labels[key], metrics.size)
+
+        metric("retries_total", "counter", "Retried requests.")
+        for key, metrics in endpoints:
+            lines.append(f"{prefix}_retries_total{{{labels[key]}}} {metrics.retries}")
+
+        metric("ratelimit_wait_seconds_total", "counter", "Time spent waiting for the ratelimiter.")
+        for key, metrics in endpoints:
+            lines.append(f"{prefix}_ratelimit_wait_seconds_total{{{labels[key]}}} {metrics.ratelimit_wait:g}")
+
+        latest: Dict[str, BudgetSample] = {sample.user: sample for sample in self.budget}
+        metric("ratelimit_remaining", "gauge", "Requests remaining in the current ratelimit window.")
+        for user, sample in sorted(latest.items()):
+            lines.append(f'{prefix}_ratelimit_remaining{{user="{user}"}} {sample.remaining:g}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """
+        Discard all the recorded metrics.
+        """
+        self.endpoints.clear()
+        self.budget.clear()
@@ -1,8 +1,13 @@
 from .enums.distinguishment_option import DistinguishmentOption
 from .helpers.apraw_base import aPRAWBase
+from .helpers.bulk_moderation import BulkModeration, BulkReport, BulkResult
 from .helpers.comment_forest import CommentForest
+from .helpers.comment_index import CommentIndex
 from .helpers.generator import ListingGenerator
+from .helpers.info_loader import InfoLoader
+from .helpers.info_lookup import InfoLookup, InfoResult
 from .helpers.item_moderation import ItemModeration, PostModeration
+from .helpers.stream_scheduler import StreamScheduler, StreamStats
 from .helpers.streamable import Streamable, streamable
 from .reddit.comment import Comment, CommentModeration
 from .reddit.listing import Listing
@@ -11,9 +16,10 @@ from .reddit.more_comments import MoreComments
 from .reddit.redditor import Redditor
 from .reddit.submission import Submission, SubmissionModeration
 from .subreddit.banned import BannedUser, BannedListing, SubredditBanned
+from .subreddit.multi_stream import MultiSubredditStream
 from .subreddit.moderation import ModAction, SubredditModerator, SubredditModeration
 from .subreddit.modmail import ModmailConversation, ModmailMessage, SubredditModmail
-from .subreddit.removal_reasons import SubredditRemovalReason, SubredditRemovalReasons
+from .subreddit.removal_reasons import RemovalReasonCache, SubredditRemovalReason, SubredditRemovalReasons
 from .subreddit.settings import SubredditSettings
 from .subreddit.subreddit import Subreddit
 from .subreddit.wiki import WikipageRevision, SubredditWiki, SubredditWikipage
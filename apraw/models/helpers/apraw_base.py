@@ -1,11 +1,36 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Type
 
 from ...utils import prepend_kind, snake_case_keys
+from ...utils.snake import snake_key_map
 
 if TYPE_CHECKING:
     from ...reddit import Reddit
 
+_class_attributes: Dict[Type, FrozenSet[str]] = {}
+
+
+def class_attributes(cls: Type) -> FrozenSet[str]:
+    """
+    Retrieve the names of all the attributes defined on a class and its bases.
+
+    The names are computed once per class so models don't need to probe every key in the API data with ``hasattr``.
+
+    Parameters
+    ----------
+    cls: Type
+        The class to retrieve the attribute names for.
+
+    Returns
+    -------
+    attributes: FrozenSet[str]
+        The attribute names defined on the class.
+    """
+    try:
+        return _class_attributes[cls]
+    except KeyError:
+        return _class_attributes.setdefault(cls, frozenset(dir(cls)))
+
 
 class aPRAWBase:
     """
@@ -14,6 +39,10 @@ class aPRAWBase:
     The ``aPRAWBase`` class stores data retrieved by the endpoints and automatically assigns it as attributes.
     Specific information about the aforementioned attributes can be found in the respective implementations such as :class:`~apraw.models.Comment`.
 
+    If the :class:`~apraw.Reddit` instance was created with ``compact_models=True`` the data is not copied onto the
+    instance. Attributes are instead resolved lazily from the raw data, which roughly halves the memory used per
+    model. ReactivePy change callbacks on :class:`~apraw.models.Comment` aren't triggered for compact models.
+
     Members
     -------
     kind: str
@@ -52,16 +81,67 @@ class aPRAWBase:
         """
         self._data = data
 
-        d = snake_case_keys(data)
-        for key in d:
-            if not hasattr(self, key):
-                self._data_attrs.add(key)
-                setattr(self, key, d[key])
-            elif key in self._data_attrs:
-                setattr(self, key, d[key])
+        if getattr(self._reddit, "compact_models", False):
+            self.__dict__.pop("_snake_keys", None)
+            if "created_utc" in data:
+                self.created_utc = datetime.utcfromtimestamp(data["created_utc"])
+            return
+
+        cls = type(self)
+        reserved = class_attributes(cls)
+        attributes = self.__dict__
+        data_attrs = self._data_attrs
+        updates = {}
+
+        for key, value in snake_case_keys(data).items():
+            if key in data_attrs:
+                updates[key] = value
+            elif key not in reserved and key not in attributes:
+                data_attrs.add(key)
+                updates[key] = value
 
         if "created_utc" in data:
-            self.created_utc = datetime.utcfromtimestamp(data["created_utc"])
+            updates["created_utc"] = datetime.utcfromtimestamp(data["created_utc"])
+
+        if cls.__setattr__ is object.__setattr__:
+            attributes.update(updates)
+        else:
+            for key, value in updates.items():
+                setattr(self, key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Resolve attributes of compact models from their raw data.
+
+        Parameters
+        ----------
+        name: str
+            The attribute's snake_case name.
+
+        Returns
+        -------
+        value: Any
+            The value stored in the raw data.
+
+        Raises
+        ------
+        AttributeError
+            If the model isn't compact or the raw data doesn't contain the attribute.
+        """
+        attributes = self.__dict__
+        data = attributes.get("_data")
+
+        if data and getattr(attributes.get("_reddit"), "compact_models", False):
+            if name in data:
+                return data[name]
+            # the snake_case names of camelCase keys are mapped once per instance, sharing the map by key set
+            keys = attributes.get("_snake_keys")
+            if keys is None:
+                keys = attributes["_snake_keys"] = snake_key_map(tuple(data))
+            if name in keys:
+                return data[keys[name]]
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     async def fetch(self):
         """
@@ -0,0 +1,221 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Iterable, List, Optional, Union
+
+from .apraw_base import aPRAWBase
+from .item_moderation import ItemModeration, PostModeration
+
+if TYPE_CHECKING:
+    from ...reddit import Reddit
+
+BulkItem = Union[aPRAWBase, str]
+BulkAction = Union[str, Callable[[BulkItem], Awaitable[Any]]]
+
+
+class _Fullname:
+    """
+    A stand-in for items that are only known by their fullname, which is all moderation helpers need.
+    """
+
+    def __init__(self, fullname: str):
+        self.fullname = fullname
+
+
+class BulkResult:
+    """
+    The outcome of a moderation action on a single item.
+
+    Members
+    -------
+    item: aPRAWBase or str
+        The item or fullname the action was performed on.
+    result: Any
+        The API response JSON if the action succeeded.
+    error: Exception
+        The exception raised by the action if it failed.
+    """
+
+    def __init__(self, item: BulkItem, result: Any = None, error: Exception = None):
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check whether the action succeeded.
+
+        Returns
+        -------
+        ok: bool
+            ``True`` if the action didn't raise an exception.
+        """
+        return self.error is None
+
+    def __repr__(self):
+        item = self.item if isinstance(self.item, str) else self.item.fullname
+        return f"<BulkResult item={item} ok={self.ok}>"
+
+
+class BulkReport:
+    """
+    The aggregated results of a bulk moderation action.
+
+    Members
+    -------
+    results: List[BulkResult]
+        The results in the order the actions completed.
+    """
+
+    def __init__(self):
+        self.results: List[BulkResult] = []
+
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        """
+        Retrieve the results of the actions that succeeded.
+
+        Returns
+        -------
+        results: List[BulkResult]
+            The successful results.
+        """
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """
+        Retrieve the results of the actions that failed, for example to retry them later.
+
+        Returns
+        -------
+        results: List[BulkResult]
+            The failed results.
+        """
+        return [r for r in self.results if not r.ok]
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __repr__(self):
+        return f"<BulkReport succeeded={len(self.succeeded)} failed={len(self.failed)}>"
+
+
+class BulkModeration:
+    """
+    An executor performing a moderation action on many items with bounded concurrency.
+
+    Items are consumed lazily from a regular or asynchronous iterable, so a stream such as ``subreddit.mod.spam()`` can
+    be cleaned up as it's being listed. Every request acquires its token from the ratelimiter like any other, and
+    moderator actions are sent with :attr:`~apraw.utils.Priority.HIGH` priority. A failing item doesn't abort the
+    others, its exception is recorded in the :class:`BulkReport` instead.
+
+    .. code-block:: python3
+
+        report = await subreddit.mod.bulk(subreddit.mod.spam(limit=None), "remove", spam=True)
+        for result in report.failed:
+            print(result.item, result.error)
+    """
+
+    def __init__(self, reddit: 'Reddit', concurrency: int = 10):
+        """
+        Create an instance of ``BulkModeration``.
+
+        Parameters
+        ----------
+        reddit: Reddit
+            The :class:`~apraw.Reddit` instance with which requests are made.
+        concurrency: int
+            The maximum number of actions in flight at once.
+        """
+        self._reddit = reddit
+        self._concurrency = max(1, concurrency)
+
+    def _perform(self, item: BulkItem, action: BulkAction, *args, **kwargs) -> Awaitable[Any]:
+        if callable(action):
+            return action(item, *args, **kwargs)
+
+        if isinstance(item, str):
+            mod: ItemModeration = PostModeration(self._reddit, _Fullname(item))
+        else:
+            mod = item.mod
+        return getattr(mod, action)(*args, **kwargs)
+
+    async def execute(self, items: Union[Iterable[BulkItem], AsyncIterable[BulkItem]], action: BulkAction, *args,
+                      progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None, **kwargs) -> BulkReport:
+        r"""
+        Perform an action on all the items.
+
+        Parameters
+        ----------
+        items: Iterable or AsyncIterable
+            The comments, submissions or fullnames to moderate.
+        action: str or Callable
+            The name of a method of the items' moderation helper such as ``"remove"``, ``"approve"`` or ``"lock"``,
+            or a coroutine function called with each item.
+        progress: Callable[[BulkResult, BulkReport], Any]
+            A function called with every result and the report so far as the actions complete, may be a coroutine
+            function.
+        args: \*List
+            Positional arguments passed on to the action.
+        kwargs: \*\*Dict
+            Keyword arguments passed on to the action.
+
+        Returns
+        -------
+        report: BulkReport
+            The results of all the actions.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by ``progress``, after which no further items are queued.
+        """
+        report = BulkReport()
+        queue: asyncio.Queue = asyncio.Queue(self._concurrency)
+        callback_errors: List[Exception] = []
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is queue:
+                    return
+                try:
+                    result = BulkResult(item, await self._perform(item, action, *args, **kwargs))
+                except Exception as e:
+                    result = BulkResult(item, error=e)
+                report.results.append(result)
+                if progress is not None and not callback_errors:
+                    try:
+                        resp = progress(result, report)
+                        if asyncio.iscoroutine(resp):
+                            await resp
+                    except Exception as e:
+                        # stop queueing items, but keep the workers draining the queue so the producer can't block
+                        callback_errors.append(e)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self._concurrency)]
+        try:
+            if hasattr(items, "__aiter__"):
+                async for item in items:
+                    if callback_errors:
+                        break
+                    await queue.put(item)
+            else:
+                for item in items:
+                    if callback_errors:
+                        break
+                    await queue.put(item)
+            # the queue itself is used as the sentinel telling workers to stop
+            for _ in workers:
+                await queue.put(queue)
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+
+        if callback_errors:
+            raise callback_errors[0]
+        return report
@@ -1,9 +1,13 @@
-from typing import TYPE_CHECKING, Dict
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
+from .comment_index import CommentIndex
 from ..reddit.comment import Comment
 from ..reddit.listing import Listing
 from ..reddit.more_comments import MoreComments
 from ..subreddit.subreddit import Subreddit
+from ...const import API_PATH
 
 if TYPE_CHECKING:
     from ...reddit import Reddit
@@ -14,31 +18,175 @@ class CommentForest(Listing):
     ``CommentForest`` is an iterable used by :class:`~apraw.models.Comment` and :class:`~apraw.models.Submission`
     containing the replies and comment threads. The items can be iterated over just like any other listing, which could
     contain either :class:`~apraw.models.Comment` or :class:`~apraw.models.MoreComments`.
+
+    Members
+    -------
+    index: CommentIndex
+        A flat :class:`~apraw.models.CommentIndex` over all the comments in this forest for constant-time lookups.
     """
 
     def __init__(self, reddit: 'Reddit', data: Dict, link_id: str, subreddit: Subreddit = None):
-        super().__init__(reddit, data, subreddit, link_id=link_id)
-        self._comments_unfolded = []
+        super().__init__(reddit, data, subreddit=subreddit, link_id=link_id)
+        self._materialized = None
+        self._comment_index = None
+
+    def _models(self) -> List[Union[Comment, MoreComments]]:
+        """
+        Materialize all the items in this forest and store them as its children so they can be modified in place.
+
+        Returns
+        -------
+        items: List[Union[Comment, MoreComments]]
+            The list of models backing this forest.
+        """
+        children = getattr(self, self.CHILD_ATTRIBUTE)
+        if children is not self._materialized:
+            children = [self[i] for i in range(len(self))]
+            setattr(self, self.CHILD_ATTRIBUTE, children)
+            self._materialized = children
+        return children
+
+    @property
+    def index(self) -> CommentIndex:
+        """
+        Retrieve the flat index over all the comments in this forest, building it on first access.
+
+        The index is updated as :meth:`replace_more` retrieves further comments into this forest.
+
+        Returns
+        -------
+        index: CommentIndex
+            The index over the comments in this forest.
+        """
+        if self._comment_index is None:
+            self._comment_index = CommentIndex(self._link_id, self._reddit.comment_kind)
+            for item in self.walk():
+                if isinstance(item, Comment):
+                    self._comment_index.add(item)
+        return self._comment_index
+
+    def walk(self) -> Iterator[Union[Comment, MoreComments]]:
+        """
+        Iterate over all the comments and ``MoreComments`` in this forest and their replies breadth-first.
+
+        Yields
+        ------
+        item: Comment or MoreComments
+            The items in breadth-first order.
+        """
+        queue = deque(self._models())
+        while queue:
+            item = queue.popleft()
+            yield item
+            if isinstance(item, Comment) and isinstance(item.replies, CommentForest):
+                queue.extend(item.replies._models())
+
+    def list(self) -> List[Union[Comment, MoreComments]]:
+        """
+        Retrieve all the comments and ``MoreComments`` in this forest and their replies in breadth-first order.
+
+        Returns
+        -------
+        items: List[Union[Comment, MoreComments]]
+            The items in breadth-first order.
+        """
+        return list(self.walk())
+
+    def _replies(self, comment: Comment) -> 'CommentForest':
+        """
+        Retrieve a comment's replies as a ``CommentForest``, replacing an empty reply list if necessary.
+        """
+        if not isinstance(comment.replies, CommentForest):
+            # bypass ReactivePy, which would wrap the forest in a ReactiveProperty
+            vars(comment)["replies"] = CommentForest(self._reddit, {self.CHILD_ATTRIBUTE: []}, self._link_id,
+                                                     self._subreddit)
+        return comment.replies
+
+    async def _request_children(self, ids: List[str]) -> List[Union[Comment, MoreComments]]:
+        """
+        Request up to 100 children, which may belong to different ``MoreComments``, from the morechildren endpoint.
+        """
+        resp = await self._reddit.get(API_PATH["morechildren"], children=",".join(ids), link_id=self._link_id)
 
-    async def replace_more(self):
+        from ..reddit.listing import MoreChildren
+        children = MoreChildren(self._reddit, resp["json"]["data"], [self._reddit.comment_kind, self._reddit.more_kind],
+                                subreddit=self._subreddit, link_id=self._link_id)
+        return list(children)
+
+    async def replace_more(self, limit: Optional[int] = None, threshold: int = 0,
+                           concurrency: int = 8) -> List[MoreComments]:
         """
-        Replaces all the :class:`~apraw.models.MoreComments` instances with the comments they reference.
+        Replaces the :class:`~apraw.models.MoreComments` instances with the comments they reference.
+
+        This method can be used to retrieve all the comments, and only comments within a forest. The children of all the
+        ``MoreComments`` in the forest are pooled into batches of 100 which are requested concurrently, so retrieving
+        large threads is bound by the available ratelimit budget rather than the depth of the tree. Retrieved comments
+        are inserted below their parents, after which the comment forest can be iterated over and all the comments
+        with their replies will be made available.
+
+        Parameters
+        ----------
+        limit: int
+            The maximum number of ``MoreComments`` to replace, ``None`` to replace all of them. The ones with the most
+            children are replaced first.
+        threshold: int
+            The minimum number of children a ``MoreComments`` needs to have to be replaced.
+        concurrency: int
+            The maximum number of concurrent morechildren requests.
 
-        This method can be used to retrieve all the comments, and only comments within a forest. This task could take a
-        while for larger threads, after which the comment forest can be iterated over and all the comments with their
-        replies will be made available.
+        Returns
+        -------
+        skipped: List[MoreComments]
+            The ``MoreComments`` that remain in the forest.
         """
-        if not self._comments_unfolded:
-            for item in self:
+        index = self.index
+        pending: List[Tuple[MoreComments, CommentForest]] = []
+        skipped: List[MoreComments] = []
+
+        forests = [self]
+        while forests:
+            forest = forests.pop()
+            for item in forest._models():
                 if isinstance(item, MoreComments):
-                    comments = await item.comments()
-                    for comment in comments:
-                        if comment.replies:
-                            await comment.replies.replace_more()
-                    self._comments_unfolded.extend(comments)
-                elif isinstance(item, Comment):
-                    if item.replies:
-                        await item.replies.replace_more()
-                    self._comments_unfolded.append(item)
-
-            setattr(self, self.CHILD_ATTRIBUTE, self._comments_unfolded)
+                    pending.append((item, forest))
+                elif isinstance(item.replies, CommentForest):
+                    forests.append(item.replies)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request(ids: List[str]) -> List[Union[Comment, MoreComments]]:
+            async with semaphore:
+                return await self._request_children(ids)
+
+        replaced = 0
+        while pending:
+            pending.sort(key=lambda p: p[0].count, reverse=True)
+
+            selected = []
+            for more, forest in pending:
+                if not more.children or more.count < threshold or (limit is not None and replaced >= limit):
+                    skipped.append(more)
+                    continue
+                forest._models().remove(more)
+                selected.append(more)
+                replaced += 1
+
+            ids = [child for more in selected for child in more.children]
+            results = await asyncio.gather(*(request(ids[i:i + 100]) for i in range(0, len(ids), 100)))
+
+            items = [item for children in results for item in children]
+            for item in items:
+                if isinstance(item, Comment):
+                    index.add(item)
+
+            pending = []
+            for item in items:
+                parent = index.get(item.parent_id) if item.parent_id != self._link_id else None
+                forest = self._replies(parent) if parent is not None else self
+                forest._models().append(item)
+
+                if isinstance(item, MoreComments):
+                    pending.append((item, forest))
+
+        self._index = 0
+        return skipped
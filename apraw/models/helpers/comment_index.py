@@ -0,0 +1,194 @@
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from ...utils import prepend_kind
+
+if TYPE_CHECKING:
+    from ..reddit.comment import Comment
+
+
+class CommentIndex:
+    """
+    A flat index over the comments of a :class:`~apraw.models.CommentForest`.
+
+    The index maps comment fullnames to their comments and parents to their children, so looking up a comment, its
+    replies or its ancestors doesn't require walking the nested forest. It is kept up to date as
+    :meth:`~apraw.models.CommentForest.replace_more` retrieves further comments.
+
+    .. note::
+        Comment IDs can be given with or without their ``t1_`` prefix.
+    """
+
+    def __init__(self, link_id: str, comment_kind: str = "t1"):
+        """
+        Create an instance of ``CommentIndex``.
+
+        Parameters
+        ----------
+        link_id: str
+            The fullname of the submission the comments belong to.
+        comment_kind: str
+            The prefix that represents comments in fullnames.
+        """
+        self._link_id = link_id
+        self._comment_kind = comment_kind
+        self._comments: Dict[str, 'Comment'] = {}
+        self._children: Dict[str, List['Comment']] = {}
+        self._depths: Dict[str, int] = {}
+
+    def _fullname(self, id: str) -> str:
+        return id if id == self._link_id else prepend_kind(id, self._comment_kind)
+
+    def add(self, comment: 'Comment'):
+        """
+        Add a comment to the index.
+
+        Parameters
+        ----------
+        comment: Comment
+            The comment to add.
+        """
+        fullname = str(comment.fullname)
+        if fullname in self._comments:
+            return
+        self._comments[fullname] = comment
+        self._children.setdefault(str(comment.parent_id), []).append(comment)
+
+        # replies indexed before their parent, e.g. by ``replace_more``, are moved below it
+        parent_id = str(comment.parent_id)
+        queue = deque([(fullname, self._depths[parent_id] + 1 if parent_id in self._depths else 0)])
+        while queue:
+            fullname, depth = queue.popleft()
+            self._depths[fullname] = depth
+            queue.extend((str(c.fullname), depth + 1) for c in self._children.get(fullname, []))
+
+    def get(self, id: str) -> Optional['Comment']:
+        """
+        Retrieve a comment by its ID.
+
+        Parameters
+        ----------
+        id: str
+            The comment's ID.
+
+        Returns
+        -------
+        comment: Comment or None
+            The comment if it was found in the index.
+        """
+        return self._comments.get(self._fullname(id))
+
+    def children(self, id: str) -> List['Comment']:
+        """
+        Retrieve the direct replies to a comment, or the top-level comments if the submission's fullname is given.
+
+        Parameters
+        ----------
+        id: str
+            The comment's ID or the submission's fullname.
+
+        Returns
+        -------
+        children: List[Comment]
+            The indexed replies.
+        """
+        return list(self._children.get(self._fullname(id), []))
+
+    def parent(self, id: str) -> Optional['Comment']:
+        """
+        Retrieve the parent comment of a comment.
+
+        Parameters
+        ----------
+        id: str
+            The comment's ID.
+
+        Returns
+        -------
+        parent: Comment or None
+            The parent comment, ``None`` for top-level comments or if it isn't indexed.
+        """
+        comment = self.get(id)
+        return self._comments.get(str(comment.parent_id)) if comment is not None else None
+
+    def ancestors(self, id: str) -> List['Comment']:
+        """
+        Retrieve the ancestors of a comment starting with its parent.
+
+        Parameters
+        ----------
+        id: str
+            The comment's ID.
+
+        Returns
+        -------
+        ancestors: List[Comment]
+            The indexed ancestors, ordered from the parent to the top-level comment.
+        """
+        ancestors = []
+        parent = self.parent(id)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = self._comments.get(str(parent.parent_id))
+        return ancestors
+
+    def depth(self, id: str) -> int:
+        """
+        Retrieve the depth of a comment relative to the indexed forest.
+
+        Parameters
+        ----------
+        id: str
+            The comment's ID.
+
+        Returns
+        -------
+        depth: int
+            ``0`` for top-level comments, ``1`` for their replies and so on.
+        """
+        return self._depths.get(self._fullname(id), 0)
+
+    def walk(self, id: str = None) -> Iterator['Comment']:
+        """
+        Iterate over the indexed comments breadth-first.
+
+        Parameters
+        ----------
+        id: str
+            The comment whose replies should be walked, defaults to all the indexed comments.
+
+        Yields
+        ------
+        comment: Comment
+            The comments in breadth-first order.
+        """
+        if id:
+            queue = deque(self._children.get(self._fullname(id), []))
+        else:
+            queue = deque(c for c in self._comments.values() if str(c.parent_id) not in self._comments)
+        while queue:
+            comment = queue.popleft()
+            yield comment
+            queue.extend(self._children.get(str(comment.fullname), []))
+
+    def list(self, id: str = None) -> List['Comment']:
+        """
+        Retrieve the indexed comments in breadth-first order.
+
+        Parameters
+        ----------
+        id: str
+            The comment whose replies should be listed, defaults to all the indexed comments.
+
+        Returns
+        -------
+        comments: List[Comment]
+            The comments in breadth-first order.
+        """
+        return list(self.walk(id))
+
+    def __contains__(self, id: str) -> bool:
+        return self._fullname(id) in self._comments
+
+    def __len__(self) -> int:
+        return len(self._comments)
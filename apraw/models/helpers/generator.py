@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, AsyncIterator, Awaitable, List, Type
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, List, Optional, Type
 
 from ..reddit.listing import Listing
 
@@ -24,13 +25,23 @@ class ListingGenerator(AsyncIterator):
         Kinds to return if given, otherwise all are returned.
     subreddit: Subreddit
         The subreddit to inject as a dependency into items if given.
+    prefetch: int
+        The number of pages to request ahead of the consumer, ``0`` to only request pages once they are needed.
+    raw: bool
+        Whether to yield the raw data dictionaries instead of models.
 
     .. note::
         ListingGenerator will automatically make requests until none more are found or the limit has been reached.
+
+    .. note::
+        With ``prefetch`` enabled the next page is requested as soon as the previous one arrives, so backfilling large
+        listings is bound by throughput rather than latency. Call :meth:`aclose` when breaking out of the iteration
+        early to stop the read-ahead task.
     """
 
     def __init__(self, reddit: 'Reddit', endpoint: str, limit: int = 100, subreddit: 'Subreddit' = None,
-                 kind_filter: List[str] = None, listing_class: Type[Listing] = Listing, **kwargs):
+                 kind_filter: List[str] = None, listing_class: Type[Listing] = Listing, prefetch: int = 0, raw: bool = False,
+                 **kwargs):
         r"""
         Create a ``ListingGenerator`` instance.
 
@@ -46,6 +57,10 @@ class ListingGenerator(AsyncIterator):
             The maximum amount of seconds to wait before re-requesting in streams.
         subreddit: Subreddit
             The subreddit to inject as a dependency into items if given.
+        prefetch: int
+            The number of pages to request ahead of the consumer, ``0`` to disable read-ahead.
+        raw: bool
+            Whether to yield the raw data dictionaries instead of models.
         kwargs: \*\*Dict
             Query parameters to append to the request URL.
         """
@@ -58,6 +73,10 @@ class ListingGenerator(AsyncIterator):
         self._listing_class = listing_class
         self._kind_filter = kind_filter
         self._yielded = 0
+        self._prefetch = prefetch
+        self._raw = raw
+        self._pages: Optional[asyncio.Queue] = None
+        self._read_ahead_task: Optional[asyncio.Task] = None
 
     def __aiter__(self) -> AsyncIterator['aPRAWBase']:
         """
@@ -92,33 +111,95 @@ class ListingGenerator(AsyncIterator):
             A model of the item's data if kind couldn't be identified.
         """
         if self._yielded >= self._limit:
+            await self.aclose()
             raise StopAsyncIteration()
 
-        if self._listing is None:
-            await self._next_batch()
+        while True:
+            if self._listing is not None:
+                try:
+                    item = next(self._listing)
+                    self._yielded += 1
+                    return item
+                except StopIteration:
+                    pass
 
-        try:
-            item = next(self._listing)
-            self._yielded += 1
-            return item
-        except StopIteration:
-            if self._yielded < self._limit:
+            try:
                 await self._next_batch()
-            else:
-                raise StopAsyncIteration()
+            except StopAsyncIteration:
+                await self.aclose()
+                raise
 
-    async def _next_batch(self):
+    async def _fetch(self, after: str = None) -> Listing:
         """
-        Retrieve the next batch of items and store them in a :class:`~apraw.models.Listing`.
+        Request a single page of the listing.
+
+        Parameters
+        ----------
+        after: str
+            The fullname of the last item on the previous page if any.
+
+        Returns
+        -------
+        listing: Listing
+            The requested page.
         """
         kwargs = {**self._params}
 
-        if self._listing:
-            kwargs["after"] = self._listing.last.fullname
+        if after:
+            kwargs["after"] = after
 
         resp = await self._reddit.get(self._endpoint, **kwargs)
-        self._listing = self._listing_class(self._reddit, resp["data"], kind_filter=self._kind_filter,
-                                            subreddit=self._subreddit)
+        return self._listing_class(self._reddit, resp["data"], kind_filter=self._kind_filter,
+                                   subreddit=self._subreddit, raw=self._raw)
+
+    async def _read_ahead(self):
+        """
+        Request pages ahead of the consumer and hand them over through the internal queue.
+        """
+        after = None
+        fetched = 0
+
+        try:
+            while True:
+                listing = await self._fetch(after)
+                await self._pages.put(listing)
+
+                fetched += len(listing)
+                if len(listing) <= 0 or fetched >= self._limit:
+                    return
+
+                after = listing.last_fullname
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._pages.put(e)
+
+    async def _next_batch(self):
+        """
+        Retrieve the next batch of items and store them in a :class:`~apraw.models.Listing`.
+        """
+        if self._prefetch > 0:
+            if self._read_ahead_task is None:
+                self._pages = asyncio.Queue(maxsize=self._prefetch)
+                self._read_ahead_task = asyncio.ensure_future(self._read_ahead())
+
+            if self._read_ahead_task.done() and self._pages.empty():
+                raise StopAsyncIteration()
+
+            listing = await self._pages.get()
+            if isinstance(listing, Exception):
+                raise listing
+        else:
+            listing = await self._fetch(self._listing.last_fullname if self._listing else None)
+
+        self._listing = listing
 
         if len(self._listing) <= 0:
             raise StopAsyncIteration()
+
+    async def aclose(self):
+        """
+        Stop the read-ahead task if one is running.
+        """
+        if self._read_ahead_task is not None and not self._read_ahead_task.done():
+            self._read_ahead_task.cancel()
@@ -0,0 +1,132 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..reddit.listing import Listing
+from ...const import API_PATH
+
+if TYPE_CHECKING:
+    from .apraw_base import aPRAWBase
+    from ...reddit import Reddit
+
+
+class InfoLoader:
+    """
+    A loader that coalesces individual /api/info lookups into batched requests.
+
+    Lookups made within ``window`` seconds of each other are collected and resolved by a single request with up to 100
+    fullnames, so many coroutines fetching id-only models at the same time share requests instead of spending one each.
+    Repeated lookups of the same fullname in a batch are only requested once.
+
+    .. note::
+        The :class:`~apraw.Reddit` instance has a loader available as ``reddit.info_loader`` which is used by
+        :meth:`~apraw.models.Submission.fetch`, :meth:`~apraw.models.Comment.fetch` and
+        :meth:`~apraw.models.MoreComments.parent` for models that only have an ID.
+
+    Members
+    -------
+    window: float
+        The number of seconds to collect lookups before issuing a request.
+    max_batch: int
+        The maximum number of fullnames per request.
+    """
+
+    def __init__(self, reddit: 'Reddit', window: float = 0.01, max_batch: int = 100):
+        """
+        Create an instance of ``InfoLoader``.
+
+        Parameters
+        ----------
+        reddit: Reddit
+            The :class:`~apraw.Reddit` instance with which requests are made.
+        window: float
+            The number of seconds to collect lookups before issuing a request.
+        max_batch: int
+            The maximum number of fullnames per request.
+        """
+        self._reddit = reddit
+        self.window = window
+        self.max_batch = max_batch
+
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def load_data(self, fullname: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the raw data of an item.
+
+        Parameters
+        ----------
+        fullname: str
+            The item's fullname.
+
+        Returns
+        -------
+        child: Dict or None
+            The item's listing child with its ``kind`` and ``data``, ``None`` if it wasn't returned.
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        self._pending.setdefault(fullname, []).append(future)
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    async def load(self, fullname: str) -> Optional['aPRAWBase']:
+        """
+        Look up an item.
+
+        Parameters
+        ----------
+        fullname: str
+            The item's fullname.
+
+        Returns
+        -------
+        item: aPRAWBase or None
+            The item as its model, ``None`` if it wasn't returned.
+        """
+        child = await self.load_data(fullname)
+        if child is None:
+            return None
+        return Listing(self._reddit, {"children": [child]})[0]
+
+    def _flush(self):
+        """
+        Issue a request for the lookups collected so far.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            asyncio.ensure_future(self._request(batch))
+
+    async def _request(self, batch: Dict[str, List[asyncio.Future]]):
+        """
+        Request a batch of fullnames and resolve the futures waiting for them.
+        """
+        children = None
+        error = None
+        try:
+            resp = await self._reddit.get(API_PATH["info"], id=",".join(batch))
+            children = {child["data"].get("name"): child for child in resp["data"]["children"]}
+        except Exception as e:
+            # error bodies such as a 403 without ``data`` fail the batch instead of leaving its waiters hanging
+            error = e
+        finally:
+            for fullname, futures in batch.items():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    elif children is None:
+                        future.cancel()
+                    else:
+                        future.set_result(children.get(fullname))
@@ -0,0 +1,184 @@
+import asyncio
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from .apraw_base import aPRAWBase
+from ..reddit.comment import URL_PATTERN
+from ..subreddit.subreddit import Subreddit
+from ...const import API_PATH
+
+if TYPE_CHECKING:
+    from ...reddit import Reddit
+
+FULLNAME_PATTERN = re.compile(r"^t\d_[a-z0-9]+$", re.IGNORECASE)
+SUBREDDIT_PATTERN = re.compile(r"^/?r/(?P<subreddit>\w+)/?$", re.IGNORECASE)
+
+
+class InfoResult:
+    """
+    The result of a bulk lookup made with :class:`~apraw.models.InfoLookup`.
+
+    Members
+    -------
+    keys: List[str]
+        The deduplicated lookup keys in input order.
+    items: List[aPRAWBase]
+        The items that were found in input order. URLs of external links can be matched by several submissions.
+    missing: List[str]
+        The keys that weren't returned by Reddit, for example because the item was deleted or removed.
+    """
+
+    def __init__(self, keys: List[str], results: Dict[str, List[aPRAWBase]]):
+        self.keys = keys
+        self._results = results
+        self.items = [item for key in keys for item in results.get(key, [])]
+        self.missing = [key for key in keys if not results.get(key)]
+
+    def get(self, key: str) -> Optional[aPRAWBase]:
+        """
+        Retrieve the first item found for a key.
+
+        Parameters
+        ----------
+        key: str
+            The fullname, URL or subreddit name as it was passed to the lookup.
+
+        Returns
+        -------
+        item: aPRAWBase or None
+            The item if it was found.
+        """
+        results = self._results.get(InfoLookup.normalize(key)[1], [])
+        return results[0] if results else None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class InfoLookup:
+    """
+    An engine to look up many items on the /api/info endpoint at once.
+
+    Fullnames and subreddit names are requested in chunks of 100, and URLs of external links are requested one by one.
+    All the requests are issued concurrently, so looking up large numbers of items is bound by the ratelimit rather
+    than serial round trips. Repeated keys are only requested once and the results are returned in input order.
+
+    Accepted keys are:
+
+    - Fullnames such as ``t3_hpbepl``.
+    - Reddit permalinks of submissions and comments, which are resolved to their fullnames.
+    - URLs of external links, which return all the submissions linking to them.
+    - Subreddit names such as ``r/aPRAWTest`` or :class:`~apraw.models.Subreddit` instances. Keys that match none of
+      the above are treated as subreddit names.
+    """
+
+    CHUNK_SIZE = 100
+
+    def __init__(self, reddit: 'Reddit', concurrency: int = 8):
+        """
+        Create an instance of ``InfoLookup``.
+
+        Parameters
+        ----------
+        reddit: Reddit
+            The :class:`~apraw.Reddit` instance with which requests are made.
+        concurrency: int
+            The maximum number of requests in flight at once.
+        """
+        self._reddit = reddit
+        self._concurrency = concurrency
+
+    @staticmethod
+    def normalize(key: Union[str, aPRAWBase], link_kind: str = "t3", comment_kind: str = "t1") -> Tuple[str, str]:
+        """
+        Classify a lookup key and normalize it.
+
+        Parameters
+        ----------
+        key: Union[str, aPRAWBase]
+            The fullname, URL, subreddit name or model to look up.
+        link_kind: str
+            The prefix that represents submissions in fullnames.
+        comment_kind: str
+            The prefix that represents comments in fullnames.
+
+        Returns
+        -------
+        type: str
+            One of ``"id"``, ``"url"`` or ``"sr_name"``.
+        key: str
+            The normalized key.
+        """
+        if isinstance(key, Subreddit):
+            return "sr_name", key.display_name.lower()
+        if isinstance(key, aPRAWBase):
+            return "id", key.fullname.lower()
+
+        key = key.strip()
+        if FULLNAME_PATTERN.match(key):
+            return "id", key.lower()
+
+        match = SUBREDDIT_PATTERN.match(key)
+        if match:
+            return "sr_name", match.group("subreddit").lower()
+
+        if "/" in key or "." in key:
+            match = URL_PATTERN.search(key)
+            if match and match.group("comment"):
+                return "id", f"{comment_kind}_{match.group('comment')}".lower()
+            if match:
+                return "id", f"{link_kind}_{match.group('submission')}".lower()
+            return "url", key
+
+        return "sr_name", key.lower()
+
+    async def _request(self, semaphore: asyncio.Semaphore, **params) -> List[aPRAWBase]:
+        async with semaphore:
+            return list(await self._reddit.get_listing(API_PATH["info"], **params))
+
+    async def fetch(self, keys: Iterable[Union[str, aPRAWBase]]) -> InfoResult:
+        """
+        Look up items by their fullnames, URLs or subreddit names.
+
+        Parameters
+        ----------
+        keys: Iterable[Union[str, aPRAWBase]]
+            The keys to look up, which may be mixed.
+
+        Returns
+        -------
+        result: InfoResult
+            The items in input order and the keys that weren't found.
+        """
+        ordered: Dict[str, str] = {}
+        for key in keys:
+            type, key = self.normalize(key, self._reddit.link_kind, self._reddit.comment_kind)
+            ordered.setdefault(key, type)
+
+        ids = [key for key, type in ordered.items() if type == "id"]
+        names = [key for key, type in ordered.items() if type == "sr_name"]
+        urls = [key for key, type in ordered.items() if type == "url"]
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        requests = [self._request(semaphore, id=",".join(ids[i:i + self.CHUNK_SIZE]))
+                    for i in range(0, len(ids), self.CHUNK_SIZE)]
+        requests += [self._request(semaphore, sr_name=",".join(names[i:i + self.CHUNK_SIZE]))
+                     for i in range(0, len(names), self.CHUNK_SIZE)]
+        requests += [self._request(semaphore, url=url) for url in urls]
+
+        responses = await asyncio.gather(*requests)
+
+        results: Dict[str, List[aPRAWBase]] = {}
+        url_responses = responses[len(responses) - len(urls):]
+        for url, items in zip(urls, url_responses):
+            results[url] = items
+        for items in responses[:len(responses) - len(urls)]:
+            for item in items:
+                results.setdefault(item.fullname.lower(), []).append(item)
+                if isinstance(item, Subreddit):
+                    results.setdefault(item.display_name.lower(), []).append(item)
+
+        return InfoResult(list(ordered), results)
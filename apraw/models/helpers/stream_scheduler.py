@@ -0,0 +1,310 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from ...retry import RetryError
+from ...utils import BoundedSet, ExponentialCounter
+
+if TYPE_CHECKING:
+    from .streamable import Streamable
+
+#: The exceptions a poll may raise while Reddit or the network is having trouble, which keep the stream alive.
+TRANSIENT_ERRORS = (RetryError, aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
+
+
+class StreamStats:
+    """
+    Statistics collected by the :class:`~apraw.models.StreamScheduler` for a single stream.
+
+    Members
+    -------
+    name: str
+        The name the stream was registered under.
+    polls: int
+        The number of times the stream has been polled.
+    empty_polls: int
+        The number of polls that didn't return any new items.
+    items: int
+        The number of new items found by the stream.
+    errors: int
+        The number of polls that raised a transient exception.
+    rate: float
+        The smoothed rate at which new items arrive in items per second.
+    interval: float
+        The current number of seconds between polls.
+    last_poll: float
+        The ``time.monotonic()`` timestamp of the last poll.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.polls = 0
+        self.empty_polls = 0
+        self.items = 0
+        self.errors = 0
+        self.rate = 0.0
+        self.interval = 0.0
+        self.last_poll = None
+
+    def __repr__(self):
+        return f"<StreamStats name='{self.name}' rate={self.rate:.3f}/s interval={self.interval:.1f}s>"
+
+
+class _StreamError:
+    """
+    An exception raised by a poll, queued so it's raised to the consumer after the items found before it.
+    """
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class _ScheduledStream:
+    """
+    A stream registered with the scheduler.
+    """
+
+    def __init__(self, name: str, streamable: 'Streamable', skip_existing: bool, args: Tuple, kwargs: Dict,
+                 max_wait: float):
+        self.name = name
+        self.streamable = streamable
+        self.skip_existing = skip_existing
+        self.args = args
+        self.kwargs = kwargs
+        self.seen = BoundedSet(301)
+        self.counter = ExponentialCounter(max_wait)
+        self.queue = asyncio.Queue()
+        self.stats = StreamStats(name)
+        self.closed = False
+
+
+class StreamScheduler:
+    """
+    A scheduler that multiplexes many :meth:`~apraw.models.Streamable.stream` calls over a single polling loop.
+
+    Instead of every stream running its own poll loop, the scheduler polls the stream that is due next with bounded
+    concurrency and adapts every stream's interval to the rate at which new items arrive. Busy streams are polled
+    often enough to fill a fraction of a page between polls while streams without new items back off exponentially
+    up to ``max_wait``, so the request budget goes where the traffic is. Transient errors such as a
+    :class:`~apraw.RetryError` are counted and the stream backs off, while any other exception ends the stream and is
+    raised to its consumer.
+
+    .. code-block:: python3
+
+        scheduler = StreamScheduler()
+
+        async def watch(name):
+            subreddit = await reddit.subreddit(name)
+            async for submission in subreddit.new.stream(scheduler=scheduler):
+                print(submission)
+
+    Members
+    -------
+    max_wait: float
+        The maximum number of seconds between polls of a stream.
+    min_wait: float
+        The minimum number of seconds between polls of a stream.
+    limit: int
+        The number of items requested per poll.
+    fill_target: float
+        The fraction of ``limit`` new items a busy stream should accumulate between polls.
+    max_rate: float
+        The maximum number of polls per second across all streams, ``None`` to only be bound by the ratelimiter.
+    """
+
+    def __init__(self, max_wait: float = 16, min_wait: float = 1, limit: int = 100, concurrency: int = 4,
+                 fill_target: float = 0.25, max_rate: float = None, smoothing: float = 0.3):
+        """
+        Create an instance of ``StreamScheduler``.
+
+        Parameters
+        ----------
+        max_wait: float
+            The maximum number of seconds between polls of a stream.
+        min_wait: float
+            The minimum number of seconds between polls of a stream.
+        limit: int
+            The number of items requested per poll.
+        concurrency: int
+            The maximum number of polls in flight at once.
+        fill_target: float
+            The fraction of ``limit`` new items a busy stream should accumulate between polls.
+        max_rate: float
+            The maximum number of polls per second across all streams, ``None`` to only be bound by the ratelimiter.
+        smoothing: float
+            The weight given to the latest observation when updating a stream's arrival rate.
+        """
+        self.max_wait = max_wait
+        self.min_wait = min_wait
+        self.limit = limit
+        self.fill_target = fill_target
+        self.max_rate = max_rate
+
+        self._concurrency = concurrency
+        self._smoothing = smoothing
+        self._streams: Dict[str, _ScheduledStream] = {}
+        self._heap: List[Tuple[float, int, _ScheduledStream]] = []
+        self._sequence = itertools.count()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_dispatch = 0.0
+
+    @property
+    def stats(self) -> Dict[str, StreamStats]:
+        """
+        Retrieve the statistics of all registered streams.
+
+        Returns
+        -------
+        stats: Dict[str, StreamStats]
+            The statistics by stream name.
+        """
+        return {name: stream.stats for name, stream in self._streams.items()}
+
+    async def stream(self, streamable: 'Streamable', skip_existing: bool = False, *args, name: str = None,
+                     **kwargs) -> AsyncIterator[Any]:
+        r"""
+        Register a stream with the scheduler and yield its new items.
+
+        Parameters
+        ----------
+        streamable: Streamable
+            The streamable function to poll.
+        skip_existing: bool
+            Whether items found on the first poll should be skipped.
+        name: str
+            The name to register the stream under, defaults to a name derived from the function and its arguments.
+        kwargs: \*\*Dict
+            ``kwargs`` to be passed on to the function.
+
+        Yields
+        ------
+        item: aPRAWBase
+            The items retrieved by the function in chronological order.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by a poll that isn't one of the :data:`TRANSIENT_ERRORS`.
+        """
+        name = name or self._name(streamable, args, kwargs)
+        if name in self._streams:
+            raise ValueError(f"A stream named '{name}' is already registered.")
+
+        stream = _ScheduledStream(name, streamable, skip_existing, args, kwargs, self.max_wait)
+        self._register(stream)
+
+        try:
+            while True:
+                item = await stream.queue.get()
+                if isinstance(item, _StreamError):
+                    raise item.error
+                yield item
+        finally:
+            stream.closed = True
+            self._streams.pop(name, None)
+
+    def _name(self, streamable: 'Streamable', args: Tuple, kwargs: Dict) -> str:
+        func = getattr(streamable._func, "__qualname__", repr(streamable._func))
+        instance = f"{streamable._instance}." if streamable._instance is not None else ""
+        params = ", ".join([repr(a) for a in args] + [f"{k}={v!r}" for k, v in kwargs.items()])
+        return f"{instance}{func}({params})"
+
+    def _register(self, stream: _ScheduledStream):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._wakeup = asyncio.Event()
+
+        self._streams[stream.name] = stream
+        self._schedule(stream, time.monotonic())
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    def _schedule(self, stream: _ScheduledStream, due: float):
+        heapq.heappush(self._heap, (due, next(self._sequence), stream))
+        self._wakeup.set()
+
+    async def _run(self):
+        """
+        Dispatch polls to the streams as they become due.
+        """
+        while self._streams:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            due, _, stream = self._heap[0]
+            now = time.monotonic()
+            if self.max_rate:
+                due = max(due, self._last_dispatch + 1 / self.max_rate)
+
+            if due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            if stream.closed:
+                continue
+
+            await self._semaphore.acquire()
+            self._last_dispatch = time.monotonic()
+            asyncio.ensure_future(self._poll(stream))
+
+    async def _poll(self, stream: _ScheduledStream):
+        """
+        Poll a stream, hand its new items to the consumer and schedule the next poll.
+        """
+        found = 0
+        try:
+            items = [i async for i in stream.streamable(self.limit, *stream.args, **stream.kwargs)]
+            for item in reversed(items):
+                attribute = getattr(item, stream.streamable._attribute_name)
+
+                if attribute in stream.seen:
+                    continue
+
+                stream.seen.add(attribute)
+                found += 1
+
+                if not stream.skip_existing:
+                    stream.queue.put_nowait(item)
+
+            stream.skip_existing = False
+        except TRANSIENT_ERRORS:
+            stream.stats.errors += 1
+        except Exception as e:
+            stream.queue.put_nowait(_StreamError(e))
+            stream.closed = True
+        finally:
+            self._semaphore.release()
+
+            now = time.monotonic()
+            stats = stream.stats
+            if stats.last_poll is not None and stats.polls > 0:
+                observed = found / max(now - stats.last_poll, 1e-3)
+                stats.rate = self._smoothing * observed + (1 - self._smoothing) * stats.rate
+            stats.last_poll = now
+            stats.polls += 1
+            stats.items += found
+
+            if found:
+                stream.counter.reset()
+                target = self.fill_target * self.limit / stats.rate if stats.rate > 0 else self.min_wait
+                stats.interval = min(max(target, self.min_wait), self.max_wait)
+            else:
+                stats.empty_polls += 1
+                stats.interval = min(max(stream.counter.count(), self.min_wait), self.max_wait)
+
+            if not stream.closed:
+                self._schedule(stream, now + stats.interval)
@@ -1,10 +1,14 @@
 import asyncio
 from functools import update_wrapper
-from typing import AsyncIterator, Callable, Any, Union, AsyncGenerator, Generator, Iterator, Awaitable
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Any, Union, AsyncGenerator, Generator, Iterator, Awaitable
 
 from .apraw_base import aPRAWBase
+from ...retry import RetryError
 from ...utils import ExponentialCounter, BoundedSet
 
+if TYPE_CHECKING:
+    from .stream_scheduler import StreamScheduler
+
 # I know, I know, this code is cursed
 SYNC_OR_ASYNC_ITERABLE = Union[
     Callable[[Any, int, Any], Union[Awaitable[Union[AsyncIterator[aPRAWBase], Iterator[aPRAWBase]]], Union[
@@ -120,7 +124,7 @@ class Streamable:
             for item in iterable:
                 yield item
 
-    async def stream(self, skip_existing: bool = False, *args, **kwargs):
+    async def stream(self, skip_existing: bool = False, *args, scheduler: 'StreamScheduler' = None, **kwargs):
         r"""
         Call the stream method on the decorated function.
 
@@ -128,6 +132,9 @@ class Streamable:
         ----------
         skip_existing: bool
             Whether items found before the function call should be returned as well.
+        scheduler: StreamScheduler
+            A :class:`~apraw.models.StreamScheduler` to multiplex this stream with others instead of running its own
+            poll loop.
         kwargs: \*\*Dict
             ``kwargs`` to be passed on to the function.
 
@@ -136,12 +143,25 @@ class Streamable:
         item: aPRAWBase
             The item retrieved by the function in chronological order.
         """
+        if scheduler is not None:
+            stream = scheduler.stream(self, skip_existing, *args, **kwargs)
+            try:
+                async for item in stream:
+                    yield item
+            finally:
+                await stream.aclose()
+            return
+
         counter = ExponentialCounter(self.max_wait)
         seen_attributes = BoundedSet(301)
 
         while True:
             found = False
-            items = [i async for i in self(100, *args, **kwargs)]
+            try:
+                items = [i async for i in self(100, *args, **kwargs)]
+            except RetryError:
+                # Reddit is having trouble, keep the stream alive and back off
+                items = []
             for item in reversed(items):
                 attribute = getattr(item, self._attribute_name)
 
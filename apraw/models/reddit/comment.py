@@ -188,9 +188,11 @@ class Comment(aPRAWBase, DeletableMixin, HideableMixin, ReplyableMixin, SavableM
             self._submission = Submission(self._reddit, resp[0]["data"]["children"][0]["data"])
             return await self._async_update(resp[1]["data"]["children"][0]["data"])
         elif "id" in self._data:
-            resp = await self._reddit.get(API_PATH["info"],
-                                          id=prepend_kind(self._data["id"], self._reddit.comment_kind))
-            return await self._async_update(resp["data"]["children"][0]["data"])
+            fullname = prepend_kind(self._data["id"], self._reddit.comment_kind)
+            child = await self._reddit.info_loader.load_data(fullname)
+            if child is None:
+                raise ValueError(f"No comment found with the fullname {fullname}.")
+            return await self._async_update(child["data"])
         else:
             raise ValueError(f"No data available to make request URL: {self._data}")
 
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict, Iterator, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Union
+from weakref import WeakKeyDictionary
 
 from .comment import Comment
 from .message import Message
@@ -12,16 +13,28 @@ if TYPE_CHECKING:
     from ..subreddit.subreddit import Subreddit
     from ...reddit import Reddit
 
+# the factories by kind of every Reddit instance, so listings resolve an item's factory with a single lookup
+_kind_factories: 'WeakKeyDictionary[Reddit, Dict[str, Callable]]' = WeakKeyDictionary()
+
 
 class Listing(aPRAWBase, Iterator):
     """
     A model representing Reddit listings.
+
+    Items are only materialized into models once they are accessed, and every model is cached per index so repeated
+    access, such as through :attr:`last`, doesn't rebuild it. In ``raw`` mode the underlying data dictionaries are
+    returned as-is without building any models.
+
+    Members
+    -------
+    raw: bool
+        Whether the listing returns the raw data dictionaries instead of models.
     """
 
     CHILD_ATTRIBUTE = "children"
 
     def __init__(self, reddit: 'Reddit', data: Dict, kind_filter: List[str] = None,
-                 subreddit: 'Subreddit' = None, link_id: str = ""):
+                 subreddit: 'Subreddit' = None, link_id: str = "", raw: bool = False):
         """
         Create a ``Listing`` instance.
 
@@ -35,6 +48,8 @@ class Listing(aPRAWBase, Iterator):
             Kinds to return if given, otherwise all are returned.
         subreddit: Subreddit
             The subreddit to inject into items as their owner.
+        raw: bool
+            Whether to return the raw data dictionaries instead of models.
         """
         super().__init__(reddit, data, reddit.listing_kind)
 
@@ -42,6 +57,17 @@ class Listing(aPRAWBase, Iterator):
         self._subreddit = subreddit
         self._link_id = link_id
         self._kind_filter = kind_filter if kind_filter else []
+        self.raw = raw
+
+        self._items: Dict[int, Union[aPRAWBase, Dict]] = {}
+        self._items_source = None
+
+        try:
+            self._factories = _kind_factories[reddit]
+        except KeyError:
+            self._factories = _kind_factories.setdefault(reddit, {
+                getattr(reddit, attribute): factory for attribute, factory in Listing.KIND_FACTORIES.items()
+            })
 
     def __len__(self) -> int:
         """
@@ -78,14 +104,25 @@ class Listing(aPRAWBase, Iterator):
             if self._index >= len(self):
                 raise StopIteration()
             self._index += 1
-            item = self[self._index - 1]
 
-            if not self._kind_filter or (self._kind_filter and item.kind in self._kind_filter):
+            if not self._kind_filter or self._kind(self._index - 1) in self._kind_filter:
                 break
 
-        return item
+        return self[self._index - 1]
+
+    def _kind(self, index: int) -> str:
+        """
+        Retrieve the kind of the item at position index without materializing it if possible.
+        """
+        item = getattr(self, self.CHILD_ATTRIBUTE)[index]
 
-    def __getitem__(self, index: int) -> aPRAWBase:
+        if isinstance(item, aPRAWBase):
+            return item.kind
+        if "kind" in item:
+            return item["kind"]
+        return self[index].kind if not self.raw else ""
+
+    def __getitem__(self, index: int) -> Union[aPRAWBase, Dict]:
         """
         Return the item at position index in the list.
 
@@ -96,41 +133,93 @@ class Listing(aPRAWBase, Iterator):
 
         Returns
         -------
-        item: aPRAWBase
-            The searched item.
+        item: aPRAWBase or Dict
+            The searched item, or its data if the listing is in ``raw`` mode.
         """
-        item = getattr(self, self.CHILD_ATTRIBUTE)[index]
+        children = getattr(self, self.CHILD_ATTRIBUTE)
 
-        if isinstance(item, aPRAWBase):
-            return item
+        if children is not self._items_source:
+            self._items = {}
+            self._items_source = children
+
+        if index < 0:
+            index += len(children)
+
+        if index not in self._items:
+            item = children[index]
+
+            if isinstance(item, aPRAWBase):
+                return item
+            if self.raw:
+                return item["data"] if "data" in item else item
+
+            self._items[index] = self._materialize(item)
 
+        return self._items[index]
+
+    def _materialize(self, item: Dict[str, Any]) -> aPRAWBase:
+        """
+        Build the model for an item's raw data.
+
+        Parameters
+        ----------
+        item: Dict
+            The item's raw data as found in the listing.
+
+        Returns
+        -------
+        item: aPRAWBase
+            The model representing the item.
+        """
         if "page" in item:
             return WikipageRevision(self._reddit, item)
-        elif item["kind"] == self._reddit.link_kind:
-            return Submission(self._reddit, item["data"], subreddit=self._subreddit)
-        elif item["kind"] == self._reddit.subreddit_kind:
-            from ..subreddit.subreddit import Subreddit
-            return Subreddit(self._reddit, item["data"])
-        elif item["kind"] == self._reddit.comment_kind:
-            if item["data"]["replies"] and item["data"]["replies"]["kind"] == self._reddit.listing_kind:
-                from ..helpers.comment_forest import CommentForest
-                replies = CommentForest(self._reddit, item["data"]["replies"]["data"], item["data"]["link_id"])
-            else:
-                replies = []
-            return Comment(self._reddit, item["data"], subreddit=self._subreddit, replies=replies)
-        elif item["kind"] == self._reddit.modaction_kind:
-            return ModAction(self._reddit, item["data"], self._subreddit)
-        elif item["kind"] == self._reddit.message_kind:
-            return Message(self._reddit, item["data"])
-        elif item["kind"] == self._reddit.listing_kind:
-            return Listing(self._reddit, item["data"])
-        elif item["kind"] == self._reddit.more_kind:
-            return MoreComments(self._reddit, item["data"], self._link_id)
+
+        factory = self._factories.get(item.get("kind"))
+        if factory:
+            return factory(self, item["data"])
+
+        return aPRAWBase(self._reddit, item["data"] if "data" in item else item)
+
+    def _build_submission(self, data: Dict[str, Any]) -> Submission:
+        return Submission(self._reddit, data, subreddit=self._subreddit)
+
+    def _build_subreddit(self, data: Dict[str, Any]) -> 'Subreddit':
+        from ..subreddit.subreddit import Subreddit
+        return Subreddit(self._reddit, data)
+
+    def _build_comment(self, data: Dict[str, Any]) -> Comment:
+        if data["replies"] and data["replies"]["kind"] == self._reddit.listing_kind:
+            from ..helpers.comment_forest import CommentForest
+            replies = CommentForest(self._reddit, data["replies"]["data"], data["link_id"])
         else:
-            return aPRAWBase(self._reddit, item["data"] if "data" in item else item)
+            replies = []
+        return Comment(self._reddit, data, subreddit=self._subreddit, replies=replies)
+
+    def _build_modaction(self, data: Dict[str, Any]) -> ModAction:
+        return ModAction(self._reddit, data, self._subreddit)
+
+    def _build_message(self, data: Dict[str, Any]) -> Message:
+        return Message(self._reddit, data)
+
+    def _build_listing(self, data: Dict[str, Any]) -> 'Listing':
+        return Listing(self._reddit, data)
+
+    def _build_more_comments(self, data: Dict[str, Any]) -> MoreComments:
+        return MoreComments(self._reddit, data, self._link_id)
+
+    #: Maps the :class:`~apraw.Reddit` kind attributes to the factory functions building their models.
+    KIND_FACTORIES: Dict[str, Callable[['Listing', Dict[str, Any]], aPRAWBase]] = {
+        "link_kind": _build_submission,
+        "subreddit_kind": _build_subreddit,
+        "comment_kind": _build_comment,
+        "modaction_kind": _build_modaction,
+        "message_kind": _build_message,
+        "listing_kind": _build_listing,
+        "more_kind": _build_more_comments
+    }
 
     @property
-    def last(self) -> aPRAWBase:
+    def last(self) -> Union[aPRAWBase, Dict]:
         """
         Return the last item in the listing.
 
@@ -141,6 +230,21 @@ class Listing(aPRAWBase, Iterator):
         """
         return self[len(self) - 1] if len(self) > 0 else None
 
+    @property
+    def last_fullname(self) -> str:
+        """
+        Return the fullname of the last item in the listing, as used for pagination.
+
+        Returns
+        -------
+        fullname: str
+            The fullname of the last item in the listing, also available in ``raw`` mode.
+        """
+        last = self.last
+        if isinstance(last, dict):
+            return last["name"]
+        return last.fullname if last is not None else None
+
 
 class MoreChildren(Listing):
     CHILD_ATTRIBUTE = "things"
@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING, Dict, Any, List, Union
 
 from .comment import Comment
@@ -54,17 +55,20 @@ class MoreComments(aPRAWBase, LinkMixin):
         self._ids = list(self.children)
         self._index = 0
 
-    async def _next_batch(self):
-        """
-        Retrieve the next batch of :class:`~apraw.models.Comment` and further ``MoreComments`` in this thread.
-        These will be added to the internal list and can be read by using the instance as a generator or fetching the
-        comments with :func:`~apraw.models.MoreComments.comments`.
+    async def _request(self, ids: List[str]) -> List[Union[Comment, 'MoreComments']]:
         """
-        if not self._ids:
-            return
+        Request a single batch of children from the morechildren endpoint.
 
-        ids = self._ids[:100]
-        self._ids = self._ids[100:]
+        Parameters
+        ----------
+        ids: List[str]
+            Up to 100 IDs of the children to retrieve.
+
+        Returns
+        -------
+        children: List[Union[Comment, MoreComments]]
+            The retrieved :class:`~apraw.models.Comment` and further ``MoreComments``.
+        """
         resp = await self._reddit.get(API_PATH["morechildren"], **{
             "children": ",".join(ids),
             "link_id": self.link_id,
@@ -74,8 +78,21 @@ class MoreComments(aPRAWBase, LinkMixin):
 
         from .listing import MoreChildren
         children = MoreChildren(self._reddit, resp["json"]["data"], [self._reddit.comment_kind, self._reddit.more_kind],
-                                self.link_id)
-        self._comments.extend(comment for comment in children)
+                                link_id=self.link_id)
+        return list(children)
+
+    async def _next_batch(self):
+        """
+        Retrieve the next batch of :class:`~apraw.models.Comment` and further ``MoreComments`` in this thread.
+        These will be added to the internal list and can be read by using the instance as a generator or fetching the
+        comments with :func:`~apraw.models.MoreComments.comments`.
+        """
+        if not self._ids:
+            return
+
+        ids = self._ids[:100]
+        self._ids = self._ids[100:]
+        self._comments.extend(await self._request(ids))
 
     async def parent(self) -> Union[Submission, Comment]:
         """
@@ -86,14 +103,19 @@ class MoreComments(aPRAWBase, LinkMixin):
         parent: Submission or Comment
             The parent submission or comment of this MoreComments object.
         """
-        return await self._reddit.info(self.parent_id)
+        return await self._reddit.info_loader.load(self.parent_id)
 
     async def fetch(self):
         """
         Fetch all the comments in this MoreComments thread.
+
+        The batches of 100 children are requested concurrently.
         """
-        while self._ids:
-            await self._next_batch()
+        batches = [self._ids[i:i + 100] for i in range(0, len(self._ids), 100)]
+        self._ids = []
+
+        for children in await asyncio.gather(*(self._request(ids) for ids in batches)):
+            self._comments.extend(children)
 
     def __aiter__(self):
         """
@@ -215,9 +215,11 @@ class Submission(aPRAWBase, DeletableMixin, HideableMixin, ReplyableMixin, NSFWa
             self._update(resp)
             return self
         elif "id" in self._data:
-            resp = await self._reddit.get(API_PATH["info"],
-                                          id=prepend_kind(self._data["id"], self._reddit.link_kind))
-            self._update(resp["data"]["children"][0]["data"])
+            fullname = prepend_kind(self._data["id"], self._reddit.link_kind)
+            child = await self._reddit.info_loader.load_data(fullname)
+            if child is None:
+                raise ValueError(f"No submission found with the fullname {fullname}.")
+            self._update(child["data"])
             return self
         else:
             raise ValueError(f"No data available to make request URL: {self._data}")
@@ -60,26 +60,21 @@ class BannedListing(Listing):
     A model representing listings of banned users.
     """
 
-    def __getitem__(self, index: int) -> BannedUser:
+    def _materialize(self, item: Dict) -> BannedUser:
         """
-        Return the item at position index in the list.
+        Build the model for a banned user's raw data.
 
         Parameters
         ----------
-        index : int
-            The item's index.
+        item: Dict
+            The banned user's raw data as found in the listing.
 
         Returns
         -------
-        item: aPRAWBase
-            The searched item.
+        banned_user: BannedUser
+            The model representing the banned user.
         """
-        item = getattr(self, self.CHILD_ATTRIBUTE)[index]
-
-        if isinstance(item, aPRAWBase):
-            return item
-        else:
-            return BannedUser(self._reddit, item, self._subreddit)
+        return BannedUser(self._reddit, item, self._subreddit)
 
 
 class SubredditBanned:
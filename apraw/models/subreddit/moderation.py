@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Dict, TYPE_CHECKING
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, Optional, TYPE_CHECKING, Union
 
+from .removal_reasons import SubredditRemovalReason
 from .settings import SubredditSettings
 from ..helpers.apraw_base import aPRAWBase
+from ..helpers.bulk_moderation import BulkAction, BulkItem, BulkModeration, BulkReport, BulkResult
 from ..helpers.streamable import streamable
 from ..mixins.redditor import RedditorMixin
 from ..reddit.redditor import Redditor
@@ -249,6 +251,86 @@ class SubredditModeration:
                                 API_PATH["subreddit_log"].format(sub=self._subreddit.display_name),
                                 subreddit=self._subreddit, *args, **kwargs)
 
+    async def bulk(self, items: Union[Iterable[BulkItem], AsyncIterable[BulkItem]], action: BulkAction, *args,
+                   concurrency: int = 10, progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None,
+                   **kwargs) -> BulkReport:
+        r"""
+        Perform a moderation action on many items concurrently with a :class:`~apraw.models.BulkModeration`.
+
+        .. code-block:: python3
+
+            report = await subreddit.mod.bulk(subreddit.mod.modqueue(limit=None), "remove", spam=True)
+            print(f"Removed {len(report.succeeded)} items, {len(report.failed)} failed.")
+
+        Parameters
+        ----------
+        items: Iterable or AsyncIterable
+            The comments, submissions or fullnames to moderate, for example a listing of this subreddit.
+        action: str or Callable
+            The name of a moderation method such as ``"remove"``, ``"approve"``, ``"lock"``, ``"distinguish"`` or
+            ``"ignore_reports"``, or a coroutine function called with each item.
+        concurrency: int
+            The maximum number of actions in flight at once.
+        progress: Callable[[BulkResult, BulkReport], Any]
+            A function called with every result and the report so far as the actions complete.
+        args: \*List
+            Positional arguments passed on to the action.
+        kwargs: \*\*Dict
+            Keyword arguments passed on to the action.
+
+        Returns
+        -------
+        report: BulkReport
+            The per-item results and errors.
+        """
+        return await BulkModeration(self._reddit, concurrency).execute(items, action, *args, progress=progress,
+                                                                       **kwargs)
+
+    async def remove(self, items: Union[Iterable[BulkItem], AsyncIterable[BulkItem]],
+                     reason: Union[str, SubredditRemovalReason] = None, mod_note: str = "", spam: bool = False,
+                     concurrency: int = 10,
+                     progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None) -> BulkReport:
+        """
+        Remove many items and add a removal reason to each of them.
+
+        The removal reason is resolved once through the shared :class:`~apraw.models.RemovalReasonCache`, by ID or
+        title. Every item is removed before its reason is added, but the items are processed concurrently, so the
+        removal and reason requests of different items overlap and the removal runs at the ratelimit's throughput.
+
+        .. code-block:: python3
+
+            report = await subreddit.mod.remove(spam_items, reason="Rule 3: No spam", spam=True)
+
+        Parameters
+        ----------
+        items: Iterable or AsyncIterable
+            The comments, submissions or fullnames to remove.
+        reason: str or SubredditRemovalReason
+            The ID or title of one of this subreddit's removal reasons, or the removal reason itself.
+        mod_note: str
+            A message for the other moderators.
+        spam: bool
+            Whether the removals are used to train the subreddit's spam filter.
+        concurrency: int
+            The maximum number of items processed at once.
+        progress: Callable[[BulkResult, BulkReport], Any]
+            A function called with every result and the report so far as the items are processed.
+
+        Returns
+        -------
+        report: BulkReport
+            The per-item results and errors.
+
+        Raises
+        ------
+        KeyError
+            If this subreddit has no removal reason with the given ID or title.
+        """
+        if isinstance(reason, str):
+            reason = await self._reddit.removal_reason_cache.get(self._subreddit, reason)
+        return await self.bulk(items, "remove", spam=spam, mod_note=mod_note, reason=reason, concurrency=concurrency,
+                               progress=progress)
+
     async def settings(self) -> SubredditSettings:
         """
         Retrieve the settings for the subreddit this helper works for.
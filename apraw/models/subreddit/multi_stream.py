@@ -0,0 +1,351 @@
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .subreddit import Subreddit
+from ..helpers.generator import ListingGenerator
+from ..helpers.stream_scheduler import StreamScheduler, _StreamError
+from ..helpers.streamable import Streamable
+from ...const import API_PATH
+from ...utils import BoundedSet
+
+if TYPE_CHECKING:
+    from ..helpers.apraw_base import aPRAWBase
+    from ...reddit import Reddit
+
+
+class MultiSubredditStream:
+    """
+    Stream the new submissions or comments of many subreddits over combined ``/r/a+b+c`` listings.
+
+    Instead of polling every subreddit on its own, the subreddits are packed into groups that are requested through a
+    single combined listing each and polled by a :class:`~apraw.models.StreamScheduler`. Retrieved items are
+    demultiplexed back to the subreddit they were posted on, which is injected as their owner. Groups are periodically
+    rebalanced by each subreddit's traffic so busy subreddits don't push the items of quieter ones out of a page. If a
+    combined listing fails, for example because one of its subreddits is private or banned, the error is raised to the
+    consumers of all the subreddits in that group.
+
+    .. code-block:: python3
+
+        stream = MultiSubredditStream(reddit, ["aprawtest", "askreddit", "python"], listing="comments")
+
+        async for comment in stream.stream():
+            print(comment, (await comment.subreddit()).display_name)
+
+        async for comment in stream.stream("python"):
+            print(comment)
+
+    Members
+    -------
+    listing: str
+        The listing that is streamed, either ``"new"`` or ``"comments"``.
+    scheduler: StreamScheduler
+        The scheduler polling the combined listings.
+    max_group_size: int
+        The maximum number of subreddits in a combined listing.
+    max_path_length: int
+        The maximum length of the combined subreddit names in a listing path.
+    rebalance_interval: float
+        The number of seconds between rebalancing the groups by traffic.
+    """
+
+    ENDPOINTS = {
+        "new": "subreddit_new",
+        "comments": "subreddit_comments"
+    }
+
+    def __init__(self, reddit: 'Reddit', subreddits: Iterable[Union[str, Subreddit]], listing: str = "new",
+                 scheduler: StreamScheduler = None, max_group_size: int = 100, max_path_length: int = 2000,
+                 rebalance_interval: float = 300, smoothing: float = 0.3):
+        """
+        Create an instance of ``MultiSubredditStream``.
+
+        Parameters
+        ----------
+        reddit: Reddit
+            The :class:`~apraw.Reddit` instance with which requests are made.
+        subreddits: Iterable[Union[str, Subreddit]]
+            The subreddits or their display names to stream.
+        listing: str
+            The listing to stream, either ``"new"`` or ``"comments"``.
+        scheduler: StreamScheduler
+            The scheduler polling the combined listings, a new one is created if not given.
+        max_group_size: int
+            The maximum number of subreddits in a combined listing.
+        max_path_length: int
+            The maximum length of the combined subreddit names in a listing path.
+        rebalance_interval: float
+            The number of seconds between rebalancing the groups by traffic.
+        smoothing: float
+            The weight given to the latest observation when updating a subreddit's traffic.
+        """
+        if listing not in self.ENDPOINTS:
+            raise ValueError(f"Unsupported listing '{listing}', expected one of {', '.join(self.ENDPOINTS)}.")
+
+        self._reddit = reddit
+        self.listing = listing
+        self.scheduler = scheduler or StreamScheduler()
+        self.max_group_size = max_group_size
+        self.max_path_length = max_path_length
+        self.rebalance_interval = rebalance_interval
+
+        self._smoothing = smoothing
+        self._subreddits: Dict[str, Subreddit] = {}
+        self._rates: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._seen: Dict[str, BoundedSet] = {}
+        self._primed: Set[str] = set()
+        self._groups: List[Tuple[str, ...]] = []
+        self._tasks: Dict[Tuple[str, ...], asyncio.Task] = {}
+        self._consumers: Dict[Optional[str], List[Tuple[asyncio.Queue, bool]]] = {}
+        self._rebalance_task: Optional[asyncio.Task] = None
+        self._last_rebalance = time.monotonic()
+
+        for subreddit in subreddits:
+            self.add(subreddit)
+
+    @property
+    def groups(self) -> List[List[str]]:
+        """
+        Retrieve the current grouping of subreddits into combined listings.
+
+        Returns
+        -------
+        groups: List[List[str]]
+            The display names of the subreddits in each combined listing.
+        """
+        return [list(group) for group in (self._groups or self._pack())]
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        """
+        Retrieve the observed traffic of the subreddits.
+
+        Returns
+        -------
+        rates: Dict[str, float]
+            The smoothed number of new items per second by subreddit display name.
+        """
+        return {self._subreddits[key].display_name: rate for key, rate in self._rates.items()}
+
+    def add(self, subreddit: Union[str, Subreddit]):
+        """
+        Add a subreddit to the stream. It will be polled once the groups are rebalanced.
+
+        Parameters
+        ----------
+        subreddit: Union[str, Subreddit]
+            The subreddit or its display name.
+        """
+        if isinstance(subreddit, str):
+            subreddit = Subreddit(self._reddit, {"display_name": subreddit})
+
+        key = subreddit.display_name.lower()
+        if key not in self._subreddits:
+            self._subreddits[key] = subreddit
+            self._rates[key] = 0.0
+            self._counts[key] = 0
+            self._seen[key] = BoundedSet(301)
+
+    def remove(self, subreddit: Union[str, Subreddit]):
+        """
+        Remove a subreddit from the stream. It will no longer be polled once the groups are rebalanced.
+
+        Parameters
+        ----------
+        subreddit: Union[str, Subreddit]
+            The subreddit or its display name.
+        """
+        key = str(subreddit).lower()
+        for mapping in (self._subreddits, self._rates, self._counts, self._seen):
+            mapping.pop(key, None)
+        self._primed.discard(key)
+
+        # a group without any remaining subreddits would request an empty path until the next rebalance
+        for group in [g for g in self._groups if not any(k in self._subreddits for k in g)]:
+            self._groups.remove(group)
+            task = self._tasks.pop(group, None)
+            if task is not None:
+                task.cancel()
+
+    def _path(self, group: Tuple[str, ...]) -> str:
+        return "+".join(self._subreddits[key].display_name for key in group if key in self._subreddits)
+
+    def _capacity(self) -> float:
+        """
+        The number of new items per second a combined listing can carry when it's polled at the fastest interval.
+        """
+        return self.scheduler.fill_target * self.scheduler.limit / self.scheduler.min_wait
+
+    def _pack(self) -> List[Tuple[str, ...]]:
+        """
+        Pack the subreddits into groups using first-fit decreasing by traffic.
+
+        Busy subreddits are placed first so they end up in small groups while quiet ones fill the remaining groups up
+        to the size and path length limits.
+        """
+        capacity = self._capacity()
+        groups: List[List[Any]] = []
+
+        for key in sorted(self._subreddits, key=lambda k: self._rates[k], reverse=True):
+            rate = self._rates[key]
+            length = len(self._subreddits[key].display_name)
+
+            for group in groups:
+                members, load, path_length = group
+                if len(members) < self.max_group_size and path_length + length + 1 <= self.max_path_length and \
+                        load + rate <= capacity:
+                    members.append(key)
+                    group[1] += rate
+                    group[2] += length + 1
+                    break
+            else:
+                groups.append([[key], rate, length])
+
+        return [tuple(members) for members, _, _ in groups]
+
+    def rebalance(self):
+        """
+        Regroup the subreddits by their observed traffic and restart the combined listings that changed.
+        """
+        self._last_rebalance = time.monotonic()
+        self._groups = self._pack()
+
+        if not self._consumers:
+            return
+
+        groups = set(self._groups)
+        for group in list(self._tasks):
+            if group not in groups:
+                self._tasks.pop(group).cancel()
+
+        for group in self._groups:
+            if group not in self._tasks:
+                self._tasks[group] = asyncio.ensure_future(self._watch(group))
+
+    def _fetch(self, group: Tuple[str, ...], limit: int = 100, **kwargs) -> ListingGenerator:
+        endpoint = API_PATH[self.ENDPOINTS[self.listing]].format(sub=self._path(group))
+        return ListingGenerator(self._reddit, endpoint, limit=limit, **kwargs)
+
+    async def _watch(self, group: Tuple[str, ...]):
+        """
+        Stream a combined listing through the scheduler and dispatch its items.
+        """
+        name = f"{self.listing}:{id(self)}:{self._path(group)}"
+        polls, polled = 0, None
+
+        try:
+            async for item in Streamable(partial(self._fetch, group)).stream(scheduler=self.scheduler, name=name):
+                stats = self.scheduler.stats[name]
+                if stats.polls != polls:
+                    if polled is not None:
+                        self._observe(group, stats.last_poll - polled)
+                    polls, polled = stats.polls, stats.last_poll
+
+                self._dispatch(item, existing=polls == 1)
+        except Exception as e:
+            # the next rebalance restarts the group if it still has consumers
+            self._tasks.pop(group, None)
+            error = _StreamError(e)
+            for key in (None, *group):
+                for queue, _ in self._consumers.get(key, []):
+                    queue.put_nowait(error)
+
+    def _observe(self, group: Tuple[str, ...], elapsed: float):
+        """
+        Update the traffic of a group's subreddits with the items counted since the last observation.
+        """
+        for key in group:
+            if key not in self._subreddits:
+                continue
+            self._primed.add(key)
+            observed = self._counts[key] / max(elapsed, 1e-3)
+            self._rates[key] = self._smoothing * observed + (1 - self._smoothing) * self._rates[key]
+            self._counts[key] = 0
+
+    def _dispatch(self, item: 'aPRAWBase', existing: bool = False):
+        """
+        Hand an item to the consumers of its subreddit after injecting the subreddit as its owner.
+        """
+        key = str(item._data.get("subreddit", "")).lower()
+        if key not in self._subreddits:
+            return
+
+        seen = self._seen[key]
+        if item.fullname in seen:
+            return
+        seen.add(item.fullname)
+
+        existing = existing and key not in self._primed
+        self._counts[key] += 1
+        if hasattr(item, "_subreddit"):
+            item._subreddit = self._subreddits[key]
+
+        for queue, skip_existing in self._consumers.get(None, []) + self._consumers.get(key, []):
+            if not (existing and skip_existing):
+                queue.put_nowait(item)
+
+    async def _rebalance_periodically(self):
+        while self._consumers:
+            await asyncio.sleep(max(self.rebalance_interval - (time.monotonic() - self._last_rebalance), 0))
+            if time.monotonic() - self._last_rebalance >= self.rebalance_interval:
+                self.rebalance()
+
+    def _start(self):
+        # groups whose listing failed are restarted for new consumers
+        if not self._tasks or any(group not in self._tasks for group in self._groups):
+            self.rebalance()
+        if self._rebalance_task is None or self._rebalance_task.done():
+            self._rebalance_task = asyncio.ensure_future(self._rebalance_periodically())
+
+    def _stop(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        if self._rebalance_task is not None:
+            self._rebalance_task.cancel()
+            self._rebalance_task = None
+
+    async def stream(self, subreddit: Union[str, Subreddit] = None,
+                     skip_existing: bool = False) -> AsyncIterator['aPRAWBase']:
+        """
+        Stream the new items of all the subreddits, or a single one of them.
+
+        Parameters
+        ----------
+        subreddit: Union[str, Subreddit]
+            The subreddit or display name whose items should be yielded, ``None`` to yield the items of all subreddits.
+        skip_existing: bool
+            Whether items found on the first poll of a subreddit should be skipped.
+
+        Yields
+        ------
+        item: aPRAWBase
+            The new submissions or comments with their subreddit injected.
+
+        Raises
+        ------
+        Exception
+            The error that stopped the combined listing of a streamed subreddit.
+        """
+        key = str(subreddit).lower() if subreddit is not None else None
+        if key is not None and key not in self._subreddits:
+            raise ValueError(f"r/{subreddit} isn't part of this stream.")
+
+        consumer = (asyncio.Queue(), skip_existing)
+        self._consumers.setdefault(key, []).append(consumer)
+        self._start()
+
+        try:
+            while True:
+                item = await consumer[0].get()
+                if isinstance(item, _StreamError):
+                    raise item.error
+                yield item
+        finally:
+            self._consumers[key].remove(consumer)
+            if not self._consumers[key]:
+                del self._consumers[key]
+            if not self._consumers:
+                self._stop()
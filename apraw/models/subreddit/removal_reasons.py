@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Dict, Optional, Any, Union
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, Union
 
 from ..helpers.apraw_base import aPRAWBase
 from ...const import API_PATH
@@ -68,6 +70,7 @@ class SubredditRemovalReason(aPRAWBase):
             The API endpoint raw response.
         """
         res = await self._reddit.delete(self.url)
+        self._reddit.removal_reason_cache.invalidate(self._subreddit.display_name)
         return res
 
     async def update(self, title: Optional[str] = None, message: Optional[str] = None) -> Any:
@@ -91,6 +94,7 @@ class SubredditRemovalReason(aPRAWBase):
             for k, v in {"message": message, "title": title}.items()
         }
         await self._reddit.put(self.url, data=data)
+        self._reddit.removal_reason_cache.invalidate(self._subreddit.display_name)
 
     def __str__(self):
         """
@@ -129,21 +133,16 @@ class SubredditRemovalReasons:
         """
         Refresh the data for the subreddit removal reasons.
         """
-        url = API_PATH["subreddit_removal_reasons"].format(sub=self._subreddit.display_name)
-        res = await self._reddit.get(url)
-
-        for reason_id in res["order"]:
-            reason = SubredditRemovalReason(self._reddit, self._subreddit, res["data"][reason_id])
-            self._removal_reasons.append(reason)
+        self._removal_reasons = list(await self._reddit.removal_reason_cache.reasons(self._subreddit))
 
     async def get(self, item: Union[int, str]) -> SubredditRemovalReason:
         """
-        Retrieve a removal reason based on its ID or index.
+        Retrieve a removal reason based on its ID, title or index.
 
         Parameters
         ----------
         item: int or str
-            The item's ID or index.
+            The removal reason's ID or title, which is matched case-insensitively, or its index.
 
         Returns
         -------
@@ -152,18 +151,17 @@ class SubredditRemovalReasons:
 
         Raises
         ------
-        StopIteration
-            If no removal reason by the given ID was found.
+        KeyError
+            If no removal reason by the given ID or title was found.
         IndexError
             If the index given doesn't exist in the list of removal reasons.
         """
+        if isinstance(item, str):
+            return await self._reddit.removal_reason_cache.get(self._subreddit, item)
+
         if not self._removal_reasons:
             await self._fetch()
-
-        if isinstance(item, str):
-            return next(reason for reason in self._removal_reasons if reason.id == item)
-        else:
-            return self._removal_reasons[item]
+        return self._removal_reasons[item]
 
     def __aiter__(self):
         """
@@ -221,7 +219,124 @@ class SubredditRemovalReasons:
         url = API_PATH["subreddit_removal_reasons"].format(sub=self._subreddit.display_name)
 
         data = await self._reddit.post(url, data=data)
+        self._reddit.removal_reason_cache.invalidate(self._subreddit.display_name)
 
         reason = SubredditRemovalReason(self._reddit, self._subreddit, data)
         await reason.fetch()
         return reason
+
+
+class RemovalReasonCache:
+    """
+    A cache of the removal reasons of all subreddits shared by the helpers of a :class:`~apraw.Reddit` instance.
+
+    Each subreddit's removal reasons are fetched once per ``ttl`` and indexed by their ID and case-insensitive title,
+    so resolving the reason of every item in a mass removal doesn't repeat requests or scan the list. Concurrent
+    lookups of a subreddit that isn't cached yet share a single request. Adding, updating and deleting removal reasons
+    through aPRAW invalidates the subreddit's entry, along with the responses held by the :class:`~apraw.Reddit`
+    instance's :class:`~apraw.cache.ResponseCache` so the refetch isn't served a stale list.
+
+    Members
+    -------
+    ttl: float
+        The number of seconds a subreddit's removal reasons are cached for.
+    """
+
+    def __init__(self, reddit: 'Reddit', ttl: float = 300):
+        """
+        Create an instance of ``RemovalReasonCache``.
+
+        Parameters
+        ----------
+        reddit: Reddit
+            The :class:`~apraw.Reddit` instance with which requests are made.
+        ttl: float
+            The number of seconds a subreddit's removal reasons are cached for.
+        """
+        self._reddit = reddit
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, List[SubredditRemovalReason], Dict[str, SubredditRemovalReason]]] = {}
+        self._requests: Dict[str, asyncio.Future] = {}
+
+    async def _fetch(self, subreddit: 'Subreddit') -> Tuple[float, List[SubredditRemovalReason],
+                                                            Dict[str, SubredditRemovalReason]]:
+        url = API_PATH["subreddit_removal_reasons"].format(sub=subreddit.display_name)
+        res = await self._reddit.get(url)
+
+        reasons = [SubredditRemovalReason(self._reddit, subreddit, res["data"][reason_id])
+                   for reason_id in res["order"]]
+        index = {reason.title.lower(): reason for reason in reasons}
+        index.update({reason.id: reason for reason in reasons})
+        entry = self._entries[subreddit.display_name.lower()] = (time.monotonic() + self.ttl, reasons, index)
+        return entry
+
+    async def _entry(self, subreddit: 'Subreddit') -> Tuple[float, List[SubredditRemovalReason],
+                                                            Dict[str, SubredditRemovalReason]]:
+        key = subreddit.display_name.lower()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+
+        if key not in self._requests or self._requests[key].done():
+            self._requests[key] = asyncio.ensure_future(self._fetch(subreddit))
+        # the fetched entry is returned directly, as invalidate() may remove it from the cache in the meantime
+        return await asyncio.shield(self._requests[key])
+
+    async def reasons(self, subreddit: 'Subreddit') -> List[SubredditRemovalReason]:
+        """
+        Retrieve the removal reasons of a subreddit in the order they're configured in.
+
+        Parameters
+        ----------
+        subreddit: Subreddit
+            The subreddit whose removal reasons to retrieve.
+
+        Returns
+        -------
+        reasons: List[SubredditRemovalReason]
+            The subreddit's removal reasons.
+        """
+        return (await self._entry(subreddit))[1]
+
+    async def get(self, subreddit: 'Subreddit', key: str) -> SubredditRemovalReason:
+        """
+        Retrieve a removal reason of a subreddit by its ID or title.
+
+        Parameters
+        ----------
+        subreddit: Subreddit
+            The subreddit the removal reason belongs to.
+        key: str
+            The removal reason's ID or title, which is matched case-insensitively.
+
+        Returns
+        -------
+        reason: SubredditRemovalReason
+            The removal reason.
+
+        Raises
+        ------
+        KeyError
+            If the subreddit has no removal reason with the given ID or title.
+        """
+        index = (await self._entry(subreddit))[2]
+        reason = index.get(key) or index.get(key.lower())
+        if reason is None:
+            raise KeyError(f"r/{subreddit.display_name} has no removal reason '{key}'.")
+        return reason
+
+    def invalidate(self, subreddit: str = None):
+        """
+        Remove a subreddit's removal reasons from the cache, or clear the cache completely.
+
+        Parameters
+        ----------
+        subreddit: str
+            The display name of the subreddit, ``None`` to clear the cache.
+        """
+        subreddits = list(self._entries) if subreddit is None else [subreddit.lower()]
+        cache = self._reddit.request_handler.cache
+        for sub in subreddits:
+            self._entries.pop(sub, None)
+            if cache is not None:
+                cache.invalidate_subreddit(sub)
@@ -5,6 +5,7 @@ from urllib.parse import quote as urlencode
 import aiohttp
 
 from ..endpoints import API_PATH
+from ..utils import RateLimiter
 from .helpers.apraw_base import aPRAWBase
 from .helpers.generator import ListingGenerator
 from .helpers.streamable import streamable
@@ -45,10 +46,14 @@ class User:
         The number of requests previously used in the current ratelimit window.
     ratelimit_reset: datetime
         The datetime on which the ratelimit window will be reset.
+    ratelimiter: RateLimiter
+        The token bucket that paces requests made with these credentials.
+    connector_options: Dict
+        The keyword arguments used to create the ``aiohttp.TCPConnector`` shared by both sessions.
     """
 
     def __init__(self, reddit: 'Reddit', username: str, password: str, client_id: str,
-                 client_secret: str, user_agent: str):
+                 client_secret: str, user_agent: str, connector_options: Dict = None):
         """
         Create an instance of the authenticated user.
 
@@ -66,6 +71,8 @@ class User:
             The client secret given to the Reddit instance or obtained via ``praw.ini``.
         user_agent: str
             The user agent given to the Reddit instance or defaulted to aPRAW's version.
+        connector_options: Dict
+            Keyword arguments for the ``aiohttp.TCPConnector`` shared by the client and authentication sessions.
 
         Raises
         ------
@@ -87,7 +94,15 @@ class User:
         self.password_grant = "grant_type=password&username={}&password={}".format(
             urlencode(self.username), urlencode(self.password))
 
-        self._auth_session = None
+        self.connector_options = {
+            "limit": 100,
+            "limit_per_host": 0,
+            "keepalive_timeout": 30,
+            "ttl_dns_cache": 300,
+            **(connector_options or {})
+        }
+
+        self._connector = None
         self._client_session = None
 
         self._auth_user = None
@@ -98,22 +113,23 @@ class User:
         self.ratelimit_remaining = 0
         self.ratelimit_used = 0
         self.ratelimit_reset = datetime.now()
+        self.ratelimiter = RateLimiter()
 
-    async def auth_session(self) -> aiohttp.ClientSession:
+    def connector(self) -> aiohttp.TCPConnector:
         """
-        Retrieve an ``aiohttp.ClientSesssion`` with which the authentication token can be obtained.
+        Retrieve the ``aiohttp.TCPConnector`` whose connection pool is used by the client session.
+
+        Token and API requests are both made with the client session, so they reuse warm keep-alive connections
+        instead of performing new TLS handshakes under load.
 
         Returns
         -------
-        session: aiohttp.ClientSession
-            The session using the BasicAuth setup to obtain tokens with.
+        connector: aiohttp.TCPConnector
+            The connector configured with :attr:`connector_options`.
         """
-        if self._auth_session is None:
-            auth = aiohttp.BasicAuth(
-                login=self.client_id,
-                password=self.client_secret)
-            self._auth_session = aiohttp.ClientSession(auth=auth)
-        return self._auth_session
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(use_dns_cache=True, **self.connector_options)
+        return self._connector
 
     async def client_session(self) -> aiohttp.ClientSession:
         """
@@ -125,16 +141,14 @@ class User:
             The session with which requests should be made.
         """
         if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
+            self._client_session = aiohttp.ClientSession(connector=self.connector(), connector_owner=False)
         return self._client_session
 
     async def close(self):
-        auth_session = await self.auth_session()
-        if auth_session:
-            await auth_session.close()
-        client_session = await self.client_session()
-        if client_session:
-            await client_session.close()
+        if self._client_session is not None:
+            await self._client_session.close()
+        if self._connector is not None:
+            await self._connector.close()
 
     async def me(self) -> 'AuthenticatedUser':
         """
@@ -1,12 +1,17 @@
 import asyncio
 import configparser
 import os
-from typing import Dict, List, Union, Any
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Union, Any
 
+from .cache import ResponseCache
 from .endpoints import API_PATH
-from .models import (Comment, Listing, Redditor, Submission,
-                     Subreddit, User, ListingGenerator, streamable)
+from .models import (Comment, InfoLoader, InfoLookup, InfoResult, Listing, RemovalReasonCache, Redditor,
+                     Submission, Subreddit, User, ListingGenerator, streamable)
+from .metrics import MetricsRegistry
 from .request_handler import RequestHandler
+from .retry import RetryPolicy
+from .transport import Transport
 from .utils import prepend_kind
 
 if os.path.exists('praw.ini'):
@@ -51,11 +56,23 @@ class Reddit:
         The prefix that represents :class:`~apraw.models.MoreComments` in API responses, such as ``more``.
     request_handler: RequestHandler
         An instance of :class:`~apraw.RequestHandler` with which this Reddit instance will perform HTTP requests.
+    compact_models: bool
+        Whether models resolve their attributes lazily from the raw data instead of copying it onto the instance.
+    info_loader: InfoLoader
+        An instance of :class:`~apraw.models.InfoLoader` which coalesces individual ID lookups into batched requests.
+    removal_reason_cache: RemovalReasonCache
+        The :class:`~apraw.models.RemovalReasonCache` shared by all subreddits' removal reason helpers.
     """
 
     def __init__(self, praw_key: str = "", username: str = "", password: str = "",
                  client_id: str = "", client_secret: str = "",
-                 user_agent="aPRAW by Dan6erbond"):
+                 user_agent="aPRAW by Dan6erbond", connection_limit: int = 100, connection_limit_per_host: int = 0,
+                 keepalive_timeout: float = 30, dns_cache_ttl: int = 300, token_refresh_margin: float = 60,
+                 compact_models: bool = False, info_batch_window: float = 0.01,
+                 response_cache: ResponseCache = None, coalesce_requests: bool = True, transport: Transport = None,
+                 json_decoder: Union[str, Callable[[bytes], Any]] = None, decode_executor: Executor = None,
+                 decode_threshold: int = 256 * 1024, retry_policy: RetryPolicy = None, praw_keys: List[str] = None,
+                 metrics: MetricsRegistry = None):
         """
         Create a Reddit instance.
 
@@ -73,17 +90,75 @@ class Reddit:
             The Reddit script's client_secret.
         user_agent: str
             User agent to be used in the headers, defaults to "aPRAW by Dan6erbond".
+        connection_limit: int
+            The total number of simultaneous connections in the shared connection pool, ``0`` for no limit.
+        connection_limit_per_host: int
+            The number of simultaneous connections to a single host, ``0`` for no limit.
+        keepalive_timeout: float
+            The number of seconds idle connections are kept alive for reuse.
+        dns_cache_ttl: int
+            The number of seconds resolved DNS entries are cached, ``None`` to cache them forever.
+        token_refresh_margin: float
+            The number of seconds before the access token expires in which it is refreshed in the background.
+        compact_models: bool
+            Whether models resolve their attributes lazily from the raw data instead of copying it, which uses
+            considerably less memory when holding large numbers of comments or submissions.
+        info_batch_window: float
+            The number of seconds the :class:`~apraw.models.InfoLoader` collects ID lookups for before issuing a
+            single batched request.
+        response_cache: ResponseCache
+            A :class:`~apraw.cache.ResponseCache` to serve repeated GET requests for metadata such as subreddit and
+            user information from, ``None`` to disable caching.
+        coalesce_requests: bool
+            Whether concurrent identical GET requests share a single HTTP round trip and decoded response.
+        transport: Transport
+            The :class:`~apraw.transport.Transport` performing HTTP requests, defaults to an
+            :class:`~apraw.transport.AiohttpTransport`. A :class:`~apraw.transport.ReplayTransport` can be used to
+            serve recorded responses offline.
+        json_decoder: str or Callable
+            The JSON decoder used for response bodies, one of ``"orjson"``, ``"ujson"`` or ``"json"`` or a function
+            decoding bytes. Defaults to the fastest installed decoder.
+        decode_executor: Executor
+            An executor such as a ``ThreadPoolExecutor`` or ``ProcessPoolExecutor`` large responses are decoded in,
+            so a huge comment page doesn't stall other coroutines on the event loop. ``None`` decodes every response
+            on the event loop.
+        decode_threshold: int
+            The body size in bytes from which responses are decoded in the ``decode_executor``.
+        retry_policy: RetryPolicy
+            The :class:`~apraw.retry.RetryPolicy` used to retry failed requests, defaults to four attempts with an
+            exponential backoff. ``RetryPolicy(max_attempts=1)`` disables retrying.
+        praw_keys: List[str]
+            Further keys in the `praw.ini` file whose credentials form a pool with the main user. Read-only requests to
+            public listings are spread across the pool by remaining ratelimit budget, and are repeated by the main user
+            if the pooled user gets a 403 or 404, e.g. for private subreddits. Everything else, such as moderator
+            actions, the inbox or subreddit metadata, uses the main user.
+        metrics: MetricsRegistry
+            The :class:`~apraw.metrics.MetricsRegistry` requests are recorded in, defaults to a new registry.
         """
-        if praw_key != "":
-            config = configparser.ConfigParser()
+        connector_options = {
+            "limit": connection_limit,
+            "limit_per_host": connection_limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl
+        }
+
+        config = configparser.ConfigParser()
+        if praw_key != "" or praw_keys:
             config.read(_prawfile)
 
-            self.user = User(self, config[praw_key]["username"], config[praw_key]["password"],
-                             config[praw_key]["client_id"], config[praw_key]["client_secret"],
-                             config[praw_key]["user_agent"] if "user_agent" in config[praw_key] else user_agent)
+        def user_from_config(key: str) -> User:
+            return User(self, config[key]["username"], config[key]["password"],
+                        config[key]["client_id"], config[key]["client_secret"],
+                        config[key]["user_agent"] if "user_agent" in config[key] else user_agent,
+                        connector_options)
+
+        if praw_key != "":
+            self.user = user_from_config(praw_key)
         else:
             self.user = User(self, username, password,
-                             client_id, client_secret, user_agent)
+                             client_id, client_secret, user_agent, connector_options)
+
+        pool = [user_from_config(key) for key in praw_keys or [] if key != praw_key]
 
         self.comment_kind = "t1"
         self.account_kind = "t2"
@@ -98,8 +173,16 @@ class Reddit:
         self.more_kind = "more"
         self.subreddit_settings_kind = "subreddit_settings"
 
+        self.compact_models = compact_models
+
         self.loop = asyncio.get_event_loop()
-        self.request_handler = RequestHandler(self.user)
+        self.request_handler = RequestHandler(self.user, token_refresh_margin=token_refresh_margin,
+                                              cache=response_cache, coalesce_requests=coalesce_requests,
+                                              transport=transport, json_decoder=json_decoder,
+                                              decode_executor=decode_executor, decode_threshold=decode_threshold,
+                                              retry_policy=retry_policy, pool=pool, metrics=metrics)
+        self.info_loader = InfoLoader(self, info_batch_window)
+        self.removal_reason_cache = RemovalReasonCache(self)
 
     #: Streamable listing endpoint.
     @streamable
@@ -119,6 +202,18 @@ class Reddit:
         """
         return ListingGenerator(self, API_PATH["subreddits_new"], *args, **kwargs)
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """
+        Retrieve the metrics of the requests made by this Reddit instance.
+
+        Returns
+        -------
+        metrics: MetricsRegistry
+            The registry with per-endpoint request counts, statuses, latencies, sizes, retries and ratelimit telemetry.
+        """
+        return self.request_handler.metrics
+
     async def get(self, *args, **kwargs) -> Any:
         """
         Perform an HTTP GET request on the Reddit API.
@@ -252,7 +347,8 @@ class Reddit:
         id: str
             The item's ID.
         ids: List[str]
-            Multiple IDs to fetch multiple items at once (max 100).
+            Multiple IDs to fetch multiple items at once. They are requested concurrently in chunks of 100 and yielded
+            in the order they were given, use :meth:`lookup` to find out which ones weren't returned.
         url: str
             The item's URL.
 
@@ -267,16 +363,32 @@ class Reddit:
             for i in await self.get_listing(API_PATH["info"], id=id):
                 yield i
         elif ids:
-            while ids:
-                for i in await self.get_listing(API_PATH["info"], id=",".join(ids[:100])):
-                    yield i
-                ids = ids[100:]
+            for i in await self.lookup(ids):
+                yield i
         elif url:
             for i in await self.get_listing(API_PATH["info"], url=url):
                 yield i
         else:
             yield None
 
+    async def lookup(self, keys: List[Union[str, Any]], concurrency: int = 8) -> InfoResult:
+        """
+        Look up many items at once by their fullnames, permalinks, URLs or subreddit names.
+
+        Parameters
+        ----------
+        keys: List[Union[str, aPRAWBase]]
+            The keys to look up, which may be mixed. See :class:`~apraw.models.InfoLookup` for the accepted formats.
+        concurrency: int
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        result: InfoResult
+            The items in input order and the keys that weren't found.
+        """
+        return await InfoLookup(self, concurrency).fetch(keys)
+
     async def submission(self, id: str = "", url: str = "") -> Submission:
         """
         Get a `Submission` object based on its ID or URL.
@@ -1,55 +1,152 @@
 import asyncio
+import time
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Dict, Callable, Any, Awaitable, Optional
+from typing import Dict, Callable, Any, Awaitable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
-from multidict import CIMultiDictProxy
+from multidict import CIMultiDict
 
+from .cache import ResponseCache
 from .const import BASE_URL
+from .endpoints import MODERATION_ENDPOINTS, PUBLIC_ENDPOINTS, endpoint_subreddits, match_endpoint
+from .metrics import MetricsRegistry
 from .models import User
+from .retry import RetryPolicy
+from .transport import AiohttpTransport, Transport, TransportResponse
+from .utils import Priority, current_priority, get_decoder
 
 
 class RequestHandler:
 
-    def __init__(self, user: User):
+    def __init__(self, user: User, token_refresh_margin: float = 60, cache: ResponseCache = None,
+                 coalesce_requests: bool = True, transport: Transport = None,
+                 json_decoder: Union[str, Callable[[bytes], Any]] = None, decode_executor: Executor = None,
+                 decode_threshold: int = 256 * 1024, retry_policy: RetryPolicy = None, pool: List[User] = None,
+                 metrics: MetricsRegistry = None):
         self.user = user
-        self.queue = []
-
-    async def get_request_headers(self) -> Dict:
-        if self.user.token_expires <= datetime.now():
-            url = "https://www.reddit.com/api/v1/access_token"
-            session = await self.user.auth_session()
-
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": self.user.user_agent
-            }
+        self.users = [user, *(pool or [])]
+        self.transport = transport if transport is not None else AiohttpTransport(user)
+        self.token_refresh_margin = token_refresh_margin
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        self.loads = get_decoder(json_decoder)
+        self.decode_executor = decode_executor
+        self.decode_threshold = decode_threshold
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._token_requests: Dict[int, asyncio.Future] = {}
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    async def _request_token(self, user: User):
+        url = "https://www.reddit.com/api/v1/access_token"
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": user.user_agent
+        }
 
-            resp = await session.post(url, data=self.user.password_grant, headers=headers)
+        resp = await self.transport.request("POST", url, headers=headers, data=user.password_grant,
+                                            auth=(user.client_id, user.client_secret))
 
-            async with resp:
-                if resp.status == 200:
-                    self.user.access_data = await resp.json()
-                    self.user.token_expires = datetime.now(
-                    ) + timedelta(seconds=self.user.access_data["expires_in"])
-                else:
-                    raise Exception("Invalid user data.")
+        if resp.status == 200:
+            user.access_data = resp.json(self.loads)
+            user.token_expires = datetime.now(
+            ) + timedelta(seconds=user.access_data["expires_in"])
+        else:
+            raise Exception("Invalid user data.")
+
+    def _refresh_token(self, user: User) -> asyncio.Future:
+        # only one token request per user is in flight at a time, concurrent callers share its result
+        key = id(user)
+        if key not in self._token_requests:
+            def done(f: asyncio.Future):
+                self._token_requests.pop(key, None)
+                f.cancelled() or f.exception()
+
+            request = self._token_requests[key] = asyncio.ensure_future(self._request_token(user))
+            request.add_done_callback(done)
+        return self._token_requests[key]
+
+    async def get_request_headers(self, user: User = None) -> Dict:
+        user = user or self.user
+        now = datetime.now()
+        if user.access_data is None or user.token_expires <= now:
+            await asyncio.shield(self._refresh_token(user))
+        elif user.token_expires - timedelta(seconds=self.token_refresh_margin) <= now:
+            self._refresh_token(user)
 
         return {
-            "Authorization": "{} {}".format(self.user.access_data["token_type"], self.user.access_data["access_token"]),
-            "User-Agent": self.user.user_agent
+            "Authorization": "{} {}".format(user.access_data["token_type"], user.access_data["access_token"]),
+            "User-Agent": user.user_agent
         }
 
-    def update(self, data: CIMultiDictProxy):
-        if "x-ratelimit-remaining" in data:
-            self.user.ratelimit_remaining = int(float(data["x-ratelimit-remaining"]))
+    def update(self, data: CIMultiDict, user: User = None):
+        user = user or self.user
+        used = reset = None
         if "x-ratelimit-used" in data:
-            self.user.ratelimit_used = int(data["x-ratelimit-used"])
+            used = user.ratelimit_used = int(data["x-ratelimit-used"])
         if "x-ratelimit-reset" in data:
-            self.user.ratelimit_reset = datetime.now() + timedelta(seconds=int(data["x-ratelimit-reset"]))
+            reset = int(data["x-ratelimit-reset"])
+            user.ratelimit_reset = datetime.now() + timedelta(seconds=reset)
+        if "x-ratelimit-remaining" in data:
+            remaining = float(data["x-ratelimit-remaining"])
+            user.ratelimit_remaining = int(remaining)
+            user.ratelimiter.update(remaining, used, reset)
+            self.metrics.observe_budget(user.username, remaining, used, reset)
+
+    def select_user(self, method: str, url: str) -> User:
+        """
+        Choose the credentials a request is made with.
+
+        Read-only GET requests to public listings are routed to the user in the pool with the most ratelimit budget
+        available, while all other requests, which may depend on the account's identity, are made by the main user.
+        Public listings the pooled user can't access, such as those of private subreddits, are requested again by the
+        main user.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        url: str
+            The full URL of the request.
+
+        Returns
+        -------
+        user: User
+            The user whose token and ratelimiter are used for the request.
+        """
+        if len(self.users) == 1 or method != "GET" or match_endpoint(urlsplit(url).path) not in PUBLIC_ENDPOINTS:
+            return self.user
+        return max(self.users, key=lambda u: (u.ratelimiter.tokens, u.ratelimiter.remaining))
+
+    @staticmethod
+    def select_priority(method: str, url: str) -> Priority:
+        """
+        Determine the priority lane of a request.
+
+        Moderator actions are always sent with :attr:`~apraw.utils.Priority.HIGH` priority, other requests use the
+        priority of the current context set with :func:`~apraw.utils.priority`.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        url: str
+            The full URL of the request.
+
+        Returns
+        -------
+        priority: Priority
+            The priority the request acquires its ratelimit token with.
+        """
+        if method != "GET" and match_endpoint(urlsplit(url).path) in MODERATION_ENDPOINTS:
+            return Priority.HIGH
+        return current_priority()
 
     async def close(self):
-        await self.user.close()
+        await self.transport.close()
 
     class Decorators:
 
@@ -58,85 +155,119 @@ class RequestHandler:
                 cls, func: Callable[[Any, Any], Awaitable[Any]]) -> Callable[[Any, Any], Awaitable[Any]]:
             @wraps(func)
             async def execute_request(self, *args, **kwargs) -> Any:
-                id = datetime.now().strftime('%Y%m%d%H%M%S')
-                self.queue.append(id)
-
-                if self.user.ratelimit_remaining < 1:
-                    execution_time = self.user.ratelimit_reset + \
-                                     timedelta(seconds=len(self.queue))
-                    wait_time = (execution_time - datetime.now()).total_seconds()
-                    await asyncio.sleep(wait_time)
-
-                result = await func(self, *args, **kwargs)
-                self.queue.remove(id)
-                return result
+                user = kwargs.get("user") or self.user
+                start = time.perf_counter()
+                await user.ratelimiter.acquire(kwargs.get("priority", Priority.NORMAL))
+                # the time spent waiting is passed on so it can be recorded in the metrics
+                return await func(self, *args, ratelimit_wait=time.perf_counter() - start, **kwargs)
 
             return execute_request
 
-    @Decorators.check_ratelimit
-    async def get(self, endpoint: Optional[str] = "", _url: Optional[str] = "", **kwargs) -> Any:
+    @staticmethod
+    def _url(endpoint: str = "", url: str = "", **kwargs) -> str:
         kwargs = {"raw_json": 1, "api_type": "json", **kwargs}
-        params = ["{}={}".format(k, kwargs[k]) for k in kwargs]
+        params = "&".join(["{}={}".format(k, kwargs[k]) for k in kwargs])
 
         if endpoint:
-            url = BASE_URL.format(endpoint, "&".join(params))
-        elif _url:
-            url = _url + "?" + "&".join(params)
-        else:
-            raise ValueError("One of endpoint or _url must be specified.")
-
-        headers = await self.get_request_headers()
-        session = await self.user.client_session()
-        resp = await session.get(url, headers=headers)
-
-        async with resp:
-            self.update(resp.headers)
-            return await resp.json()
+            return BASE_URL.format(endpoint, params)
+        elif url:
+            return "{}?{}".format(url, params)
+        raise ValueError("One of endpoint or url must be specified.")
+
+    def _invalidate(self, url: str):
+        # writes can change any cached read of their subreddit, e.g. a wiki edit changes the cached wiki page
+        if self.cache is None:
+            return
+        self.cache.invalidate(url)
+        for sub in endpoint_subreddits(urlsplit(url).path):
+            self.cache.invalidate_subreddit(sub)
+
+    async def _decode(self, resp: TransportResponse) -> Any:
+        # large bodies are decoded in the executor so they don't block other coroutines on the event loop
+        if self.decode_executor is None or len(resp.body) < self.decode_threshold:
+            return resp.json(self.loads)
+        return await asyncio.get_event_loop().run_in_executor(self.decode_executor, self.loads, resp.body)
 
     @Decorators.check_ratelimit
-    async def delete(self, endpoint: str = "", **kwargs) -> Any:
-        kwargs = {"raw_json": 1, "api_type": "json", **kwargs}
-        params = ["{}={}".format(k, kwargs[k]) for k in kwargs]
+    async def _send(self, method: str, url: str, data: Dict = None, user: User = None,
+                    priority: Priority = Priority.NORMAL, ratelimit_wait: float = 0) -> TransportResponse:
+        headers = await self.get_request_headers(user)
+
+        start = time.perf_counter()
+        try:
+            resp = await self.transport.request(method, url, headers=headers, data=data)
+        except Exception:
+            self.metrics.observe_request(url, method, None, time.perf_counter() - start, ratelimit_wait=ratelimit_wait)
+            raise
+        self.metrics.observe_request(url, method, resp.status, time.perf_counter() - start, len(resp.body),
+                                     ratelimit_wait)
+
+        self.update(resp.headers, user)
+        return resp
+
+    async def _request(self, method: str, url: str, data: Dict = None) -> TransportResponse:
+        # every attempt acquires its own ratelimit token and fresh headers, possibly from another user in the pool
+        priority = self.select_priority(method, url)
+        attempts = 0
+
+        async def send() -> TransportResponse:
+            nonlocal attempts
+            attempts += 1
+            user = self.select_user(method, url)
+            resp = await self._send(method, url, data, user=user, priority=priority)
+            if user is not self.user and resp.status in (403, 404):
+                # the pooled account may lack access, e.g. to a private subreddit the main user is a member of
+                resp = await self._send(method, url, data, user=self.user, priority=priority)
+            return resp
+
+        try:
+            return await self.retry_policy.execute(method, url, send)
+        finally:
+            self.metrics.observe_retries(url, method, attempts - 1)
+
+    async def _get(self, url: str) -> Tuple[int, Any]:
+        resp = await self._request("GET", url)
+        return resp.status, await self._decode(resp)
+
+    async def _coalesced_get(self, url: str) -> Tuple[int, Any]:
+        # concurrent identical GETs share a single request and its decoded result
+        if not self.coalesce_requests:
+            return await self._get(url)
+
+        key = ("GET", url)
+        if key not in self._in_flight:
+            def done(f: asyncio.Future):
+                self._in_flight.pop(key, None)
+                f.cancelled() or f.exception()
+
+            request = asyncio.ensure_future(self._get(url))
+            request.add_done_callback(done)
+            self._in_flight[key] = request
+
+        return await asyncio.shield(self._in_flight[key])
 
-        url = BASE_URL.format(endpoint, "&".join(params))
-
-        headers = await self.get_request_headers()
-        session = await self.user.client_session()
-        resp = await session.delete(url, headers=headers)
-
-        async with resp:
-            self.update(resp.headers)
-            return await resp.json()
+    async def get(self, endpoint: Optional[str] = "", _url: Optional[str] = "", **kwargs) -> Any:
+        url = self._url(endpoint, _url, **kwargs)
 
-    @Decorators.check_ratelimit
-    async def put(self, endpoint: str = "", data: Dict = None, **kwargs) -> Any:
-        kwargs = {"raw_json": 1, "api_type": "json", **kwargs}
-        params = ["{}={}".format(k, kwargs[k]) for k in kwargs]
+        if self.cache is not None and endpoint:
+            return await self.cache.get(endpoint, url, lambda: self._coalesced_get(url))
 
-        url = BASE_URL.format(endpoint, "&".join(params))
+        return (await self._coalesced_get(url))[1]
 
-        headers = await self.get_request_headers()
-        session = await self.user.client_session()
-        resp = await session.delete(url, data=data, headers=headers)
+    async def delete(self, endpoint: str = "", **kwargs) -> Any:
+        url = self._url(endpoint, **kwargs)
+        resp = await self._request("DELETE", url)
+        self._invalidate(url)
+        return await self._decode(resp)
 
-        async with resp:
-            self.update(resp.headers)
-            return await resp.json()
+    async def put(self, endpoint: str = "", data: Dict = None, **kwargs) -> Any:
+        url = self._url(endpoint, **kwargs)
+        resp = await self._request("PUT", url, data)
+        self._invalidate(url)
+        return await self._decode(resp)
 
-    @Decorators.check_ratelimit
     async def post(self, endpoint: str = "", url: str = "", data: Dict = None, **kwargs) -> Any:
-        kwargs = {"raw_json": 1, "api_type": "json", **kwargs}
-        params = ["{}={}".format(k, kwargs[k]) for k in kwargs]
-
-        if endpoint:
-            url = BASE_URL.format(endpoint, "&".join(params))
-        elif url:
-            url = "{}?{}".format(url, "&".join(params))
-
-        headers = await self.get_request_headers()
-        session = await self.user.client_session()
-        resp = await session.post(url, data=data, headers=headers)
-
-        async with resp:
-            self.update(resp.headers)
-            return await resp.json()
+        url = self._url(endpoint, url, **kwargs)
+        resp = await self._request("POST", url, data)
+        self._invalidate(url)
+        return await self._decode(resp)
@@ -0,0 +1,234 @@
+"""Retrying of failed requests."""
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, Iterable, Optional, Tuple, Type
+
+import aiohttp
+
+from .transport import TransportResponse
+from .utils import ExponentialCounter
+
+#: The methods that can be repeated without applying their effect twice.
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class RetryError(Exception):
+    """
+    Raised when a request still fails after all the attempts allowed by the :class:`RetryPolicy`.
+
+    Members
+    -------
+    method: str
+        The HTTP method of the request.
+    url: str
+        The URL of the request.
+    attempts: int
+        The number of attempts made.
+    response: TransportResponse
+        The last response received, ``None`` if the last attempt raised an exception.
+    """
+
+    def __init__(self, method: str, url: str, attempts: int, response: Optional[TransportResponse] = None):
+        self.method = method
+        self.url = url
+        self.attempts = attempts
+        self.response = response
+        reason = f"status {response.status}" if response is not None else "a connection error"
+        super().__init__(f"{method} {url} failed with {reason} after {attempts} attempt(s).")
+
+
+class RetryPolicy:
+    """
+    The policy deciding which failed requests are retried and how long to wait in between attempts.
+
+    Responses with a status in ``statuses`` and connection errors are retried with an exponential backoff with jitter.
+    A ``Retry-After`` header, or the ``x-ratelimit-reset`` header of a 429 response, takes precedence over the backoff.
+    Requests using a method that isn't idempotent, such as the ``POST`` requests of moderator actions, are only retried
+    on statuses in ``non_idempotent_statuses`` for which Reddit didn't process the request, so they're never applied
+    twice. Their other failures in ``statuses`` raise a :class:`RetryError` right away instead of returning an error
+    page that can't be decoded.
+
+    The counters can be used for monitoring and are shared by all the requests using this policy.
+
+    .. code-block:: python3
+
+        reddit = apraw.Reddit(praw_key="...", retry_policy=RetryPolicy(max_attempts=6))
+
+    Members
+    -------
+    max_attempts: int
+        The maximum number of attempts per request including the first one, ``1`` to disable retrying.
+    backoff: float
+        The number of seconds to wait before the first retry, doubled on every further retry.
+    max_backoff: float
+        The maximum number of seconds to wait in between two attempts based on the backoff.
+    max_retry_after: float
+        The maximum number of seconds a ``Retry-After`` header is honored for, longer waits fail the request.
+    statuses: Tuple[int]
+        The HTTP statuses that are retried.
+    non_idempotent_statuses: Tuple[int]
+        The HTTP statuses that are retried for methods that aren't idempotent.
+    exceptions: Tuple[Type[Exception]]
+        The exceptions raised by the transport that are retried for idempotent methods.
+    retries: int
+        The total number of retries.
+    recovered: int
+        The number of requests that succeeded after at least one retry.
+    exhausted: int
+        The number of requests that failed after all the attempts.
+    reasons: Counter
+        The number of retries by status code, or exception name for connection errors.
+    """
+
+    def __init__(self, max_attempts: int = 4, backoff: float = 1, max_backoff: float = 32,
+                 max_retry_after: float = 120, statuses: Iterable[int] = (429, 500, 502, 503, 504, 522),
+                 non_idempotent_statuses: Iterable[int] = (429,),
+                 exceptions: Tuple[Type[Exception], ...] = (aiohttp.ClientConnectionError, asyncio.TimeoutError,
+                                                            ConnectionError)):
+        """
+        Create an instance of ``RetryPolicy``.
+
+        Parameters
+        ----------
+        max_attempts: int
+            The maximum number of attempts per request including the first one, ``1`` to disable retrying.
+        backoff: float
+            The number of seconds to wait before the first retry, doubled on every further retry.
+        max_backoff: float
+            The maximum number of seconds to wait in between two attempts based on the backoff.
+        max_retry_after: float
+            The maximum number of seconds a ``Retry-After`` header is honored for, longer waits fail the request.
+        statuses: Iterable[int]
+            The HTTP statuses that are retried.
+        non_idempotent_statuses: Iterable[int]
+            The HTTP statuses that are retried for methods that aren't idempotent.
+        exceptions: Tuple[Type[Exception]]
+            The exceptions raised by the transport that are retried for idempotent methods.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = tuple(statuses)
+        self.non_idempotent_statuses = tuple(non_idempotent_statuses)
+        self.exceptions = exceptions
+
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.reasons = Counter()
+
+    def should_retry(self, method: str, status: int) -> bool:
+        """
+        Check whether a response with the given status is retried.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        status: int
+            The HTTP status of the response.
+
+        Returns
+        -------
+        retry: bool
+            Whether the request is retried.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return status in self.statuses
+        return status in self.non_idempotent_statuses
+
+    def retry_after(self, resp: TransportResponse) -> Optional[float]:
+        """
+        Get the number of seconds the server asked to wait before retrying.
+
+        Parameters
+        ----------
+        resp: TransportResponse
+            The failed response.
+
+        Returns
+        -------
+        seconds: float
+            The number of seconds to wait, ``None`` if the response doesn't specify it.
+        """
+        for header in ("retry-after", "x-ratelimit-reset" if resp.status == 429 else None):
+            if header and header in resp.headers:
+                try:
+                    return max(0.0, float(resp.headers[header]))
+                except ValueError:
+                    continue
+        return None
+
+    def _delay(self, counter: ExponentialCounter, resp: Optional[TransportResponse]) -> Optional[float]:
+        # the counter yields 2, 4, 8... with jitter, so the first retry waits ``backoff`` seconds
+        backoff = min(self.backoff * counter.count() / 2, self.max_backoff)
+        retry_after = self.retry_after(resp) if resp is not None else None
+        if retry_after is None:
+            return backoff
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+    async def execute(self, method: str, url: str,
+                      send: Callable[[], Awaitable[TransportResponse]]) -> TransportResponse:
+        """
+        Perform a request, retrying it according to this policy.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        url: str
+            The URL of the request, used in error messages.
+        send: Callable[[], Awaitable[TransportResponse]]
+            A coroutine function performing a single attempt.
+
+        Returns
+        -------
+        response: TransportResponse
+            The first response that isn't retried.
+
+        Raises
+        ------
+        RetryError
+            If the request still fails after all the attempts, a request that isn't idempotent fails with a status in
+            ``statuses``, or the server asks to wait longer than ``max_retry_after``.
+        """
+        counter = ExponentialCounter(int(self.max_backoff * 2 / self.backoff) if self.backoff else 1)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(1, self.max_attempts + 1):
+            resp = None
+            try:
+                resp = await send()
+            except self.exceptions as e:
+                if not idempotent or attempt == self.max_attempts:
+                    self.exhausted += 1
+                    raise RetryError(method, url, attempt) from e
+                reason = type(e).__name__
+            else:
+                if not self.should_retry(method, resp.status):
+                    if resp.status in self.statuses:
+                        # a server error that isn't retried for this method, its body is usually an HTML error page
+                        break
+                    if attempt > 1:
+                        self.recovered += 1
+                    return resp
+                if attempt == self.max_attempts:
+                    break
+                reason = resp.status
+
+            delay = self._delay(counter, resp)
+            if delay is None:
+                break
+
+            self.retries += 1
+            self.reasons[reason] += 1
+            await asyncio.sleep(delay)
+
+        self.exhausted += 1
+        raise RetryError(method, url, attempt, resp)
+
+    def __repr__(self):
+        return f"<RetryPolicy max_attempts={self.max_attempts} retries={self.retries} exhausted={self.exhausted}>"
@@ -0,0 +1,5 @@
+from .aiohttp_transport import AiohttpTransport
+from .base import Transport, TransportResponse
+from .httpx_transport import HttpxTransport
+from .local import LocalTransport
+from .recording import RecordingTransport, ReplayTransport
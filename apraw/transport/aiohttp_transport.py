@@ -0,0 +1,40 @@
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+import aiohttp
+
+from .base import Transport, TransportResponse
+
+if TYPE_CHECKING:
+    from ..models import User
+
+
+class AiohttpTransport(Transport):
+    """
+    The default transport performing requests with the ``aiohttp.ClientSession`` of a :class:`~apraw.models.User`.
+
+    All requests share the user's connection pool, and basic authentication is applied per request so token requests
+    reuse the same session as regular API requests.
+    """
+
+    def __init__(self, user: 'User'):
+        """
+        Create an instance of ``AiohttpTransport``.
+
+        Parameters
+        ----------
+        user: User
+            The user whose session and connector are used.
+        """
+        self.user = user
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None, auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        session = await self.user.client_session()
+        resp = await session.request(method, url, headers=headers, data=data,
+                                     auth=aiohttp.BasicAuth(*auth) if auth else None)
+
+        async with resp:
+            return TransportResponse(resp.status, resp.headers, await resp.read())
+
+    async def close(self):
+        await self.user.close()
@@ -0,0 +1,113 @@
+import json
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from multidict import CIMultiDict
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+
+
+class TransportResponse:
+    """
+    A response returned by a :class:`Transport`.
+
+    Members
+    -------
+    status: int
+        The HTTP status code.
+    headers: CIMultiDict
+        The case-insensitive response headers.
+    body: bytes
+        The raw response body.
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str] = None, body: bytes = b""):
+        """
+        Create an instance of ``TransportResponse``.
+
+        Parameters
+        ----------
+        status: int
+            The HTTP status code.
+        headers: Mapping[str, str]
+            The response headers.
+        body: bytes
+            The raw response body.
+        """
+        self.status = status
+        self.headers = CIMultiDict(headers or {})
+        self.body = body
+
+    def json(self, loads: Callable[[bytes], Any] = None) -> Any:
+        """
+        Decode the response body as JSON.
+
+        Parameters
+        ----------
+        loads: Callable[[bytes], Any]
+            The function decoding the raw body, defaults to :func:`json.loads`.
+
+        Returns
+        -------
+        data: Any
+            The decoded body, ``None`` if the body is empty.
+        """
+        if not self.body.strip():
+            return None
+        return (loads or json.loads)(self.body)
+
+    def __repr__(self):
+        return f"<TransportResponse status={self.status} length={len(self.body)}>"
+
+
+class Transport:
+    """
+    The base class for the HTTP backends used by :class:`~apraw.RequestHandler`.
+
+    Transports only move bytes: they perform a request and return the status, headers and raw body, while
+    authentication headers, ratelimiting and decoding are handled by the request handler. Subclasses need to implement
+    :meth:`request` and may override :meth:`close`.
+    """
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None, auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        """
+        Perform an HTTP request.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method such as ``GET`` or ``POST``.
+        url: str
+            The full URL including the query string.
+        headers: Dict[str, str]
+            The request headers.
+        data: Union[Dict, str, bytes]
+            The form data or raw body to send.
+        auth: Tuple[str, str]
+            A login and password for HTTP basic authentication.
+
+        Returns
+        -------
+        response: TransportResponse
+            The response.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """
+        Release the resources held by this transport.
+        """
+        pass
+
+
+def fake_token_response() -> TransportResponse:
+    """
+    Build a successful token response for transports that don't talk to Reddit.
+
+    Returns
+    -------
+    response: TransportResponse
+        A response containing a bearer token valid for an hour.
+    """
+    body = {"access_token": "local", "token_type": "bearer", "expires_in": 3600, "scope": "*"}
+    return TransportResponse(200, {"content-type": "application/json"}, json.dumps(body).encode())
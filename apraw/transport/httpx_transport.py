@@ -0,0 +1,84 @@
+from typing import Dict, Optional, Tuple, Union
+
+from .base import Transport, TransportResponse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class HttpxTransport(Transport):
+    """
+    A transport multiplexing requests over HTTP/2 connections with `httpx <https://www.python-httpx.org/>`_.
+
+    With HTTP/2 many concurrent requests share a handful of connections to ``oauth.reddit.com`` instead of opening one
+    connection per request in flight, which keeps hundreds of concurrent streams from exhausting the connection pool.
+
+    .. note::
+        This transport requires the optional ``httpx`` dependency with HTTP/2 support, which can be installed with
+        ``pip install aPRAW[http2]``.
+
+    .. code-block:: python3
+
+        reddit = apraw.Reddit(praw_key="...", transport=HttpxTransport(max_connections=4))
+
+    Members
+    -------
+    http2: bool
+        Whether HTTP/2 is negotiated with the server.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10, keepalive_expiry: float = 30,
+                 timeout: float = 30):
+        """
+        Create an instance of ``HttpxTransport``.
+
+        Parameters
+        ----------
+        http2: bool
+            Whether HTTP/2 is negotiated with the server.
+        max_connections: int
+            The maximum number of connections in the pool.
+        keepalive_expiry: float
+            The number of seconds idle connections are kept alive for reuse.
+        timeout: float
+            The number of seconds before a request times out.
+
+        Raises
+        ------
+        ImportError
+            If ``httpx`` isn't installed.
+        """
+        if httpx is None:
+            raise ImportError("HttpxTransport requires httpx, install it with 'pip install aPRAW[http2]'.")
+
+        self.http2 = http2
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                                    keepalive_expiry=keepalive_expiry)
+        self._timeout = timeout
+        self._client: Optional['httpx.AsyncClient'] = None
+
+    def client(self) -> 'httpx.AsyncClient':
+        """
+        Retrieve the ``httpx.AsyncClient`` performing the requests, creating it on first use.
+
+        Returns
+        -------
+        client: httpx.AsyncClient
+            The client.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(http2=self.http2, limits=self._limits, timeout=self._timeout)
+        return self._client
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None,
+                      auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        body = {"content": data} if isinstance(data, (str, bytes)) else {"data": data}
+        resp = await self.client().request(method, url, headers=headers, auth=auth, **body)
+        return TransportResponse(resp.status_code, resp.headers, resp.content)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
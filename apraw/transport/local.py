@@ -0,0 +1,63 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from .base import TOKEN_URL, Transport, TransportResponse, fake_token_response
+
+LocalHandler = Callable[[str, str, Dict[str, str], Any], Union[Any, Awaitable[Any]]]
+
+
+class LocalTransport(Transport):
+    """
+    A transport that dispatches requests to an in-process handler instead of the network.
+
+    The handler is called with the method, URL, headers and data of every request and may be a regular or coroutine
+    function. It can return a :class:`TransportResponse`, a ``(status, body)`` tuple or a JSON serializable body which
+    is returned with a ``200`` status. Token requests are answered with a fake token unless ``fake_token`` is
+    disabled.
+
+    .. code-block:: python3
+
+        async def handler(method, url, headers, data):
+            return {"kind": "t5", "data": {"display_name": "aPRAWTest"}}
+
+        reddit = apraw.Reddit(praw_key="...", transport=LocalTransport(handler))
+
+    Members
+    -------
+    handler: Callable
+        The function handling the requests.
+    """
+
+    def __init__(self, handler: LocalHandler, fake_token: bool = True):
+        """
+        Create an instance of ``LocalTransport``.
+
+        Parameters
+        ----------
+        handler: Callable
+            The function handling the requests.
+        fake_token: bool
+            Whether token requests are answered with a fake token instead of being passed to the handler.
+        """
+        self.handler = handler
+        self.fake_token = fake_token
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None,
+                      auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        if self.fake_token and url.startswith(TOKEN_URL):
+            return fake_token_response()
+
+        resp = self.handler(method.upper(), url, headers or {}, data)
+        if asyncio.iscoroutine(resp):
+            resp = await resp
+
+        if isinstance(resp, TransportResponse):
+            return resp
+
+        status = 200
+        if isinstance(resp, tuple):
+            status, resp = resp
+        body = resp if isinstance(resp, bytes) else resp.encode() if isinstance(resp, str) else json.dumps(resp).encode()
+        return TransportResponse(status, {"content-type": "application/json"}, body)
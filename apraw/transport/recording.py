@@ -0,0 +1,292 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .base import TOKEN_URL, Transport, TransportResponse, fake_token_response
+
+#: Response headers kept in cassettes, everything else is dropped.
+RECORDED_HEADERS = ("content-type", "x-ratelimit-remaining", "x-ratelimit-used", "x-ratelimit-reset")
+
+#: Query parameters added to every request, which are ignored when matching requests.
+IGNORED_PARAMS = ("raw_json", "api_type")
+
+
+def request_key(method: str, url: str, match_params: bool = True) -> Tuple:
+    """
+    Build the key a request is matched by, ignoring the host, parameter order and the parameters added to every request.
+
+    Parameters
+    ----------
+    method: str
+        The HTTP method.
+    url: str
+        The full URL or path of the request.
+    match_params: bool
+        Whether the query parameters are part of the key.
+
+    Returns
+    -------
+    key: Tuple
+        The hashable request key.
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    if not match_params:
+        return method.upper(), path
+    params = tuple(sorted((k, v) for k, v in parse_qsl(parts.query) if k not in IGNORED_PARAMS))
+    return method.upper(), path, params
+
+
+class RecordingTransport(Transport):
+    """
+    A transport that records the traffic of another transport to a cassette file.
+
+    Token requests aren't recorded and only the ratelimit and content type headers are kept, so cassettes don't
+    contain credentials.
+
+    .. code-block:: python3
+
+        transport = RecordingTransport(AiohttpTransport(user), "cassettes/aprawtest.json")
+        reddit = apraw.Reddit(praw_key="...", transport=transport)
+
+    Members
+    -------
+    transport: Transport
+        The transport performing the requests.
+    path: str
+        The cassette file the interactions are saved to on :meth:`close`.
+    interactions: List[Dict]
+        The recorded requests and their responses.
+    """
+
+    def __init__(self, transport: Transport, path: str = None):
+        """
+        Create an instance of ``RecordingTransport``.
+
+        Parameters
+        ----------
+        transport: Transport
+            The transport performing the requests.
+        path: str
+            The cassette file the interactions are saved to on :meth:`close`.
+        """
+        self.transport = transport
+        self.path = path
+        self.interactions: List[Dict[str, Any]] = []
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None, auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        resp = await self.transport.request(method, url, headers=headers, data=data, auth=auth)
+
+        if not url.startswith(TOKEN_URL):
+            self.interactions.append({
+                "request": {"method": method.upper(), "url": url},
+                "response": {
+                    "status": resp.status,
+                    "headers": {k: resp.headers[k] for k in RECORDED_HEADERS if k in resp.headers},
+                    "body": resp.body.decode("utf-8")
+                }
+            })
+
+        return resp
+
+    def save(self, path: str = None):
+        """
+        Write the recorded interactions to a cassette file.
+
+        Parameters
+        ----------
+        path: str
+            The file to write to, defaults to :attr:`path`.
+        """
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"version": 1, "interactions": self.interactions}, f, indent=2)
+
+    async def close(self):
+        if self.path:
+            self.save()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    A transport serving recorded responses without network access, for tests and reproducible benchmarks.
+
+    Requests are matched by method, path and query parameters, falling back to the method and path alone. Repeated
+    requests for the same key are served the recorded responses in order, repeating the last one. Token requests are
+    answered with a fake token, and ``x-ratelimit-*`` headers are simulated for a ratelimit of ``ratelimit`` requests
+    per ``window`` seconds.
+
+    .. code-block:: python3
+
+        transport = ReplayTransport.from_dumps({
+            "/r/aPRAWTest/about": "subreddit.json",
+            "/message/inbox": "inbox.json"
+        }, latency=0.05)
+        reddit = apraw.Reddit(username="...", password="...", client_id="...", client_secret="...",
+                              transport=transport)
+
+    Members
+    -------
+    latency: float
+        The number of seconds each request takes.
+    ratelimit: int
+        The number of requests allowed per ratelimit window.
+    window: float
+        The length of the simulated ratelimit window in seconds.
+    requests: List[Tuple[str, str]]
+        The method and URL of every request that was served.
+    """
+
+    def __init__(self, interactions: List[Dict[str, Any]] = None, latency: float = 0.0, ratelimit: int = 600,
+                 window: float = 600, strict: bool = False):
+        """
+        Create an instance of ``ReplayTransport``.
+
+        Parameters
+        ----------
+        interactions: List[Dict]
+            The interactions as recorded by :class:`RecordingTransport`.
+        latency: float
+            The number of seconds each request takes.
+        ratelimit: int
+            The number of requests allowed per ratelimit window.
+        window: float
+            The length of the simulated ratelimit window in seconds.
+        strict: bool
+            Whether unmatched requests raise a ``LookupError`` instead of returning a 404 response.
+        """
+        self.latency = latency
+        self.ratelimit = ratelimit
+        self.window = window
+        self.strict = strict
+        self.requests: List[Tuple[str, str]] = []
+
+        self._responses: Dict[Tuple, List[Dict[str, Any]]] = {}
+        self._served: Dict[Tuple, int] = {}
+        self._window_start = time.monotonic()
+        self._used = 0
+
+        for interaction in interactions or []:
+            request, response = interaction["request"], interaction["response"]
+            self.add(request["method"], request["url"], response["body"], response["status"], response["headers"])
+
+    @classmethod
+    def from_cassette(cls, path: str, **kwargs) -> 'ReplayTransport':
+        r"""
+        Create a ``ReplayTransport`` from a cassette file written by :class:`RecordingTransport`.
+
+        Parameters
+        ----------
+        path: str
+            The cassette file.
+        kwargs: \*\*Dict
+            Keyword arguments passed on to the constructor.
+
+        Returns
+        -------
+        transport: ReplayTransport
+            The transport serving the cassette's responses.
+        """
+        with open(path) as f:
+            return cls(json.load(f)["interactions"], **kwargs)
+
+    @classmethod
+    def from_dumps(cls, routes: Dict[str, str], directory: str = None, **kwargs) -> 'ReplayTransport':
+        r"""
+        Create a ``ReplayTransport`` serving captured responses such as the ones in ``requests/dumps``.
+
+        Parameters
+        ----------
+        routes: Dict[str, str]
+            The JSON files to serve by URL or path, optionally prefixed with the method such as ``"POST /api/comment"``.
+        directory: str
+            The directory the files are relative to.
+        kwargs: \*\*Dict
+            Keyword arguments passed on to the constructor.
+
+        Returns
+        -------
+        transport: ReplayTransport
+            The transport serving the files.
+        """
+        transport = cls(**kwargs)
+        for route, file in routes.items():
+            method, _, url = route.rpartition(" ")
+            with open(os.path.join(directory, file) if directory else file) as f:
+                transport.add(method or "GET", url, f.read())
+        return transport
+
+    def add(self, method: str, url: str, body: Union[str, bytes, Any], status: int = 200,
+            headers: Dict[str, str] = None):
+        """
+        Add a response to serve.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        url: str
+            The URL or path of the request.
+        body: Union[str, bytes, Any]
+            The response body, which is encoded as JSON if it isn't a string or bytes.
+        status: int
+            The HTTP status code.
+        headers: Dict[str, str]
+            The response headers.
+        """
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        elif not isinstance(body, str):
+            body = json.dumps(body)
+
+        response = {"status": status, "headers": headers or {}, "body": body}
+        self._responses.setdefault(request_key(method, url), []).append(response)
+        self._responses.setdefault(request_key(method, url, False), []).append(response)
+
+    def _ratelimit_headers(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._used = 0
+        self._used += 1
+
+        return {
+            "x-ratelimit-remaining": str(float(max(self.ratelimit - self._used, 0))),
+            "x-ratelimit-used": str(self._used),
+            "x-ratelimit-reset": str(int(self.window - (now - self._window_start)))
+        }
+
+    def _match(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        for key in (request_key(method, url), request_key(method, url, False)):
+            responses = self._responses.get(key)
+            if responses:
+                index = self._served.get(key, 0)
+                self._served[key] = index + 1
+                return responses[min(index, len(responses) - 1)]
+        return None
+
+    async def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                      data: Union[Dict, str, bytes] = None, auth: Optional[Tuple[str, str]] = None) -> TransportResponse:
+        self.requests.append((method.upper(), url))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if url.startswith(TOKEN_URL):
+            return fake_token_response()
+
+        response = self._match(method, url)
+        if response is None:
+            if self.strict:
+                raise LookupError(f"No recorded response for {method.upper()} {url}.")
+            response = {"status": 404, "headers": {}, "body": json.dumps({"message": "Not Found", "error": 404})}
+
+        headers = {"content-type": "application/json", **response["headers"], **self._ratelimit_headers()}
+        return TransportResponse(response["status"], headers, response["body"].encode("utf-8"))
@@ -1,4 +1,7 @@
 from .bounded_set import BoundedSet
 from .counter import ExponentialCounter
+from .json_decoder import DECODERS, get_decoder
 from .kind import prepend_kind
+from .priority import Priority, current_priority, priority
+from .ratelimiter import RateLimiter
 from .snake import snake_case_keys
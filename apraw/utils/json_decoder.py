@@ -0,0 +1,56 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def _import_decoders() -> Dict[str, JSONDecoder]:
+    decoders = {}
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:  # pragma: no cover
+        pass
+    try:
+        import ujson
+        decoders["ujson"] = ujson.loads
+    except ImportError:  # pragma: no cover
+        pass
+    decoders["json"] = json.loads
+    return decoders
+
+
+#: The available JSON decoders by name, ordered by preference.
+DECODERS = _import_decoders()
+
+
+def get_decoder(decoder: Optional[Union[str, JSONDecoder]] = None) -> JSONDecoder:
+    """
+    Retrieve a function decoding raw JSON bytes.
+
+    Without a name the fastest installed decoder is used: ``orjson``, then ``ujson`` and finally the standard library
+    ``json`` module. All of them accept the raw response body, so it doesn't need to be decoded to ``str`` first.
+
+    Parameters
+    ----------
+    decoder: str or Callable
+        The name of the decoder, one of ``"orjson"``, ``"ujson"`` or ``"json"``, or a function taking ``bytes``
+        and returning the decoded data.
+
+    Returns
+    -------
+    loads: Callable
+        The decoding function.
+
+    Raises
+    ------
+    ValueError
+        If the requested decoder isn't installed.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return next(iter(DECODERS.values()))
+    if decoder not in DECODERS:
+        raise ValueError(f"JSON decoder '{decoder}' isn't available, choose one of {', '.join(DECODERS)}.")
+    return DECODERS[decoder]
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """
+    The priority lanes of requests competing for the ratelimit budget, lower values are served first.
+
+    Members
+    -------
+    HIGH
+        Time-critical requests such as moderator actions, which are tagged automatically.
+    NORMAL
+        The default for requests that aren't tagged, including streams.
+    LOW
+        Bulk work such as backfilling archives that may be delayed indefinitely.
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+_priority = ContextVar("apraw_priority", default=Priority.NORMAL)
+
+
+def current_priority() -> Priority:
+    """
+    Get the priority requests made in the current context are tagged with.
+
+    Returns
+    -------
+    priority: Priority
+        The current priority, :attr:`Priority.NORMAL` unless changed with :func:`priority`.
+    """
+    return _priority.get()
+
+
+@contextmanager
+def priority(level: Priority):
+    """
+    Tag all the requests made within the context, including tasks started in it, with a priority.
+
+    .. code-block:: python3
+
+        with priority(Priority.LOW):
+            async for submission in subreddit.new(limit=None):
+                archive(submission)
+
+    Parameters
+    ----------
+    level: Priority
+        The priority of the requests.
+    """
+    token = _priority.set(Priority(level))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
@@ -0,0 +1,207 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Dict, List
+
+from .priority import Priority
+
+
+class RateLimiter:
+    """
+    An asynchronous token bucket fed by Reddit's ``x-ratelimit-*`` headers.
+
+    Instead of bursting until the budget is exhausted and then stalling until the window resets, the bucket is
+    refilled at ``remaining / seconds until reset`` tokens per second, spreading the remaining budget evenly over the
+    window.
+
+    Coroutines waiting for a token are served by :class:`~apraw.utils.Priority` and in FIFO order within a priority.
+    A fraction of the bucket can be reserved for higher priorities, which lower priorities can't consume. Since the
+    bucket never holds more tokens than the remaining budget, this also keeps the reserved requests available until the
+    window resets, so moderator actions find a token immediately even while a backfill saturates the ratelimit.
+
+    Members
+    -------
+    burst: int
+        The maximum number of tokens the bucket can hold, and thus the largest burst of requests allowed.
+    capacity: int
+        The number of requests allowed per ratelimit window.
+    window: float
+        The length of a ratelimit window in seconds, used until the first headers have been received.
+    remaining: float
+        The number of requests remaining in the current window, decremented locally and corrected by :meth:`update`.
+    reservations: Dict[Priority, float]
+        The fraction of the bucket reserved for each priority and those above it.
+    """
+
+    def __init__(self, burst: int = 10, capacity: int = 600, window: float = 600,
+                 reservations: Dict[Priority, float] = None):
+        """
+        Create an instance of the ratelimiter.
+
+        Parameters
+        ----------
+        burst: int
+            The maximum number of tokens the bucket can hold.
+        capacity: int
+            The number of requests allowed per ratelimit window.
+        window: float
+            The length of a ratelimit window in seconds.
+        reservations: Dict[Priority, float]
+            The fraction of the bucket reserved for each priority and those above it, defaults to 10% for
+            :attr:`~apraw.utils.Priority.HIGH` and a further 30% for :attr:`~apraw.utils.Priority.NORMAL`.
+
+        Raises
+        ------
+        ValueError
+            If the reservations add up to the complete bucket.
+        """
+        self.burst = burst
+        self.capacity = capacity
+        self.window = window
+        self.remaining = float(capacity)
+        self.reservations = reservations if reservations is not None else {Priority.HIGH: 0.1, Priority.NORMAL: 0.3}
+
+        if sum(self.reservations.values()) >= 1:
+            raise ValueError("The reservations must leave part of the bucket to the lowest priority.")
+
+        now = time.monotonic()
+        self._reset = now + window
+        self._tokens = float(burst)
+        self._last_refill = now
+        self._waiters: List[List] = []
+        self._sequence = itertools.count()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Get the number of tokens currently available in the bucket.
+
+        Returns
+        -------
+        tokens: float
+            The number of available tokens.
+        """
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def fill_level(self) -> float:
+        """
+        Get the fill level of the bucket.
+
+        Returns
+        -------
+        fill_level: float
+            The fraction of the bucket that is filled, between ``0`` and ``1``.
+        """
+        return self.tokens / self.burst if self.burst else 0.0
+
+    @property
+    def reset_in(self) -> float:
+        """
+        Get the number of seconds until the current ratelimit window resets.
+
+        Returns
+        -------
+        seconds: float
+            The seconds remaining in the current window.
+        """
+        return max(self._reset - time.monotonic(), 0.0)
+
+    def _rate(self, now: float) -> float:
+        """
+        Calculate the rate at which tokens are refilled to spread the remaining budget over the window.
+        """
+        if now >= self._reset:
+            self.remaining = float(self.capacity)
+            self._reset = now + self.window
+        return max(self.remaining, 0.0) / (self._reset - now)
+
+    def _refill(self, now: float):
+        """
+        Add the tokens accumulated since the last refill without exceeding the burst size or remaining budget.
+        """
+        rate = self._rate(now)
+        self._tokens = min(self._tokens + (now - self._last_refill) * rate, self.burst, max(self.remaining, 0.0))
+        self._last_refill = now
+
+    def _reserved(self, priority: Priority) -> float:
+        """
+        Calculate the fraction of the budget held back from a priority for the ones above it.
+        """
+        return sum(fraction for level, fraction in self.reservations.items() if level < priority)
+
+    def _delay(self, now: float, priority: Priority = Priority.NORMAL) -> float:
+        """
+        Calculate how long to wait until the next token is available to a priority, ``0`` if one is available.
+        """
+        # the reserve is rounded down and never takes the whole bucket, so small buckets can't deadlock
+        held = min(int(self._reserved(priority) * self.burst), max(self.burst - 1, 0))
+
+        rate = self._rate(now)
+        if self._tokens >= held + 1:
+            return 0
+        if rate <= 0 or self.remaining < held + 1:
+            return max(self._reset - now, 0.001)
+        return (held + 1 - self._tokens) / rate
+
+    async def acquire(self, priority: Priority = Priority.NORMAL):
+        """
+        Wait until a token is available to the given priority and consume it.
+
+        Parameters
+        ----------
+        priority: Priority
+            The priority of the request.
+        """
+        loop = asyncio.get_event_loop()
+        waiter = [int(priority), next(self._sequence), loop.create_future()]
+        heapq.heappush(self._waiters, waiter)
+
+        try:
+            while True:
+                if waiter[2].done():
+                    waiter[2] = loop.create_future()
+
+                # only the first waiter in line polls the bucket, the others wait until it's served
+                if self._waiters[0] is not waiter:
+                    await waiter[2]
+                    continue
+
+                now = time.monotonic()
+                self._refill(now)
+                delay = self._delay(now, priority)
+                if delay <= 0:
+                    self._tokens -= 1
+                    self.remaining -= 1
+                    return
+                await asyncio.wait((waiter[2],), timeout=delay)
+        finally:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            if self._waiters and not self._waiters[0][2].done():
+                self._waiters[0][2].set_result(None)
+
+    def update(self, remaining: float, used: int = None, reset: float = None):
+        """
+        Update the bucket with the ratelimit information returned by the API.
+
+        Parameters
+        ----------
+        remaining: float
+            The value of the ``x-ratelimit-remaining`` header.
+        used: int
+            The value of the ``x-ratelimit-used`` header if available.
+        reset: float
+            The value of the ``x-ratelimit-reset`` header if available.
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        self.remaining = float(remaining)
+        if used is not None:
+            self.capacity = max(self.capacity, int(remaining) + used)
+        if reset is not None:
+            self._reset = now + reset
+        self._tokens = min(self._tokens, max(self.remaining, 0.0))
@@ -1,12 +1,22 @@
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 pattern = re.compile(r'(?<!^)(?=[A-Z])')
 
 
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
+    if name.islower():
+        return name
     return pattern.sub("_", name).lower()
 
 
 def snake_case_keys(dictionary: Dict[str, Any]) -> Dict[str, Any]:
     return {camel_to_snake(k): v for k, v in dictionary.items()}
+
+
+@lru_cache(maxsize=256)
+def snake_key_map(keys: Tuple[str, ...]) -> Dict[str, str]:
+    # shared by all the compact models whose data has the same keys, so it must not be modified
+    return {camel_to_snake(k): k for k in keys if not k.islower()}
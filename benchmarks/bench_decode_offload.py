@@ -0,0 +1,67 @@
+"""
+Measure how long fetching large comment pages stalls the event loop with and without a decode executor.
+
+A ticker coroutine wakes up every millisecond while ``requests/dumps/submission_full.json`` is fetched repeatedly
+through ``ReplayTransport``; the largest delay between two ticks is the longest the event loop was blocked.
+
+Usage::
+
+    python benchmarks/bench_decode_offload.py [fetches] [decoder]
+"""
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import apraw  # noqa: E402
+from apraw.models import Submission  # noqa: E402
+from apraw.transport import ReplayTransport  # noqa: E402
+
+DUMPS = os.path.join(os.path.dirname(__file__), "..", "requests", "dumps")
+
+
+async def ticker(lags, stop):
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        lags.append(now - last - 0.001)
+        last = now
+
+
+async def run(fetches, decoder, executor):
+    transport = ReplayTransport.from_dumps({"/r/aPRAWTest/comments/db8k9e": "submission_full.json"}, DUMPS,
+                                           latency=0.005, ratelimit=100000)
+    reddit = apraw.Reddit(username="bench", password="bench", client_id="bench", client_secret="bench",
+                          transport=transport, json_decoder=decoder, decode_executor=executor,
+                          coalesce_requests=False)
+    lags, stop = [], asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lags, stop))
+
+    start = time.perf_counter()
+    for _ in range(fetches):
+        await Submission(reddit, {"id": "db8k9e", "subreddit": "aPRAWTest"}).fetch()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick
+    await reddit.close()
+    return elapsed, max(lags)
+
+
+def main():
+    fetches = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    decoder = sys.argv[2] if len(sys.argv) > 2 else None
+
+    loop = asyncio.get_event_loop()
+    with ThreadPoolExecutor(2) as executor:
+        for name, pool in (("event loop", None), ("thread pool", executor)):
+            elapsed, lag = loop.run_until_complete(run(fetches, decoder, pool))
+            print(f"{name:<12} {elapsed * 1000:9.2f} ms total  {lag * 1000:7.2f} ms max loop lag")
+
+
+if __name__ == "__main__":
+    main()
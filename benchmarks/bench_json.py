@@ -0,0 +1,42 @@
+"""
+Benchmark decoding the captured responses in ``requests/dumps`` with every available JSON decoder.
+
+The ``text + json`` row reproduces the previous behaviour of decoding the body to ``str`` before parsing it with the
+standard library, the other rows parse the raw bytes directly as ``TransportResponse.json`` does.
+
+Usage::
+
+    python benchmarks/bench_json.py [repeat]
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apraw.utils import DECODERS  # noqa: E402
+
+DUMPS = os.path.join(os.path.dirname(__file__), "..", "requests", "dumps")
+FILES = ("inbox.json", "submission_full.json", "morechildren.json", "subreddit.json")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    decoders = {"text + json": lambda body: json.loads(body.decode("utf-8")), **DECODERS}
+    print(f"{'file':<22} {'size':>9}  " + "  ".join(f"{name:>14}" for name in decoders))
+
+    for name in FILES:
+        with open(os.path.join(DUMPS, name), "rb") as f:
+            body = f.read()
+
+        timings = [min(timeit.repeat(lambda: loads(body), number=repeat, repeat=3)) / repeat
+                   for loads in decoders.values()]
+        baseline = timings[0]
+        print(f"{name:<22} {len(body) / 1024:7.1f}KiB  " +
+              "  ".join(f"{t * 1e6:7.1f}us {baseline / t:3.1f}x" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark for building models from the captured responses in ``requests/dumps``.
+
+Compares the current ``aPRAWBase._update`` against the previous implementation, which ran the camelCase regex on
+every key and probed every attribute with ``hasattr``.
+
+Usage::
+
+    python benchmarks/bench_parsing.py [repeat]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apraw.models import Listing, aPRAWBase  # noqa: E402
+from tests.unit.conftest import FakeReddit, load_dump  # noqa: E402
+
+pattern = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+def legacy_update(self, data):
+    self._data = data
+
+    d = {pattern.sub("_", k).lower(): v for k, v in data.items()}
+    for key in d:
+        if not hasattr(self, key):
+            self._data_attrs.add(key)
+            setattr(self, key, d[key])
+        elif key in self._data_attrs:
+            setattr(self, key, d[key])
+
+
+def build_listing(reddit, data):
+    listing = Listing(reddit, data)
+    return [item for item in listing]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    reddit = FakeReddit()
+    fixtures = {
+        "inbox": load_dump("inbox")["data"],
+        "submission_full comments": load_dump("submission_full")[1]["data"],
+        "morechildren": {"children": load_dump("morechildren")["json"]["data"]["things"]},
+    }
+
+    current_update = aPRAWBase._update
+    for name, data in fixtures.items():
+        aPRAWBase._update = legacy_update
+        legacy = min(timeit.repeat(lambda: build_listing(reddit, data), number=1, repeat=repeat))
+        aPRAWBase._update = current_update
+        current = min(timeit.repeat(lambda: build_listing(reddit, data), number=1, repeat=repeat))
+        print(f"{name:<28} legacy {legacy * 1000:8.2f} ms  current {current * 1000:8.2f} ms  "
+              f"speedup {legacy / current:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Offline end-to-end benchmark replaying the captured responses in ``requests/dumps`` through ``ReplayTransport``.
+
+Every scenario goes through the complete request path: token handling, the ratelimiter, the request handler, JSON
+decoding and model parsing, with a simulated network latency per request.
+
+Usage::
+
+    python benchmarks/bench_replay.py [latency] [repeat]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import apraw  # noqa: E402
+from apraw.models import ListingGenerator, Submission  # noqa: E402
+from apraw.transport import ReplayTransport  # noqa: E402
+
+DUMPS = os.path.join(os.path.dirname(__file__), "..", "requests", "dumps")
+
+ROUTES = {
+    "/message/inbox": "inbox.json",
+    "/r/aPRAWTest/comments/db8k9e": "submission_full.json",
+    "/api/morechildren": "morechildren.json",
+}
+
+
+def build_reddit(latency):
+    transport = ReplayTransport.from_dumps(ROUTES, DUMPS, latency=latency, ratelimit=100000)
+    # later morechildren requests receive no further children so replace_more terminates
+    transport.add("GET", "/api/morechildren", {"json": {"data": {"things": []}}})
+    reddit = apraw.Reddit(username="bench", password="bench", client_id="bench", client_secret="bench",
+                          transport=transport)
+    return reddit, transport
+
+
+async def listing_iteration(reddit):
+    return len([i async for i in ListingGenerator(reddit, "/message/inbox", limit=250)])
+
+
+async def listing_prefetch(reddit):
+    return len([i async for i in ListingGenerator(reddit, "/message/inbox", limit=250, prefetch=4)])
+
+
+async def submission_parsing(reddit):
+    submission = Submission(reddit, {"id": "db8k9e", "subreddit": "aPRAWTest"})
+    await submission.fetch()
+    return len(submission.comments)
+
+
+async def replace_more(reddit):
+    submission = Submission(reddit, {"id": "db8k9e", "subreddit": "aPRAWTest"})
+    await submission.fetch()
+    await submission.comments.replace_more()
+    return len(submission.comments.index)
+
+
+async def run(scenario, latency, repeat):
+    timings = []
+    for _ in range(repeat):
+        reddit, transport = build_reddit(latency)
+        start = time.perf_counter()
+        items = await scenario(reddit)
+        timings.append(time.perf_counter() - start)
+        await reddit.close()
+    return min(timings), items, len(transport.requests) - 1
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"simulated latency {latency * 1000:.0f} ms, best of {repeat}")
+    for scenario in (listing_iteration, listing_prefetch, submission_parsing, replace_more):
+        best, items, requests = asyncio.get_event_loop().run_until_complete(run(scenario, latency, repeat))
+        print(f"{scenario.__name__:<20} {best * 1000:9.2f} ms  {items:5d} items  {requests:3d} requests")
+
+
+if __name__ == "__main__":
+    main()
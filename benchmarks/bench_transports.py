@@ -0,0 +1,88 @@
+"""
+Benchmark the HTTP transports against each other with many concurrent requests.
+
+A local ``aiohttp`` server serving ``requests/dumps/subreddit.json`` with a simulated latency is started, and the same
+number of concurrent requests is sent through every transport. ``LocalTransport`` dispatches in-process and shows the
+overhead of the request path without any networking.
+
+HTTP/2 needs TLS with ALPN, so against the local plain-text server ``HttpxTransport`` is measured over HTTP/1.1. Pass
+``--live`` to additionally compare the transports against ``https://oauth.reddit.com`` without authentication, where
+``HttpxTransport`` multiplexes the requests over HTTP/2.
+
+Usage::
+
+    python benchmarks/bench_transports.py [requests] [latency] [--live]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import apraw  # noqa: E402
+from apraw.transport import AiohttpTransport, HttpxTransport, LocalTransport  # noqa: E402
+
+DUMPS = os.path.join(os.path.dirname(__file__), "..", "requests", "dumps")
+
+
+async def start_server(latency):
+    with open(os.path.join(DUMPS, "subreddit.json"), "rb") as f:
+        body = f.read()
+
+    async def handler(request):
+        await asyncio.sleep(latency)
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, "http://127.0.0.1:{}".format(site._server.sockets[0].getsockname()[1])
+
+
+async def measure(transport, url, count):
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(transport.request("GET", f"{url}/r/sub{i}/about") for i in range(count)))
+    elapsed = time.perf_counter() - start
+    await transport.close()
+    return elapsed, sum(len(r.body) for r in responses)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 500
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 and not sys.argv[2].startswith("-") else 0.02
+    live = "--live" in sys.argv
+
+    user = apraw.Reddit(username="bench", password="bench", client_id="bench", client_secret="bench").user
+    runner, url = await start_server(latency)
+
+    async def local_handler(method, url, headers, data):
+        await asyncio.sleep(latency)
+        return {}
+
+    transports = [
+        ("aiohttp (100 connections)", lambda: AiohttpTransport(user), url),
+        ("httpx http/1.1 (10 connections)", lambda: HttpxTransport(http2=False, max_connections=10), url),
+        ("local", lambda: LocalTransport(local_handler), url),
+    ]
+    if live:
+        transports += [
+            ("aiohttp live", lambda: AiohttpTransport(user), "https://oauth.reddit.com"),
+            ("httpx http/2 live (4 connections)", lambda: HttpxTransport(max_connections=4), "https://oauth.reddit.com"),
+        ]
+
+    print(f"{count} concurrent requests, simulated latency {latency * 1000:.0f} ms")
+    for name, factory, target in transports:
+        elapsed, size = await measure(factory(), target, count if target == url else min(count, 50))
+        print(f"{name:<36} {elapsed * 1000:9.2f} ms  {size / 1024:9.1f} KiB")
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
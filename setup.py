@@ -18,6 +18,9 @@ setuptools.setup(
         'aiohttp>=3.6.2',
         'reactivepy>=1.9.0.dev0'
     ],
+    extras_require={
+        'http2': ['httpx[http2]>=0.18.0']
+    },
     keywords="reddit api wrapper async",
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from apraw.transport import Transport, TransportResponse
+from apraw.utils import RateLimiter
+
+DUMPS = os.path.join(os.path.dirname(__file__), "..", "..", "requests", "dumps")
+
+
+class FakeReddit:
+    """
+    A stand-in for :class:`~apraw.Reddit` with the kind attributes models rely on. Fake API methods such as ``get``
+    and any other attributes a test needs are passed as keyword arguments.
+    """
+
+    comment_kind = "t1"
+    account_kind = "t2"
+    link_kind = "t3"
+    message_kind = "t4"
+    subreddit_kind = "t5"
+    award_kind = "t6"
+    modaction_kind = "modaction"
+    listing_kind = "Listing"
+    wiki_revision_kind = "WikiRevision"
+    wikipage_kind = "wikipage"
+    more_kind = "more"
+    subreddit_settings_kind = "subreddit_settings"
+    compact_models = False
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class FakeUser:
+    """
+    A stand-in for :class:`~apraw.models.AuthenticatedUser` whose access token stays valid for an hour.
+    """
+
+    username = "aPRAWBot"
+    user_agent = "test"
+
+    def __init__(self, token: str = "token", burst: int = 10):
+        self.access_data = {"token_type": "bearer", "access_token": token}
+        self.token_expires = datetime.now() + timedelta(hours=1)
+        self.ratelimiter = RateLimiter(burst)
+
+
+class FakeTransport(Transport):
+    """
+    A :class:`~apraw.transport.Transport` that records requests instead of sending them. Responses are built by
+    ``respond(method, url, data)`` if given, otherwise the requested URL is echoed back as ``{"url": url}``.
+    """
+
+    def __init__(self, respond=None, latency: float = 0.01):
+        self.respond = respond
+        self.latency = latency
+        self.requests = []
+        self.urls = []
+        self.tokens = []
+
+    async def request(self, method, url, headers=None, data=None, auth=None):
+        self.requests.append((method, url, data))
+        self.urls.append(url)
+        self.tokens.append((headers or {}).get("Authorization"))
+        await asyncio.sleep(self.latency)
+        if self.respond:
+            return self.respond(method, url, data)
+        return TransportResponse(200, {}, json.dumps({"url": url}).encode())
+
+
+def load_dump(name: str):
+    with open(os.path.join(DUMPS, name + ".json"), encoding="utf8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def fake_reddit():
+    return FakeReddit
+
+
+@pytest.fixture
+def dump():
+    return load_dump
+
+
+@pytest.fixture
+def dumps_dir():
+    return DUMPS
+
+
+@pytest.fixture
+def fake_user():
+    return FakeUser
+
+
+@pytest.fixture
+def fake_transport():
+    return FakeTransport
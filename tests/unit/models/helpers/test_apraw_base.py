@@ -0,0 +1,40 @@
+import sys
+
+from apraw.models import Listing, aPRAWBase
+
+
+class TestAPRAWBase:
+    def test_compact_models_attributes(self, fake_reddit, dump):
+        regular = list(Listing(fake_reddit(), dump("submission_full")[1]["data"], kind_filter=["t1"]))
+        compact = list(Listing(fake_reddit(compact_models=True), dump("submission_full")[1]["data"],
+                               kind_filter=["t1"]))
+
+        for r, c in zip(regular, compact):
+            assert r.fullname == c.fullname
+            assert r.body == c.body
+            assert r.score == c.score
+            assert r.created_utc == c.created_utc
+            assert len(r.replies) == len(c.replies)
+
+    def test_compact_models_missing_attribute(self, fake_reddit, dump):
+        comment = next(Listing(fake_reddit(compact_models=True), dump("submission_full")[1]["data"]))
+
+        assert not hasattr(comment, "does_not_exist")
+
+    def test_compact_models_memory(self, fake_reddit, dump):
+        regular = next(Listing(fake_reddit(), dump("submission_full")[1]["data"]))
+        compact = next(Listing(fake_reddit(compact_models=True), dump("submission_full")[1]["data"]))
+
+        assert sys.getsizeof(compact.__dict__) < sys.getsizeof(regular.__dict__) / 2
+
+    def test_compact_models_camel_case_keys(self, fake_reddit):
+        reddit = fake_reddit(compact_models=True)
+        first = aPRAWBase(reddit, {"id": "a", "isAuto": True, "objIds": [1]})
+        second = aPRAWBase(reddit, {"id": "b", "isAuto": False, "objIds": [2]})
+
+        assert (first.is_auto, first.obj_ids, second.is_auto) == (True, [1], False)
+        assert first._snake_keys is second._snake_keys
+
+        first._update({"id": "a", "isHighlighted": True})
+        assert first.is_highlighted
+        assert not hasattr(first, "is_auto")
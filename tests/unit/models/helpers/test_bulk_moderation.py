@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from apraw.models import BulkModeration
+
+
+class RemovalAPI:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.removed = []
+
+    async def post(self, endpoint, data=None, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if data["id"].endswith("bad"):
+            raise ValueError("forbidden")
+        self.removed.append((data["id"], data["spam"]))
+        return {}
+
+
+@pytest.fixture
+def api():
+    return RemovalAPI()
+
+
+@pytest.fixture
+def reddit(fake_reddit, api):
+    return fake_reddit(post=api.post)
+
+
+class TestBulkModeration:
+    @pytest.mark.asyncio
+    async def test_bulk_remove(self, reddit, api):
+        progress = []
+
+        async def items():
+            for i in range(20):
+                yield f"t3_{i}"
+            yield "t3_bad"
+
+        report = await BulkModeration(reddit, concurrency=4).execute(
+            items(), "remove", spam=True, progress=lambda result, report: progress.append(len(report)))
+
+        assert len(report) == 21 and progress == list(range(1, 22))
+        assert len(report.succeeded) == 20 and len(api.removed) == 20
+        assert all(spam for _, spam in api.removed)
+        assert [r.item for r in report.failed] == ["t3_bad"]
+        assert isinstance(report.failed[0].error, ValueError)
+        assert api.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_bulk_progress_error(self, reddit):
+        def progress(result, report):
+            raise RuntimeError("stop")
+
+        async def action(item):
+            return item
+
+        with pytest.raises(RuntimeError):
+            await BulkModeration(reddit, concurrency=2).execute(range(1000), action, progress=progress)
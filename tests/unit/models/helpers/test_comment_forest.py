@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+
+from apraw.models import CommentForest, CommentIndex, MoreComments
+
+
+class MoreChildrenAPI:
+    def __init__(self, things):
+        self.things = things
+        self.requests = []
+
+    async def get(self, endpoint, **kwargs):
+        ids = kwargs["children"].split(",")
+        self.requests.append(ids)
+        return {"json": {"data": {"things": [self.things[i] for i in ids]}}}
+
+
+def comment(id, parent_id, replies=""):
+    return {"kind": "t1", "data": {"id": id, "name": f"t1_{id}", "parent_id": parent_id, "link_id": "t3_s",
+                                   "body": id, "replies": replies}}
+
+
+def more(id, parent_id, children):
+    return {"kind": "more", "data": {"id": id, "name": f"t1_{id}", "parent_id": parent_id, "depth": 0,
+                                     "count": len(children), "children": children}}
+
+
+def listing(*children):
+    return {"kind": "Listing", "data": {"children": list(children)}}
+
+
+class TestCommentForest:
+    @pytest.mark.asyncio
+    async def test_replace_more(self, fake_reddit):
+        api = MoreChildrenAPI({
+            "b": comment("b", "t1_a"),
+            "c": comment("c", "t3_s"),
+            "d": comment("d", "t1_c"),
+            "e": more("e", "t1_d", ["f"]),
+            "f": comment("f", "t1_d"),
+        })
+        forest = CommentForest(fake_reddit(get=api.get), {"children": [
+            comment("a", "t3_s", listing(more("m1", "t1_a", ["b"]))),
+            more("m2", "t3_s", ["c", "d", "e"]),
+        ]}, "t3_s")
+
+        skipped = await forest.replace_more()
+
+        assert skipped == []
+        assert [c.id for c in forest] == ["a", "c"]
+        assert api.requests == [["c", "d", "e", "b"], ["f"]]
+
+        a, c = forest.children
+        assert [r.id for r in a.replies.children] == ["b"]
+        assert [r.id for r in c.replies.children] == ["d"]
+        assert [r.id for r in c.replies.children[0].replies.children] == ["f"]
+
+    @pytest.mark.asyncio
+    async def test_replace_more_limit(self, fake_reddit):
+        api = MoreChildrenAPI({"b": comment("b", "t1_a"), "c": comment("c", "t3_s"), "d": comment("d", "t3_s")})
+        forest = CommentForest(fake_reddit(get=api.get), {"children": [
+            comment("a", "t3_s", listing(more("m1", "t1_a", ["b"]))),
+            more("m2", "t3_s", ["c", "d"]),
+        ]}, "t3_s")
+
+        skipped = await forest.replace_more(limit=1)
+
+        assert [m.id for m in skipped] == ["m1"]
+        assert api.requests == [["c", "d"]]
+        assert isinstance(forest.children[0].replies.children[0], MoreComments)
+
+    @pytest.mark.asyncio
+    async def test_index(self, fake_reddit):
+        api = MoreChildrenAPI({"c": comment("c", "t3_s"), "d": comment("d", "t1_c"), "e": comment("e", "t1_d")})
+        forest = CommentForest(fake_reddit(get=api.get), {"children": [
+            comment("a", "t3_s", listing(comment("b", "t1_a"))),
+            more("m2", "t3_s", ["c", "d", "e"]),
+        ]}, "t3_s")
+
+        assert len(forest.index) == 2
+        await forest.replace_more()
+
+        index = forest.index
+        assert len(index) == 5
+        assert index.get("e").id == "e"
+        assert index.get("t1_e") is index.get("e")
+        assert [c.id for c in index.children("c")] == ["d"]
+        assert [c.id for c in index.children("t3_s")] == ["a", "c"]
+        assert [c.id for c in index.ancestors("e")] == ["d", "c"]
+        assert index.depth("e") == 2
+        assert index.parent("a") is None
+        assert [c.id for c in index.walk()] == ["a", "c", "b", "d", "e"]
+        assert [c.id for c in forest.list()] == ["a", "c", "b", "d", "e"]
+
+    def test_index_depth_out_of_order(self):
+        index = CommentIndex("t3_s")
+        for id, parent_id in [("c", "t1_b"), ("d", "t1_c"), ("b", "t1_a"), ("a", "t3_s"), ("x", "t1_y")]:
+            index.add(SimpleNamespace(fullname=f"t1_{id}", parent_id=parent_id))
+
+        assert [index.depth(id) for id in "abcdx"] == [0, 1, 2, 3, 0]
+        assert index.depth("unknown") == 0
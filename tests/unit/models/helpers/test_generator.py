@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from apraw.models import ListingGenerator
+
+
+class PagedAPI:
+    def __init__(self, total: int, page_size: int = 10, latency: float = 0.0):
+        self.items = [{"kind": "t3", "data": {"id": str(i), "name": f"t3_{i}"}} for i in range(total)]
+        self.page_size = page_size
+        self.latency = latency
+        self.requests = []
+
+    async def get(self, endpoint, **kwargs):
+        self.requests.append(kwargs.get("after"))
+        await asyncio.sleep(self.latency)
+
+        start = 0
+        if kwargs.get("after"):
+            start = int(kwargs["after"].split("_")[1]) + 1
+
+        return {"data": {"children": self.items[start:start + self.page_size]}}
+
+
+class TestListingGenerator:
+    @pytest.mark.asyncio
+    async def test_listing_generator_pages(self, fake_reddit):
+        api = PagedAPI(35)
+        result = [i.id async for i in ListingGenerator(fake_reddit(get=api.get), "/new", limit=None)]
+
+        assert result == [str(i) for i in range(35)]
+        assert api.requests == [None, "t3_9", "t3_19", "t3_29", "t3_34"]
+
+    @pytest.mark.asyncio
+    async def test_listing_generator_limit(self, fake_reddit):
+        api = PagedAPI(35)
+        result = [i.id async for i in ListingGenerator(fake_reddit(get=api.get), "/new", limit=15)]
+
+        assert result == [str(i) for i in range(15)]
+
+    @pytest.mark.asyncio
+    async def test_listing_generator_prefetch(self, fake_reddit):
+        api = PagedAPI(35)
+        result = [i.id async for i in ListingGenerator(fake_reddit(get=api.get), "/new", limit=None, prefetch=2)]
+
+        assert result == [str(i) for i in range(35)]
+        assert api.requests == [None, "t3_9", "t3_19", "t3_29", "t3_34"]
+
+    @pytest.mark.asyncio
+    async def test_listing_generator_prefetch_reads_ahead(self, fake_reddit):
+        api = PagedAPI(100, latency=0.01)
+        generator = ListingGenerator(fake_reddit(get=api.get), "/new", limit=None, prefetch=3)
+
+        await generator.__anext__()
+        await asyncio.sleep(0.1)
+
+        assert len(api.requests) == 5
+        await generator.aclose()
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from apraw.models import Comment, InfoLoader, Submission
+
+
+class InfoAPI:
+    def __init__(self, fake_reddit):
+        self.requests = []
+        self.reddit = fake_reddit(get=self.get)
+        self.reddit.info_loader = InfoLoader(self.reddit, window=0.01, max_batch=3)
+
+    async def get(self, endpoint, **kwargs):
+        self.requests.append(kwargs["id"].split(","))
+        await asyncio.sleep(0)
+        children = []
+        for fullname in kwargs["id"].split(","):
+            kind, id = fullname.split("_")
+            if id != "deleted":
+                children.append({"kind": kind, "data": {"id": id, "name": fullname, "link_id": "t3_a", "replies": ""}})
+        return {"data": {"children": children}}
+
+
+class TestInfoLoader:
+    @pytest.mark.asyncio
+    async def test_info_loader_coalesces(self, fake_reddit):
+        api = InfoAPI(fake_reddit)
+        reddit = api.reddit
+        results = await asyncio.gather(reddit.info_loader.load("t3_a"), reddit.info_loader.load("t1_b"),
+                                       reddit.info_loader.load("t3_a"))
+
+        assert [r.fullname for r in results] == ["t3_a", "t1_b", "t3_a"]
+        assert isinstance(results[0], Submission) and isinstance(results[1], Comment)
+        assert api.requests == [["t3_a", "t1_b"]]
+
+    @pytest.mark.asyncio
+    async def test_info_loader_max_batch(self, fake_reddit):
+        api = InfoAPI(fake_reddit)
+        reddit = api.reddit
+        results = await asyncio.gather(*(reddit.info_loader.load_data(f"t1_{i}") for i in range(5)))
+
+        assert [r["data"]["name"] for r in results] == [f"t1_{i}" for i in range(5)]
+        assert api.requests == [["t1_0", "t1_1", "t1_2"], ["t1_3", "t1_4"]]
+
+    @pytest.mark.asyncio
+    async def test_info_loader_model_fetch(self, fake_reddit):
+        api = InfoAPI(fake_reddit)
+        reddit = api.reddit
+        submission, missing = await asyncio.gather(Submission(reddit, {"id": "a"}).fetch(),
+                                                   reddit.info_loader.load("t1_deleted"))
+
+        assert submission.id == "a"
+        assert missing is None
+        assert api.requests == [["t3_a", "t1_deleted"]]
+
+    @pytest.mark.asyncio
+    async def test_info_loader_error_body(self, fake_reddit):
+        async def forbidden(endpoint, **kwargs):
+            return {"message": "Forbidden", "error": 403}
+
+        reddit = fake_reddit(get=forbidden)
+        reddit.info_loader = InfoLoader(reddit, window=0.01)
+
+        lookups = asyncio.gather(reddit.info_loader.load("t3_a"), Submission(reddit, {"id": "b"}).fetch(),
+                                 return_exceptions=True)
+        results = await asyncio.wait_for(lookups, 1)
+        assert all(isinstance(r, KeyError) for r in results)
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from apraw.models import InfoLookup, Listing, Subreddit, Submission
+
+
+class InfoAPI:
+    def __init__(self, fake_reddit, deleted=()):
+        self.reddit = fake_reddit(get_listing=self.get_listing)
+        self.deleted = set(deleted)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_listing(self, endpoint, **kwargs):
+        self.requests.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        children = []
+        if "id" in kwargs:
+            for fullname in reversed(kwargs["id"].split(",")):
+                if fullname not in self.deleted:
+                    kind, id = fullname.split("_")
+                    children.append({"kind": kind, "data": {"id": id, "name": fullname, "subreddit": "aprawtest",
+                                                            "link_id": "t3_0", "replies": ""}})
+        elif "sr_name" in kwargs:
+            for name in kwargs["sr_name"].split(","):
+                children.append({"kind": "t5", "data": {"id": name[:3], "name": f"t5_{name[:3]}",
+                                                        "display_name": name.capitalize()}})
+        elif "url" in kwargs:
+            children = [{"kind": "t3", "data": {"id": "url1", "name": "t3_url1", "url": kwargs["url"]}},
+                        {"kind": "t3", "data": {"id": "url2", "name": "t3_url2", "url": kwargs["url"]}}]
+        return Listing(self.reddit, {"children": children})
+
+
+class TestInfoLookup:
+    def test_info_lookup_normalize(self):
+        assert InfoLookup.normalize("t3_hpbepl") == ("id", "t3_hpbepl")
+        assert InfoLookup.normalize("https://www.reddit.com/r/aPRAWTest/comments/hpbepl/test/") == ("id", "t3_hpbepl")
+        assert InfoLookup.normalize("https://reddit.com/r/aPRAWTest/comments/hpbepl/test/fxwhc4e") == \
+            ("id", "t1_fxwhc4e")
+        assert InfoLookup.normalize("/r/aPRAWTest") == ("sr_name", "aprawtest")
+        assert InfoLookup.normalize("aPRAWTest") == ("sr_name", "aprawtest")
+        assert InfoLookup.normalize("https://example.com/a") == ("url", "https://example.com/a")
+
+    @pytest.mark.asyncio
+    async def test_info_lookup_preserves_order_and_reports_missing(self, fake_reddit):
+        ids = [f"t3_{i}" for i in range(250)]
+        api = InfoAPI(fake_reddit, deleted=["t3_5", "t3_120"])
+
+        result = await InfoLookup(api.reddit).fetch(ids + ["t3_0", "t3_1"])
+
+        assert [i.fullname for i in result] == [i for i in ids if i not in ("t3_5", "t3_120")]
+        assert result.missing == ["t3_5", "t3_120"]
+        assert isinstance(result.get("t3_7"), Submission)
+        assert len(api.requests) == 3
+        assert api.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_info_lookup_mixed_keys(self, fake_reddit):
+        api = InfoAPI(fake_reddit)
+        result = await InfoLookup(api.reddit).fetch(["https://example.com/a", "r/python", "t1_abc", "python"])
+
+        assert [i.fullname for i in result] == ["t3_url1", "t3_url2", "t5_pyt", "t1_abc"]
+        assert isinstance(result.get("Python"), Subreddit)
+        assert result.missing == []
+        assert len(api.requests) == 3
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from apraw import RetryError
+from apraw.models import StreamScheduler, Streamable
+
+
+class Item:
+    def __init__(self, fullname: str):
+        self.fullname = fullname
+
+
+class Feed:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.items = []
+        self.polls = 0
+
+    def add(self, count: int):
+        start = len(self.items)
+        self.items.extend(Item(f"{self.prefix}_{i}") for i in range(start, start + count))
+
+    async def new(self, limit: int = 100):
+        self.polls += 1
+        for item in reversed(self.items[-limit:]):
+            yield item
+
+
+class FailingFeed(Feed):
+    def __init__(self, prefix: str, errors):
+        super().__init__(prefix)
+        self.errors = list(errors)
+
+    async def new(self, limit: int = 100):
+        if self.errors:
+            self.polls += 1
+            raise self.errors.pop(0)
+        async for item in super().new(limit):
+            yield item
+
+
+class TestStreamScheduler:
+    @pytest.mark.asyncio
+    async def test_stream_scheduler_multiplexes(self):
+        scheduler = StreamScheduler(max_wait=0.05, min_wait=0.01)
+        a, b = Feed("a"), Feed("b")
+        a.add(3)
+        b.add(2)
+
+        results = []
+
+        async def consume(feed, count):
+            async for item in Streamable(feed.new).stream(scheduler=scheduler, name=feed.prefix):
+                results.append(item.fullname)
+                if len([r for r in results if r.startswith(feed.prefix)]) == count:
+                    break
+
+        async def produce():
+            await asyncio.sleep(0.05)
+            a.add(1)
+            b.add(1)
+
+        await asyncio.wait_for(asyncio.gather(consume(a, 4), consume(b, 3), produce()), 2)
+
+        assert [r for r in results if r.startswith("a")] == ["a_0", "a_1", "a_2", "a_3"]
+        assert [r for r in results if r.startswith("b")] == ["b_0", "b_1", "b_2"]
+
+    @pytest.mark.asyncio
+    async def test_stream_scheduler_skip_existing_and_stats(self):
+        scheduler = StreamScheduler(max_wait=0.05, min_wait=0.01)
+        feed = Feed("a")
+        feed.add(5)
+
+        stream = Streamable(feed.new).stream(True, scheduler=scheduler, name="feed")
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        feed.add(1)
+
+        item = await asyncio.wait_for(task, 2)
+        stats = scheduler.stats["feed"]
+
+        assert item.fullname == "a_5"
+        assert stats.items == 6
+        assert stats.polls >= 2
+        assert stats.empty_polls >= 1
+
+        await stream.aclose()
+        assert "feed" not in scheduler.stats
+
+    @pytest.mark.asyncio
+    async def test_stream_scheduler_errors(self):
+        scheduler = StreamScheduler(max_wait=0.02, min_wait=0.01)
+        transient = FailingFeed("a", [RetryError("GET", "/r/a/new", 4)])
+        transient.add(1)
+        broken = FailingFeed("b", [ValueError("broken")])
+
+        item = await asyncio.wait_for(Streamable(transient.new).stream(scheduler=scheduler, name="a").__anext__(), 2)
+        assert item.fullname == "a_0"
+        assert scheduler.stats["a"].errors == 1
+
+        async def drain():
+            async for _ in Streamable(broken.new).stream(scheduler=scheduler, name="b"):
+                pass
+
+        with pytest.raises(ValueError, match="broken"):
+            await asyncio.wait_for(drain(), 2)
+        assert "b" not in scheduler.stats
+        assert broken.polls == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_scheduler_adapts_intervals(self):
+        scheduler = StreamScheduler(max_wait=1, min_wait=0.01, limit=10, fill_target=0.5)
+        busy, idle = Feed("busy"), Feed("idle")
+
+        async def consume(feed):
+            async for _ in Streamable(feed.new).stream(scheduler=scheduler, name=feed.prefix):
+                pass
+
+        async def produce():
+            for _ in range(20):
+                busy.add(2)
+                await asyncio.sleep(0.01)
+
+        consumers = [asyncio.ensure_future(consume(feed)) for feed in (busy, idle)]
+        await produce()
+        stats = scheduler.stats
+        for consumer in consumers:
+            consumer.cancel()
+
+        assert stats["busy"].rate > 0
+        assert stats["busy"].interval < stats["idle"].interval
+        assert busy.polls > idle.polls
@@ -0,0 +1,27 @@
+from apraw.models import Comment, Listing, Message
+
+
+class TestListing:
+    def test_listing_memoizes_items(self, fake_reddit, dump):
+        listing = Listing(fake_reddit(), dump("inbox")["data"])
+
+        assert isinstance(listing[0], Message)
+        assert isinstance(listing[1], Comment)
+        assert listing[0] is listing[0]
+        assert listing.last is listing[len(listing) - 1]
+        assert listing[-1] is listing.last
+
+    def test_listing_kind_filter(self, fake_reddit, dump):
+        reddit = fake_reddit()
+        listing = Listing(reddit, dump("inbox")["data"], kind_filter=[reddit.message_kind])
+
+        assert all(isinstance(item, Message) for item in listing)
+        assert len(listing._items) == 4
+
+    def test_listing_raw(self, fake_reddit, dump):
+        data = dump("inbox")["data"]
+        listing = Listing(fake_reddit(), data, raw=True)
+
+        assert listing[0] is data["children"][0]["data"]
+        assert listing.last_fullname == data["children"][-1]["data"]["name"]
+        assert [item["name"] for item in listing] == [c["data"]["name"] for c in data["children"]]
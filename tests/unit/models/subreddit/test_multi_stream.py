@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from apraw.models import MultiSubredditStream, StreamScheduler
+
+
+class SubmissionsAPI:
+    def __init__(self, private=()):
+        self.submissions = []
+        self.requests = []
+        self.private = set(private)
+
+    def submit(self, subreddit: str):
+        id = str(len(self.submissions))
+        self.submissions.append({"kind": "t3", "data": {"id": id, "name": f"t3_{id}", "subreddit": subreddit}})
+
+    async def get(self, endpoint, **kwargs):
+        self.requests.append(endpoint)
+        subreddits = endpoint.split("/")[2].lower().split("+")
+        if self.private.intersection(subreddits):
+            return {"reason": "private", "message": "Forbidden", "error": 403}
+        children = [s for s in self.submissions if s["data"]["subreddit"].lower() in subreddits]
+        return {"data": {"children": list(reversed(children))[:kwargs.get("limit", 100)]}}
+
+
+class TestMultiSubredditStream:
+    def test_multi_subreddit_stream_packs_by_traffic(self, fake_reddit):
+        stream = MultiSubredditStream(fake_reddit(), ["a", "b", "c", "d", "e"], max_group_size=3,
+                                      scheduler=StreamScheduler(min_wait=1, limit=100, fill_target=0.25))
+        assert stream.groups == [["a", "b", "c"], ["d", "e"]]
+
+        stream._rates.update({"c": 20, "d": 10, "e": 10})
+        assert stream.groups == [["c", "a", "b"], ["d", "e"]]
+
+    def test_multi_subreddit_stream_path_length(self, fake_reddit):
+        stream = MultiSubredditStream(fake_reddit(), ["aaaa", "bbbb", "cccc"], max_path_length=9)
+        assert stream.groups == [["aaaa", "bbbb"], ["cccc"]]
+
+    @pytest.mark.asyncio
+    async def test_multi_subreddit_stream_demultiplexes(self, fake_reddit):
+        api = SubmissionsAPI()
+        for subreddit in ["A", "b", "c", "A"]:
+            api.submit(subreddit)
+
+        stream = MultiSubredditStream(fake_reddit(get=api.get), ["a", "B", "c"], max_group_size=2,
+                                      scheduler=StreamScheduler(max_wait=0.05, min_wait=0.01))
+        everything = stream.stream()
+        only_a = stream.stream("a", skip_existing=True)
+
+        first = [await asyncio.wait_for(everything.__anext__(), 1) for _ in range(4)]
+        assert sorted(i.id for i in first) == ["0", "1", "2", "3"]
+        assert {i.id: i._subreddit.display_name for i in first} == {"0": "a", "1": "B", "2": "c", "3": "a"}
+
+        task = asyncio.ensure_future(only_a.__anext__())
+        await asyncio.sleep(0.05)
+        api.submit("a")
+
+        item = await asyncio.wait_for(task, 1)
+        assert item.id == "4"
+        assert (await asyncio.wait_for(everything.__anext__(), 1)).id == "4"
+        assert set(api.requests) == {"/r/a+B/new", "/r/c/new"}
+
+        await only_a.aclose()
+        await everything.aclose()
+        assert not stream._tasks
+
+    @pytest.mark.asyncio
+    async def test_multi_subreddit_stream_group_error(self, fake_reddit):
+        api = SubmissionsAPI(private=["b"])
+        api.submit("c")
+        stream = MultiSubredditStream(fake_reddit(get=api.get), ["a", "b", "c"], max_group_size=2,
+                                      scheduler=StreamScheduler(max_wait=0.05, min_wait=0.01))
+        only_c = stream.stream("c")
+        waiting = asyncio.ensure_future(stream.stream("a").__anext__())
+
+        assert (await asyncio.wait_for(only_c.__anext__(), 1)).id == "0"
+        with pytest.raises(KeyError):
+            await asyncio.wait_for(waiting, 1)
+        # consumers joining later restart the failed group and get its error as well
+        with pytest.raises(KeyError):
+            await asyncio.wait_for(stream.stream("b").__anext__(), 1)
+
+        await only_c.aclose()
+        assert not stream._tasks
+
+    @pytest.mark.asyncio
+    async def test_multi_subreddit_stream_remove_empty_group(self, fake_reddit):
+        api = SubmissionsAPI()
+        stream = MultiSubredditStream(fake_reddit(get=api.get), ["a", "b"], max_group_size=1,
+                                      scheduler=StreamScheduler(max_wait=0.02, min_wait=0.01))
+        everything = stream.stream()
+        task = asyncio.ensure_future(everything.__anext__())
+        await asyncio.sleep(0.03)
+
+        stream.remove("b")
+        assert stream.groups == [["a"]]
+        requests = len(api.requests)
+        await asyncio.sleep(0.05)
+
+        assert "/r//new" not in api.requests
+        assert set(api.requests[requests:]) == {"/r/a/new"}
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert not stream._tasks
@@ -0,0 +1,120 @@
+import asyncio
+import copy
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from apraw import RequestHandler
+from apraw.cache import ResponseCache
+from apraw.models import RemovalReasonCache, SubredditModeration, SubredditRemovalReasons
+from apraw.transport import TransportResponse
+
+
+class FakeSubreddit:
+    display_name = "aPRAWTest"
+
+
+class ReasonsAPI:
+    def __init__(self, reasons):
+        self.reasons = reasons
+        self.gets = 0
+        self.posts = []
+
+    async def get(self, endpoint, **kwargs):
+        self.gets += 1
+        await asyncio.sleep(0.01)
+        return copy.deepcopy(self.reasons)
+
+    async def post(self, endpoint, data=None, **kwargs):
+        self.posts.append((endpoint, data))
+        await asyncio.sleep(0.01)
+        return {}
+
+    def respond(self, method, url, data):
+        reason_id = urlsplit(url).path.rsplit("/", 1)[-1]
+        if method == "PUT":
+            self.reasons["data"][reason_id].update(data)
+        elif method == "GET":
+            self.gets += 1
+        return TransportResponse(200, {}, json.dumps(self.reasons if method == "GET" else {}).encode())
+
+
+@pytest.fixture
+def api(dump):
+    return ReasonsAPI(dump("removal_reasons"))
+
+
+@pytest.fixture
+def reddit(fake_reddit, fake_user, api):
+    reddit = fake_reddit(get=api.get, post=api.post, request_handler=RequestHandler(fake_user()))
+    reddit.removal_reason_cache = RemovalReasonCache(reddit)
+    return reddit
+
+
+@pytest.fixture
+def cached_reddit(fake_reddit, fake_user, fake_transport, api):
+    handler = RequestHandler(fake_user(), cache=ResponseCache(), transport=fake_transport(api.respond, latency=0))
+    reddit = fake_reddit(get=handler.get, put=handler.put, request_handler=handler)
+    reddit.removal_reason_cache = RemovalReasonCache(reddit)
+    return reddit
+
+
+class TestRemovalReasons:
+    @pytest.mark.asyncio
+    async def test_shared_cache(self, reddit, api):
+        first = SubredditRemovalReasons(reddit, FakeSubreddit())
+        second = SubredditRemovalReasons(reddit, FakeSubreddit())
+
+        reasons = await asyncio.gather(first.get("15bdq5lc23gws"), second.get("removal reason 2"), first.get(0))
+        assert [r.title for r in reasons] == ["Removal reason 2", "Removal reason 2", "Removal reason 1"]
+        assert api.gets == 1
+
+        with pytest.raises(KeyError):
+            await second.get("Removal reason 4")
+
+        reddit.removal_reason_cache.invalidate("aprawtest")
+        assert [r.id async for r in second] == ["15bdq4obounrr", "15bdq5lc23gws", "15bdq6t3ue4rm"]
+        assert api.gets == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch(self, reddit):
+        reasons = SubredditRemovalReasons(reddit, FakeSubreddit())
+
+        lookup = asyncio.ensure_future(reasons.get("Removal reason 1"))
+        await asyncio.sleep(0)
+        # invalidate right after the fetch stored its entry, before the lookup resumes
+        cache = reddit.removal_reason_cache
+        cache._requests["aprawtest"].add_done_callback(lambda f: cache.invalidate())
+
+        assert (await lookup).id == "15bdq4obounrr"
+
+    @pytest.mark.asyncio
+    async def test_remove_with_reason(self, reddit, api):
+        mod = SubredditModeration(reddit, FakeSubreddit())
+
+        report = await mod.remove([f"t3_{i}" for i in range(10)], reason="Removal reason 3", spam=True, concurrency=5)
+
+        assert len(report.succeeded) == 10 and api.gets == 1
+        removals = [data for endpoint, data in api.posts if endpoint == "/api/remove"]
+        reasons = [json.loads(data["json"]) for endpoint, data in api.posts if endpoint != "/api/remove"]
+        assert len(removals) == len(reasons) == 10
+        assert {r["reason_id"] for r in reasons} == {"15bdq6t3ue4rm"}
+        # the reasons of earlier items are added while later items are still being removed
+        endpoints = [endpoint for endpoint, _ in api.posts]
+        last_removal = len(endpoints) - 1 - endpoints[::-1].index("/api/remove")
+        assert endpoints.index("/api/v1/modactions/removal_reasons") < last_removal
+
+    @pytest.mark.asyncio
+    async def test_refetch_bypasses_response_cache(self, cached_reddit, api):
+        reasons = SubredditRemovalReasons(cached_reddit, FakeSubreddit())
+
+        reason = await reasons.get("Removal reason 1")
+        await reason.update(title="Updated")
+        assert (await reasons.get("updated")).id == reason.id
+        assert api.gets == 2
+
+        api.reasons["data"][reason.id]["title"] = "Changed elsewhere"
+        cached_reddit.removal_reason_cache.invalidate()
+        assert (await reasons.get("changed elsewhere")).id == reason.id
+        assert api.gets == 3
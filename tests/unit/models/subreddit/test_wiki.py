@@ -0,0 +1,60 @@
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from apraw import RequestHandler
+from apraw.cache import ResponseCache
+from apraw.models import SubredditWiki
+from apraw.transport import TransportResponse
+
+
+class WikiAPI:
+    def __init__(self):
+        self.pages = {}
+        self.gets = 0
+
+    def respond(self, method, url, data):
+        if method == "POST":
+            self.pages[data["page"]] = data["content"]
+            return TransportResponse(200, {}, b"{}")
+
+        self.gets += 1
+        page = urlsplit(url).path.rsplit("/", 1)[-1]
+        if page not in self.pages:
+            return TransportResponse(404, {}, json.dumps({"message": "Not Found", "error": 404}).encode())
+        body = {"kind": "wikipage", "data": {"content_md": self.pages[page]}}
+        return TransportResponse(200, {}, json.dumps(body).encode())
+
+
+@pytest.fixture
+def api():
+    return WikiAPI()
+
+
+@pytest.fixture
+def wiki(fake_reddit, fake_user, fake_transport, api):
+    handler = RequestHandler(fake_user(), cache=ResponseCache(), transport=fake_transport(api.respond, latency=0))
+    return SubredditWiki(fake_reddit(get=handler.get, post=handler.post), "aPRAWTest")
+
+
+class TestSubredditWiki:
+    @pytest.mark.asyncio
+    async def test_create_after_missing_page(self, wiki):
+        with pytest.raises(KeyError):
+            await wiki.page("new")
+
+        page = await wiki.create("new", "v1")
+        assert page.content_md == "v1"
+
+    @pytest.mark.asyncio
+    async def test_edit_then_read(self, wiki, api):
+        api.pages["index"] = "v1"
+
+        page = await wiki.page("index")
+        assert (await wiki.page("index")).content_md == "v1"
+        assert api.gets == 1
+
+        await page.edit("v2")
+        assert (await wiki.page("index")).content_md == "v2"
+        assert api.gets == 2
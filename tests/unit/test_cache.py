@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from apraw.cache import CachePolicy, DiskCache, MemoryCache, ResponseCache
+from apraw.endpoints import match_endpoint
+
+
+class Fetcher:
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.status, {"data": {"calls": self.calls}}
+
+
+class TestResponseCache:
+    def test_match_endpoint(self):
+        assert match_endpoint("/r/aPRAWTest/about") == "subreddit_about"
+        assert match_endpoint("/r/aPRAWTest/about/edit") == "subreddit_settings"
+        assert match_endpoint("/r/aPRAWTest/wiki/pages") == "wiki"
+        assert match_endpoint("/r/aPRAWTest/wiki/index") == "wiki_page"
+        assert match_endpoint("/api/v1/modactions/removal_reasons") == "removal_reasons"
+        assert match_endpoint("/r/a+b/new") == "subreddit_new"
+        assert match_endpoint("/unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_response_cache_ttl(self):
+        cache = ResponseCache()
+        fetch = Fetcher()
+
+        first = await cache.get("/r/aPRAWTest/about", "a", fetch)
+        first["data"]["calls"] = 100
+        second = await cache.get("/r/aPRAWTest/about", "a", fetch)
+
+        assert second == {"data": {"calls": 1}}
+        assert fetch.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        await cache.get("/r/aPRAWTest/new", "b", fetch)
+        await cache.get("/r/aPRAWTest/new", "b", fetch)
+        assert fetch.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_response_cache_stale_while_revalidate(self):
+        cache = ResponseCache(policies={"subreddit_about": CachePolicy(ttl=0.01, stale_ttl=60)})
+        fetch = Fetcher()
+
+        await cache.get("/r/aPRAWTest/about", "a", fetch)
+        await asyncio.sleep(0.02)
+
+        stale = await cache.get("/r/aPRAWTest/about", "a", fetch)
+        assert stale == {"data": {"calls": 1}}
+
+        await asyncio.sleep(0.01)
+        assert fetch.calls == 2
+        assert await cache.get("/r/aPRAWTest/about", "a", fetch) == {"data": {"calls": 2}}
+
+    @pytest.mark.asyncio
+    async def test_response_cache_negative(self):
+        cache = ResponseCache(policies={"user_about": CachePolicy(ttl=60, negative_ttl=60),
+                                        "subreddit_about": CachePolicy(ttl=60)})
+        fetch = Fetcher(404)
+
+        await cache.get("/user/nobody/about", "a", fetch)
+        await cache.get("/user/nobody/about", "a", fetch)
+        await cache.get("/r/nothing/about", "b", fetch)
+        await cache.get("/r/nothing/about", "b", fetch)
+
+        assert fetch.calls == 3
+
+    def test_memory_cache_lru(self):
+        backend = MemoryCache(max_entries=2)
+        cache = ResponseCache(backend)
+        policy = CachePolicy(60)
+
+        cache._store("a", policy, 200, 1)
+        cache._store("b", policy, 200, 2)
+        backend.get("a")
+        cache._store("c", policy, 200, 3)
+
+        assert backend.get("b") is None
+        assert backend.get("a").value == 1 and backend.get("c").value == 3
+
+    def test_disk_cache(self, tmp_path):
+        backend = DiskCache(str(tmp_path), max_entries=2)
+        policy = CachePolicy(60)
+        ResponseCache(backend)._store("a", policy, 200, {"x": 1})
+
+        entry = DiskCache(str(tmp_path)).get("a")
+        assert entry.value == {"x": 1}
+        assert entry.expires > time.time()
+
+        ResponseCache(backend)._store("b", policy, 200, 2)
+        ResponseCache(backend)._store("c", policy, 200, 3)
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_invalidate_subreddit(self):
+        cache = ResponseCache(policies={"subreddit_new": CachePolicy(60)})
+        fetch = Fetcher()
+
+        await cache.get("/r/aPRAWTest/about", "a", fetch)
+        await cache.get("/r/a+b/new", "b", fetch)
+        cache.invalidate_subreddit("APRAWTEST")
+        await cache.get("/r/aPRAWTest/about", "a", fetch)
+        await cache.get("/r/a+b/new", "b", fetch)
+        assert fetch.calls == 3
+
+        cache.invalidate_subreddit("b")
+        await cache.get("/r/a+b/new", "b", fetch)
+        assert fetch.calls == 4
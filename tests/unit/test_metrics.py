@@ -0,0 +1,42 @@
+import pytest
+
+from apraw import MetricsRegistry, RequestHandler, RetryPolicy
+from apraw.transport import LocalTransport, TransportResponse
+
+
+class TestMetrics:
+    def test_histogram_and_prometheus(self):
+        metrics = MetricsRegistry(latency_buckets=(0.1, 1), size_buckets=(100,))
+        metrics.observe_request("https://oauth.reddit.com/r/aPRAWTest/new?limit=100", "get", 200, 0.05, 50)
+        metrics.observe_request("/r/aPRAWTest/new", "GET", 200, 0.5, 500, ratelimit_wait=0.25)
+        metrics.observe_request("/unknown", "POST", None, 2)
+        metrics.observe_budget("aPRAWBot", 598, 2, 600)
+
+        new = metrics.endpoints[("subreddit_new", "GET")]
+        assert new.requests == 2 and new.statuses == {200: 2}
+        assert new.latency.cumulative() == [(0.1, 1), (1, 2), (float("inf"), 2)]
+        assert metrics.snapshot()["endpoints"]["POST other"]["statuses"] == {"error": 1}
+
+        text = metrics.prometheus()
+        assert 'apraw_requests_total{endpoint="subreddit_new",method="GET",status="200"} 2' in text
+        assert 'apraw_request_duration_seconds_bucket{endpoint="subreddit_new",method="GET",le="+Inf"} 2' in text
+        assert 'apraw_response_size_bytes_sum{endpoint="subreddit_new",method="GET"} 550' in text
+        assert 'apraw_ratelimit_wait_seconds_total{endpoint="subreddit_new",method="GET"} 0.25' in text
+        assert 'apraw_ratelimit_remaining{user="aPRAWBot"} 598' in text
+
+    @pytest.mark.asyncio
+    async def test_request_handler_records_metrics(self, fake_user):
+        statuses = [503, 200]
+
+        def handler(method, url, headers, data):
+            headers = {"x-ratelimit-remaining": "599", "x-ratelimit-used": "1", "x-ratelimit-reset": "600"}
+            return TransportResponse(statuses.pop(0), headers, b'{"kind": "t5"}')
+
+        handler = RequestHandler(fake_user(), transport=LocalTransport(handler),
+                                 retry_policy=RetryPolicy(backoff=0.001))
+        await handler.get("/r/aPRAWTest/about")
+
+        about = handler.metrics.snapshot()["endpoints"]["GET subreddit_about"]
+        assert about["statuses"] == {503: 1, 200: 1}
+        assert about["retries"] == 1 and about["bytes"] == 28
+        assert [s.remaining for s in handler.metrics.budget] == [599, 599]
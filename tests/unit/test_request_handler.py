@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from apraw import RequestHandler, RetryError
+from apraw.transport import TransportResponse
+from apraw.utils import Priority, priority
+
+
+class TokenRequests:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self, user):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise Exception("Invalid user data.")
+        user.access_data = {"token_type": "bearer", "access_token": f"token{self.calls}"}
+        user.token_expires = datetime.now() + timedelta(hours=1)
+
+
+class TestRequestHandler:
+    @pytest.mark.asyncio
+    async def test_request_handler_refreshes_expired_token_once(self, fake_user, fake_transport):
+        user = fake_user()
+        user.token_expires = datetime.now() - timedelta(seconds=1)
+        handler = RequestHandler(user, transport=fake_transport())
+        handler._request_token = TokenRequests()
+
+        headers = await asyncio.gather(*(handler.get_request_headers() for _ in range(10)))
+
+        assert handler._request_token.calls == 1
+        assert all(h["Authorization"] == "bearer token1" for h in headers)
+        assert not handler._token_requests
+
+    @pytest.mark.asyncio
+    async def test_request_handler_refreshes_token_in_background(self, fake_user, fake_transport):
+        user = fake_user()
+        user.token_expires = datetime.now() + timedelta(seconds=30)
+        handler = RequestHandler(user, token_refresh_margin=60, transport=fake_transport())
+        handler._request_token = TokenRequests()
+
+        headers = await asyncio.wait_for(handler.get_request_headers(), 0.005)
+        assert headers["Authorization"] == "bearer token"
+        assert handler._token_requests
+
+        await asyncio.sleep(0.02)
+        assert handler._request_token.calls == 1
+        assert (await handler.get_request_headers())["Authorization"] == "bearer token1"
+
+    @pytest.mark.asyncio
+    async def test_request_handler_failed_token_refresh(self, fake_user, fake_transport):
+        user = fake_user()
+        user.token_expires = datetime.now() - timedelta(seconds=1)
+        handler = RequestHandler(user, transport=fake_transport())
+        handler._request_token = TokenRequests(fail=True)
+
+        results = await asyncio.gather(*(handler.get_request_headers() for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(r, Exception) for r in results)
+        assert handler._request_token.calls == 1
+        assert not handler._token_requests
+
+        handler._request_token.fail = False
+        assert (await handler.get_request_headers())["Authorization"] == "bearer token2"
+        assert handler._request_token.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_request_handler_coalesces_gets(self, fake_user, fake_transport):
+        transport = fake_transport()
+        handler = RequestHandler(fake_user(), transport=transport)
+
+        results = await asyncio.gather(*(handler.get("/user/spez/about") for _ in range(10)),
+                                       handler.get("/r/aPRAWTest/about"))
+
+        assert len(transport.urls) == 2
+        assert all(r is results[0] for r in results[:10])
+        assert not handler._in_flight
+
+        await handler.get("/user/spez/about")
+        assert len(transport.urls) == 3
+
+    @pytest.mark.asyncio
+    async def test_request_handler_coalescing_disabled(self, fake_user, fake_transport):
+        transport = fake_transport()
+        handler = RequestHandler(fake_user(), coalesce_requests=False, transport=transport)
+
+        await asyncio.gather(*(handler.get("/user/spez/about") for _ in range(3)))
+        assert len(transport.urls) == 3
+
+    @pytest.mark.asyncio
+    async def test_request_handler_offloads_large_bodies(self, fake_user, fake_transport):
+        threads = []
+
+        def loads(body):
+            threads.append(threading.current_thread())
+            return json.loads(body)
+
+        with ThreadPoolExecutor(1) as executor:
+            handler = RequestHandler(fake_user(), transport=fake_transport(), json_decoder=loads,
+                                     decode_executor=executor, decode_threshold=80)
+
+            assert await handler.get("/r/a") == {"url": handler._url("/r/a")}
+            assert await handler.get("/r/aPRAWTest/about/moderators")
+
+        assert threads[0] is threading.current_thread()
+        assert threads[1] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_request_handler_routes_public_reads_to_pool(self, fake_user, fake_transport):
+        transport = fake_transport()
+        handler = RequestHandler(fake_user("main", burst=2), transport=transport, pool=[fake_user("pooled")])
+
+        await handler.get("/r/aPRAWTest/new")
+        await handler.get("/message/inbox")
+        await handler.post("/api/remove", data={"id": "t3_abc"})
+        await handler.get("/user/spez/submitted")
+        await handler.get("/r/aPRAWTest/about")
+
+        assert transport.tokens == ["bearer pooled", "bearer main", "bearer main", "bearer pooled", "bearer main"]
+
+    @pytest.mark.asyncio
+    async def test_request_handler_pool_falls_back_to_main_user(self, fake_user, fake_transport):
+        class PrivateTransport(fake_transport):
+            async def request(self, method, url, headers=None, data=None, auth=None):
+                resp = await super().request(method, url, headers, data, auth)
+                return TransportResponse(403, {}, b"{}") if headers["Authorization"] == "bearer pooled" else resp
+
+        transport = PrivateTransport()
+        handler = RequestHandler(fake_user("main", burst=1), transport=transport, pool=[fake_user("pooled")])
+
+        assert await handler.get("/r/private/new") == {"url": handler._url("/r/private/new")}
+        assert transport.tokens == ["bearer pooled", "bearer main"]
+        assert handler.metrics.endpoint(transport.urls[0], "GET").retries == 0
+
+    @pytest.mark.asyncio
+    async def test_request_handler_post_server_error(self, fake_user, fake_transport):
+        class BadGatewayTransport(fake_transport):
+            async def request(self, method, url, headers=None, data=None, auth=None):
+                await super().request(method, url, headers, data, auth)
+                return TransportResponse(502, {}, b"<html>502 Bad Gateway</html>")
+
+        transport = BadGatewayTransport()
+        handler = RequestHandler(fake_user(), transport=transport)
+
+        with pytest.raises(RetryError) as e:
+            await handler.post("/api/remove", data={"id": "t3_abc"})
+        assert e.value.response.status == 502
+        assert len(transport.urls) == 1
+
+    def test_request_handler_priorities(self):
+        remove = RequestHandler._url("/api/remove")
+
+        assert RequestHandler.select_priority("POST", remove) == Priority.HIGH
+        assert RequestHandler.select_priority("GET", RequestHandler._url("/r/aPRAWTest/new")) == Priority.NORMAL
+        with priority(Priority.LOW):
+            assert RequestHandler.select_priority("GET", RequestHandler._url("/r/aPRAWTest/new")) == Priority.LOW
+            assert RequestHandler.select_priority("POST", remove) == Priority.HIGH
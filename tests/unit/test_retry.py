@@ -0,0 +1,74 @@
+import aiohttp
+import pytest
+
+from apraw.retry import RetryError, RetryPolicy
+from apraw.transport import TransportResponse
+
+
+class Script:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def response(status, **headers):
+    return TransportResponse(status, headers, b"{}")
+
+
+class TestRetryPolicy:
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self):
+        policy = RetryPolicy(backoff=0.001)
+        send = Script(response(502), aiohttp.ServerDisconnectedError(), response(200))
+
+        resp = await policy.execute("GET", "/r/aPRAWTest/new", send)
+
+        assert resp.status == 200 and send.calls == 3
+        assert policy.retries == 2 and policy.recovered == 1
+        assert policy.reasons == {502: 1, "ServerDisconnectedError": 1}
+
+    @pytest.mark.asyncio
+    async def test_exhausted(self):
+        policy = RetryPolicy(max_attempts=3, backoff=0.001)
+        send = Script(response(503))
+
+        with pytest.raises(RetryError) as e:
+            await policy.execute("GET", "/r/aPRAWTest/new", send)
+
+        assert e.value.attempts == 3 and e.value.response.status == 503
+        assert send.calls == 3 and policy.exhausted == 1
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_repeated(self):
+        policy = RetryPolicy(backoff=0.001)
+
+        send = Script(response(502), response(200))
+        with pytest.raises(RetryError) as e:
+            await policy.execute("POST", "/api/remove", send)
+        assert e.value.response.status == 502 and send.calls == 1
+
+        with pytest.raises(RetryError):
+            await policy.execute("POST", "/api/remove", Script(aiohttp.ServerDisconnectedError()))
+
+        send = Script(response(429, **{"retry-after": "0.01"}), response(200))
+        assert (await policy.execute("POST", "/api/remove", send)).status == 200
+        assert policy.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+
+        assert policy.retry_after(response(429, **{"x-ratelimit-reset": "3"})) == 3
+        assert policy.retry_after(response(503, **{"x-ratelimit-reset": "3"})) is None
+        assert policy.retry_after(response(503, **{"Retry-After": "5"})) == 5
+
+        with pytest.raises(RetryError):
+            await policy.execute("GET", "/", Script(response(429, **{"retry-after": "60"})))
+        assert policy.retries == 0
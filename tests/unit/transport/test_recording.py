@@ -0,0 +1,56 @@
+import pytest
+
+import apraw
+from apraw.models import ListingGenerator
+from apraw.transport import RecordingTransport, ReplayTransport
+
+
+def replay_reddit(transport):
+    return apraw.Reddit(username="user", password="password", client_id="id", client_secret="secret",
+                        transport=transport)
+
+
+class TestReplayTransport:
+    @pytest.mark.asyncio
+    async def test_replay_transport_from_dumps(self, dumps_dir):
+        transport = ReplayTransport.from_dumps({"/message/inbox": "inbox.json"}, dumps_dir, ratelimit=10)
+        reddit = replay_reddit(transport)
+
+        items = [i async for i in ListingGenerator(reddit, "/message/inbox", limit=25)]
+
+        assert len(items) == 25
+        assert transport.requests[0][0] == "POST"
+        assert all(url.startswith("https://oauth.reddit.com/message/inbox") for _, url in transport.requests[1:])
+        assert reddit.user.ratelimit_used == len(transport.requests) - 1
+        assert reddit.user.ratelimit_remaining == 10 - reddit.user.ratelimit_used
+
+    @pytest.mark.asyncio
+    async def test_replay_transport_not_found(self):
+        transport = ReplayTransport()
+        reddit = replay_reddit(transport)
+
+        assert await reddit.get("/r/aPRAWTest/about") == {"message": "Not Found", "error": 404}
+
+        transport.strict = True
+        with pytest.raises(LookupError):
+            await reddit.get("/r/aPRAWTest/about")
+
+    @pytest.mark.asyncio
+    async def test_recording_transport_round_trip(self, tmp_path, dump):
+        subreddit = {"kind": "t5", "data": dump("subreddit")}
+
+        source = ReplayTransport()
+        source.add("GET", "/r/aPRAWTest/about", subreddit)
+        cassette = str(tmp_path / "cassette.json")
+
+        recording = RecordingTransport(source, cassette)
+        reddit = replay_reddit(recording)
+        await reddit.subreddit("aPRAWTest")
+        await reddit.close()
+
+        assert len(recording.interactions) == 1
+        assert "access_token" not in open(cassette).read()
+
+        replay = ReplayTransport.from_cassette(cassette, strict=True)
+        sub = await replay_reddit(replay).subreddit("aPRAWTest")
+        assert sub.display_name == subreddit["data"]["display_name"]
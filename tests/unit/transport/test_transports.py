@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+import apraw
+from apraw.transport import AiohttpTransport, HttpxTransport, LocalTransport, TransportResponse
+
+
+def local_reddit(transport):
+    return apraw.Reddit(username="user", password="password", client_id="id", client_secret="secret",
+                        transport=transport)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def about(request):
+        await asyncio.sleep(0.01)
+        return web.json_response({"kind": "t5", "data": {"display_name": request.match_info["sub"]}},
+                                 headers={"x-ratelimit-remaining": "599.0", "x-ratelimit-used": "1"})
+
+    async def form(request):
+        return web.json_response(dict(await request.post()))
+
+    app = web.Application()
+    app.router.add_get("/r/{sub}/about", about)
+    app.router.add_post("/form", form)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    yield "http://127.0.0.1:{}".format(site._server.sockets[0].getsockname()[1])
+
+    await runner.cleanup()
+
+
+class TestTransports:
+    @pytest.mark.asyncio
+    async def test_local_transport(self):
+        requests = []
+
+        async def handler(method, url, headers, data):
+            requests.append((method, url, headers["Authorization"]))
+            if "missing" in url:
+                return 404, {"error": 404}
+            return {"kind": "t5", "data": {"display_name": "aPRAWTest", "id": "2p5ca2"}}
+
+        reddit = local_reddit(LocalTransport(handler))
+        sub = await reddit.subreddit("aPRAWTest")
+
+        assert sub.display_name == "aPRAWTest"
+        assert requests == [("GET", "https://oauth.reddit.com/r/aPRAWTest/about?raw_json=1&api_type=json",
+                             "bearer local")]
+        assert await reddit.get("/r/missing/about") == {"error": 404}
+
+    @pytest.mark.asyncio
+    async def test_local_transport_response(self):
+        transport = LocalTransport(lambda method, url, headers, data: TransportResponse(204, {}, b""))
+        assert (await transport.request("DELETE", "https://oauth.reddit.com/api/del")).json() is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("factory", [lambda user: AiohttpTransport(user),
+                                         lambda user: HttpxTransport(http2=False, max_connections=2)])
+    async def test_network_transports(self, server, factory):
+        reddit = local_reddit(LocalTransport(lambda *args: None))
+        transport = factory(reddit.user)
+
+        responses = await asyncio.gather(*(transport.request("GET", f"{server}/r/sub{i}/about") for i in range(10)))
+        assert [r.json()["data"]["display_name"] for r in responses] == [f"sub{i}" for i in range(10)]
+        assert responses[0].headers["X-Ratelimit-Remaining"] == "599.0"
+
+        resp = await transport.request("POST", f"{server}/form", data={"text": "hello"})
+        assert json.loads(resp.body) == {"text": "hello"}
+
+        await transport.close()
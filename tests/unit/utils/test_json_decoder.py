@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from apraw.transport import TransportResponse
+from apraw.utils import DECODERS, get_decoder
+
+
+class TestJSONDecoder:
+
+    def test_default_prefers_fastest(self):
+        assert get_decoder() is next(iter(DECODERS.values()))
+        assert get_decoder("json") is json.loads
+
+    def test_custom_and_unknown(self):
+        def loads(body):
+            return body
+
+        assert get_decoder(loads) is loads
+        with pytest.raises(ValueError):
+            get_decoder("simplejson")
+
+    @pytest.mark.parametrize("name", list(DECODERS))
+    def test_decoders_agree_on_dumps(self, name, dump):
+        body = json.dumps(dump("submission_full"), ensure_ascii=False).encode()
+
+        resp = TransportResponse(200, body=body)
+        assert resp.json(get_decoder(name)) == json.loads(body)
+        assert TransportResponse(204).json(get_decoder(name)) is None
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from apraw.utils import Priority, RateLimiter, current_priority, priority
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_burst(self):
+        limiter = RateLimiter(burst=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.1
+        assert limiter.tokens < 1
+
+    @pytest.mark.asyncio
+    async def test_spread_over_window(self):
+        limiter = RateLimiter(burst=1)
+        limiter.update(remaining=20, used=0, reset=1)
+        await limiter.acquire()
+
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+
+        # 19 remaining requests over ~1 second leave ~0.05 seconds between requests
+        assert 0.15 < time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_reset(self):
+        limiter = RateLimiter(burst=5, capacity=5, window=0.3)
+        limiter.update(remaining=0, used=5, reset=0.3)
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_fifo(self):
+        limiter = RateLimiter(burst=1)
+        limiter.update(remaining=50, used=0, reset=1)
+        order = []
+
+        async def worker(i):
+            await limiter.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        assert order == list(range(5))
+
+    def test_fill_level(self):
+        limiter = RateLimiter(burst=4)
+        assert limiter.fill_level == 1
+
+        limiter.update(remaining=2, used=598)
+        assert limiter.fill_level == 0.5
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes(self):
+        limiter = RateLimiter(burst=10, reservations={Priority.HIGH: 0.2})
+        limiter.update(remaining=100, used=0, reset=10)
+        order = []
+
+        async def worker(name, level):
+            await limiter.acquire(level)
+            order.append(name)
+
+        # low priority requests may only use the unreserved part of the bucket
+        for i in range(8):
+            await limiter.acquire(Priority.LOW)
+        backfill = asyncio.ensure_future(worker("low", Priority.LOW))
+        await asyncio.sleep(0.01)
+        assert not order
+
+        await asyncio.gather(worker("high", Priority.HIGH), worker("high", Priority.HIGH))
+        assert order == ["high", "high"]
+
+        backfill.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await backfill
+        assert not limiter._waiters
+
+    def test_priority_context(self):
+        assert current_priority() == Priority.NORMAL
+        with priority(Priority.LOW):
+            assert current_priority() == Priority.LOW
+        assert current_priority() == Priority.NORMAL